@@ -0,0 +1,305 @@
+"""
+Benchmark suite for the typing engine.
+Run from the repository root:
+
+    python -m benchmarks.bench_engine [--quick] [--output results.json]
+
+Keys only ever go to a NullSink or RecordingSink, so the suite runs
+headless and without pynput.
+
+Measures:
+- planning throughput (chars/s) for a few planner configurations,
+- typo placement throughput (the place_typos stage),
+- per-keystroke playback overhead, using a NullSink and a VirtualClock,
+  with and without telemetry recording,
+- hotkey listener callback cost per key event, for ordinary typing
+  and for a bound chord,
+- scheduling accuracy with real sleeps (achieved vs requested WPM and
+  interval jitter percentiles), with and without precise timing,
+- peak memory while streaming 1 MB, 10 MB and 100 MB documents,
+  each measured in a fresh subprocess.
+
+Results are written as JSON so runs can be compared.
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src import typing_engine
+from src.scheduler import VirtualClock
+from src.telemetry import TelemetryRecorder
+from src.hotkeys import HotkeyRegistry, DEFAULT_BINDINGS
+from src.sinks import NullSink, RecordingSink
+from src.timing_model import TimingModel
+from src.pipeline import (
+    PipelineContext, TYPO, normalize, place_typos, run_pipeline, tokenize,
+)
+from src.typing_plan import compile_plan, cps_to_wpm, iter_plan_chunks
+
+# The repository root, where the memory subprocesses run from
+ROOT = Path(__file__).resolve().parent.parent
+
+WORDS = (
+    "the of and to in is you that it he was for on are as with his they "
+    "at be this have from or one had by word but not what all were we when "
+    "your can said there use an each which she do how their if will up "
+    "other about out many then them these so some her would make like him"
+).split()
+
+def make_text(size, seed=0):
+    """Deterministic pseudo-English text of roughly size characters."""
+    rng = random.Random(seed)
+    parts = []
+    total = 0
+    while total < size:
+        line = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(6, 14)))
+        line = line.capitalize() + '.\n'
+        parts.append(line)
+        total += len(line)
+    return ''.join(parts)[:size]
+
+def percentile(values, q):
+    """q-th percentile (0-100) of a list of numbers, nearest rank."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def bench_planning(size):
+    text = make_text(size)
+    configs = {
+        'default': {},
+        'no_humanization': {'thinking_enabled': False, 'typos_enabled': False},
+        'timing_model': {'timing': TimingModel()},
+    }
+    results = {}
+    for name, config in configs.items():
+        started = time.perf_counter()
+        plan = compile_plan(text, seed=1, **config)
+        elapsed = time.perf_counter() - started
+        results[name] = {
+            'chars': len(text),
+            'events': len(plan),
+            'seconds': elapsed,
+            'chars_per_second': len(text) / elapsed,
+        }
+    return results
+
+def bench_typos(size, typo_chance=0.3):
+    """
+    Typo placement as the planner does it (TypoEngine.decide per chosen
+    word): only the place_typos stage is timed, over ops tokenized
+    beforehand.
+    """
+    text = make_text(size)
+    ctx = PipelineContext(random.Random(1), typo_chance=typo_chance)
+    ops = list(run_pipeline([text], [normalize, tokenize], ctx))
+
+    started = time.perf_counter()
+    typos = sum(1 for op, _ in place_typos(iter(ops), ctx) if op == TYPO)
+    placing = time.perf_counter() - started
+    return {
+        'chars': len(text),
+        'typo_chance': typo_chance,
+        'typos': typos,
+        'seconds': placing,
+        'chars_per_second': len(text) / placing,
+    }
+
+def bench_overhead(size, telemetry=False):
+    text = make_text(size)
+    plan = compile_plan(text, seed=1)
+    sink = NullSink()
+    clock = VirtualClock()
+    recorder = TelemetryRecorder() if telemetry else None
+    started = time.perf_counter()
+    typing_engine.play_plan(plan, sink=sink, clock=clock, telemetry=recorder)
+    elapsed = time.perf_counter() - started
+    return {
+        'keys': sink.count,
+        'telemetry': telemetry,
+        'seconds': elapsed,
+        'usec_per_key': elapsed / sink.count * 1e6,
+        'virtual_seconds': clock.time(),
+    }
+
+class BenchKey:
+    """
+    Stand-in for a pynput Key / KeyCode, with the attributes key_name
+    reads, so the hotkey benchmark runs without pynput (or a display).
+    """
+    __slots__ = ('name', 'char', 'vk')
+
+    def __init__(self, name=None, char=None):
+        self.name = name
+        self.char = char
+        self.vk = None
+
+def bench_hotkeys(events):
+    """Cost of on_press + on_release per key, as pynput would call them."""
+    fired = []
+    registry = HotkeyRegistry(dict(DEFAULT_BINDINGS, **{'ctrl+1': 'start'}),
+                              {'start': lambda: fired.append(1), 'pause': lambda: None,
+                               'stop': lambda: None},
+                              repeat_interval=0.0)
+    typing = [BenchKey(char=c) for c in make_text(1000)] + [BenchKey('space'), BenchKey('shift')]
+    chord = [BenchKey('ctrl_l'), BenchKey(char='1')]
+    results = {}
+    for name, keys in (('typing', typing), ('chord', chord)):
+        presses = [keys[i % len(keys)] for i in range(events)]
+        started = time.perf_counter()
+        for key in presses:
+            registry.on_press(key)
+            registry.on_release(key)
+        elapsed = time.perf_counter() - started
+        results[name] = {'events': events, 'usec_per_event': elapsed / events * 1e6}
+    return results
+
+def bench_accuracy(wpm, seconds, precise_timing):
+    """Real sleeps into a RecordingSink: no keys reach the OS."""
+    cps = wpm * 5 / 60
+    keys = max(20, int(cps * seconds))
+    text = make_text(keys * 2)[:keys]
+    plan = compile_plan(text, seed=1, min_wpm=wpm, max_wpm=wpm,
+                        thinking_enabled=False, typos_enabled=False)
+    sink = RecordingSink()
+    typing_engine.control.reset()
+    typing_engine.play_plan(plan, precise_timing=precise_timing, sink=sink)
+
+    times = sink.times
+    span = times[-1] - times[0]
+    planned = sum(plan.delays[1:len(times)])
+    errors_ms = [
+        ((times[i] - times[i - 1]) - plan.delays[i]) * 1000
+        for i in range(1, len(times))
+    ]
+    return {
+        'requested_wpm': wpm,
+        'precise_timing': precise_timing,
+        'keys': len(times),
+        'planned_wpm': cps_to_wpm((len(times) - 1) / planned),
+        'achieved_wpm': cps_to_wpm((len(times) - 1) / span),
+        'jitter_ms_p50': percentile(errors_ms, 50),
+        'jitter_ms_p95': percentile(errors_ms, 95),
+        'jitter_ms_p99': percentile(errors_ms, 99),
+    }
+
+def _memory_child(megabytes):
+    """Runs in a subprocess: stream a temp file through the planner and playback."""
+    import resource
+    import pathlib
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        path = pathlib.Path(f.name)
+        size = int(megabytes * 1024 * 1024)
+        block = make_text(min(size, 1024 * 1024))
+        if block:
+            for _ in range(size // len(block)):
+                f.write(block)
+            f.write(block[:size % len(block)])
+    try:
+        baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        sink = NullSink()
+        clock = VirtualClock()
+        plans = iter_plan_chunks(path, seed=1)
+        for plan in plans:
+            typing_engine.play_plan(plan, sink=sink, clock=clock)
+        elapsed = time.perf_counter() - started
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    finally:
+        path.unlink()
+
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    print(json.dumps({
+        'input_mb': megabytes,
+        'keys': sink.count,
+        'seconds': elapsed,
+        'baseline_rss_mb': baseline * scale / 1e6,
+        'peak_rss_mb': peak * scale / 1e6,
+        'growth_mb': (peak - baseline) * scale / 1e6,
+    }))
+
+def bench_memory(megabytes):
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_engine', '--memory-child', str(megabytes)],
+        check=True, capture_output=True, text=True, cwd=ROOT,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--quick', action='store_true',
+                        help="smaller inputs and a single 1 MB memory run")
+    parser.add_argument('--output', default='bench_results.json',
+                        help="where to write the JSON results")
+    parser.add_argument('--size', type=int,
+                        help="characters of text for the throughput benchmarks "
+                             "(default 500000, 50000 with --quick)")
+    parser.add_argument('--accuracy-seconds', type=float,
+                        help="seconds of real typing per accuracy run (default 3, 1 with --quick)")
+    parser.add_argument('--accuracy-wpm', default='120,300,600',
+                        help="comma-separated speeds for the accuracy benchmark")
+    parser.add_argument('--memory-sizes',
+                        help="comma-separated input sizes in MB for the memory benchmark "
+                             "(default 1,10,100, 1 with --quick)")
+    parser.add_argument('--memory-child', type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.memory_child is not None:
+        _memory_child(args.memory_child)
+        return
+
+    size = args.size or (50_000 if args.quick else 500_000)
+    memory_sizes = args.memory_sizes or ('1' if args.quick else '1,10,100')
+    memory_sizes = [float(s) for s in memory_sizes.split(',')]
+    accuracy_seconds = args.accuracy_seconds or (1.0 if args.quick else 3.0)
+    accuracy_wpm = [float(s) for s in args.accuracy_wpm.split(',')]
+
+    results = {
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'planning': bench_planning(size),
+        'typos': bench_typos(size),
+        'overhead': bench_overhead(size),
+        'overhead_telemetry': bench_overhead(size, telemetry=True),
+        'hotkeys': bench_hotkeys(size),
+        'accuracy': [
+            bench_accuracy(wpm, accuracy_seconds, precise)
+            for wpm in accuracy_wpm
+            for precise in (False, True)
+        ],
+        'memory': [bench_memory(mb) for mb in memory_sizes],
+    }
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    for name, r in results['planning'].items():
+        print(f"planning {name:16} {r['chars_per_second']:>12,.0f} chars/s")
+    print(f"typo placement          {results['typos']['chars_per_second']:>12,.0f} chars/s")
+    print(f"playback overhead       {results['overhead']['usec_per_key']:>12.2f} us/key")
+    print(f"  with telemetry        {results['overhead_telemetry']['usec_per_key']:>12.2f} us/key")
+    for name, r in results['hotkeys'].items():
+        print(f"hotkey callbacks {name:7} {r['usec_per_event']:>12.2f} us/event")
+    for r in results['accuracy']:
+        mode = 'precise' if r['precise_timing'] else 'sleep'
+        print(f"accuracy {r['requested_wpm']:>4g} WPM {mode:8} achieved {r['achieved_wpm']:7.1f} WPM, "
+              f"jitter p50/p95/p99 {r['jitter_ms_p50']:.2f}/{r['jitter_ms_p95']:.2f}/{r['jitter_ms_p99']:.2f} ms")
+    for r in results['memory']:
+        print(f"memory {r['input_mb']:>4g} MB input: peak RSS {r['peak_rss_mb']:.1f} MB "
+              f"(+{r['growth_mb']:.1f} MB) in {r['seconds']:.1f}s")
+    print(f"results written to {args.output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,4 @@
+"""
+Root conftest: its presence puts the repository root on sys.path, so
+plain `pytest` finds the src and benchmarks packages like `python -m pytest`.
+"""
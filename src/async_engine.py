@@ -0,0 +1,59 @@
+"""
+Asyncio-native variant of the typing engine.
+type_text_async plays the same keystroke plans as typing_engine.type_text,
+but awaits between keystrokes instead of sleeping a thread, so many jobs
+can share one event loop. Cancelling the task stops typing at the next await.
+"""
+
+import asyncio
+
+from .typing_plan import iter_plan_chunks
+
+async def type_text_async(text,
+                          delay=0.25,
+                          seed=None,
+                          sink=None,
+                          progress_every=50,
+                          **config):
+    """
+    Type text on the running event loop and yield progress events.
+
+    Accepts the same humanization keywords as typing_engine.type_text
+    (min_wpm, max_wpm, typos_enabled, ...). Waits are scheduled against
+    absolute loop-time deadlines, so the loop's own latency does not
+    accumulate. Every progress_every keys, and once at the end, a dict
+    {'keys': ..., 'elapsed': ..., 'done': ...} is yielded.
+
+    Usage:
+        async for progress in type_text_async("hello", seed=1):
+            print(progress['keys'])
+
+    Cancelling the consuming task raises CancelledError inside the
+    pending await; buffered keys are flushed and nothing else is sent.
+    """
+    if sink is None:
+        from .typing_engine import get_default_sink
+        sink = get_default_sink(config.get('layout'))
+    send = sink.send
+
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(delay)
+
+    started = deadline = loop.time()
+    keys = 0
+    try:
+        for plan in iter_plan_chunks(text, seed=seed, chunk_events=1024, **config):
+            for code, wait, kind in plan:
+                if wait:
+                    sink.flush()
+                    deadline += wait
+                    await asyncio.sleep(max(0.0, deadline - loop.time()))
+                send(code)
+                keys += 1
+                if keys % progress_every == 0:
+                    yield {'keys': keys, 'elapsed': loop.time() - started, 'done': False}
+            # Let other tasks run between plan chunks even when waits are zero
+            await asyncio.sleep(0)
+    finally:
+        sink.flush()
+    yield {'keys': keys, 'elapsed': loop.time() - started, 'done': True}
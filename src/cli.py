@@ -0,0 +1,261 @@
+"""
+Headless command-line entry point, for scripts and batch jobs.
+Never imports tkinter (or the GUI), so it starts quickly and runs
+where there is no window to show:
+
+    python -m src.cli "Hello world"
+    python -m src.cli -f notes.txt --min-wpm 60 --max-wpm 90 --seed 7
+    some_command | python -m src.cli --burst --sink xtest
+    python -m src.cli --manifest jobs.json --stats stats.jsonl
+
+Every type_text setting has an option (stages, a Python-level hook,
+excepted). A manifest is a JSON list of jobs, an object with "defaults"
+and "jobs", or a JSON Lines file with one job per line; each job is a
+dict of the same settings by their type_text names, plus "text" or
+"file". Jobs run one after another; a JSON stats record is written per
+job (seed, keys, or the error). With --stats, each job is also timed
+key by key (see telemetry.py) and the record gets the timing summary.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from . import typing_engine
+from .config import TypingConfig
+from .control import TypingCheckpoint
+from .sinks import SINKS, make_sink
+
+# timing_model.DISTRIBUTIONS; timing_model loads NumPy, so it is only
+# imported for jobs that use a TimingModel
+DISTRIBUTIONS = ('uniform', 'lognormal')
+
+# Settings the CLI passes through to type_text unchanged
+SETTINGS = ('min_wpm', 'max_wpm', 'delay', 'thinking_enabled', 'min_pause', 'max_pause',
+            'pause_frequency', 'typos_enabled', 'typo_chance', 'random_letters', 'layout',
+            'bigram_timing', 'typo_kinds', 'editor', 'seed', 'precise_timing', 'burst',
+            'chunk_size', 'chunk_gap')
+
+def parse_kind_weights(value):
+    """Parse 'substitution=2,omission=0.5' into a typo_kinds dict."""
+    weights = {}
+    for item in value.split(','):
+        name, sep, weight = item.partition('=')
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected kind=weight, got {item!r}")
+        try:
+            weights[name.strip()] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight in {item!r}")
+    return weights
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m src.cli',
+        description="Type text into the focused window without the GUI.")
+
+    source = parser.add_argument_group("input (default: stdin)")
+    source.add_argument('text', nargs='?', help="text to type; '-' reads stdin")
+    source.add_argument('-f', '--file', type=Path, help="type the contents of a file (streamed)")
+    source.add_argument('--manifest', type=Path,
+                        help="run the jobs of a JSON / JSON Lines manifest in sequence")
+
+    speed = parser.add_argument_group("speed")
+    speed.add_argument('--min-wpm', type=float, default=40.0)
+    speed.add_argument('--max-wpm', type=float, default=80.0)
+    speed.add_argument('--delay', type=float, default=0.25, help="seconds to wait before typing")
+    speed.add_argument('--timing', choices=DISTRIBUTIONS,
+                       help="use a TimingModel with this delay distribution")
+    speed.add_argument('--sigma', type=float, default=0.35, help="lognormal timing spread")
+    speed.add_argument('--bigram-timing', action='store_true',
+                       help="scale delays by the distance between keys")
+    speed.add_argument('--precise-timing', action='store_true',
+                       help="drift-free scheduling, for high WPM")
+
+    human = parser.add_argument_group("humanization")
+    human.add_argument('--no-thinking', dest='thinking_enabled', action='store_false',
+                       help="disable thinking pauses")
+    human.add_argument('--min-pause', type=float, default=0.5)
+    human.add_argument('--max-pause', type=float, default=2.0)
+    human.add_argument('--pause-frequency', type=int, default=50,
+                       help="a thinking pause about every N characters")
+    human.add_argument('--no-typos', dest='typos_enabled', action='store_false')
+    human.add_argument('--typo-chance', type=float, default=0.3, help="0 to 1")
+    human.add_argument('--typo-kinds', type=parse_kind_weights,
+                       help="typo kind weights, e.g. substitution=2,omission=1")
+    human.add_argument('--random-letters', action='store_true')
+    human.add_argument('--layout', default='qwerty', help="keyboard layout of the OS")
+
+    mode = parser.add_argument_group("mode")
+    mode.add_argument('--editor', help="editor profile of the target (see editor.py)")
+    mode.add_argument('--retype-from', type=Path,
+                      help="file with the text already in the target; only the changes are typed")
+    mode.add_argument('--burst', action='store_true', help="type as fast as possible")
+    mode.add_argument('--chunk-size', type=int, default=256)
+    mode.add_argument('--chunk-gap', type=float, default=0.0)
+    mode.add_argument('--seed', type=int, help="random seed; the same seed repeats a run")
+    mode.add_argument('--resume-events', type=int,
+                      help="with --seed, continue a stopped job after this many keys")
+    mode.add_argument('--sink', choices=sorted(SINKS), default='pynput',
+                      help="where keys go ('null' and 'recording' send nothing)")
+    mode.add_argument('--simulate', action='store_true',
+                      help="only simulate on a virtual clock and report the duration")
+
+    output = parser.add_argument_group("output")
+    output.add_argument('--stats', type=Path,
+                        help="time every key and write JSON Lines stats with the timing "
+                             "summary here instead of stdout")
+    output.add_argument('-q', '--quiet', action='store_true', help="no stats output")
+    output.add_argument('--fail-fast', action='store_true',
+                        help="stop a manifest at the first failed job")
+    return parser
+
+def job_from_args(args):
+    """The single job described by the command line."""
+    job = {name: getattr(args, name) for name in SETTINGS}
+    if args.timing:
+        job['timing'] = {'distribution': args.timing, 'sigma': args.sigma}
+    if args.retype_from:
+        job['retype_from'] = str(args.retype_from)
+    if args.resume_events is not None:
+        job['resume_events'] = args.resume_events
+    if args.file:
+        job['file'] = str(args.file)
+    elif args.text is not None and args.text != '-':
+        job['text'] = args.text
+    return job
+
+def read_manifest(path):
+    """The list of job dicts of a manifest, defaults applied."""
+    with open(path, encoding='utf-8') as f:
+        if path.suffix == '.jsonl':
+            return [json.loads(line) for line in f if line.strip()]
+        data = json.load(f)
+    if isinstance(data, list):
+        return data
+    defaults = data.get('defaults', {})
+    return [dict(defaults, **job) for job in data['jobs']]
+
+def resolve_job(job, base=Path('.')):
+    """
+    Turn a job dict into type_text keyword arguments. Relative paths are
+    taken from base (the manifest's directory). Without text or file,
+    the job types stdin.
+    """
+    config = dict(job)
+    config.pop('name', None)
+    # Check and convert the settings the GUI has too, the same way
+    known = {name: config[name] for name in TypingConfig.__slots__
+             if name in config and name != 'text'}
+    checked = TypingConfig(**known)
+    config.update((name, getattr(checked, name)) for name in known)
+    if 'file' in config:
+        config['text'] = base / config.pop('file')
+    elif 'text' not in config:
+        config['text'] = sys.stdin
+    timing = config.get('timing')
+    if isinstance(timing, dict):
+        from .timing_model import TimingModel
+        config['timing'] = TimingModel(
+            min_wpm=config.get('min_wpm', 40.0),
+            max_wpm=config.get('max_wpm', 80.0),
+            thinking_enabled=config.get('thinking_enabled', True),
+            min_pause=config.get('min_pause', 0.5),
+            max_pause=config.get('max_pause', 2.0),
+            pause_frequency=config.get('pause_frequency', 50),
+            **timing)
+    retype_from = config.get('retype_from')
+    if retype_from is not None:
+        config['retype_from'] = (base / retype_from).read_text(encoding='utf-8')
+    events = config.pop('resume_events', None)
+    if events is not None:
+        if config.get('seed') is None:
+            raise ValueError("resume_events needs the seed of the stopped job")
+        config['resume_from'] = TypingCheckpoint(config['seed'], events)
+    return config
+
+def run_job(config, sink=None, simulate=False, telemetry=False):
+    """
+    Run one job (type_text keyword arguments) and return its stats dict:
+    keys sent, or the burst / simulate results. resume_events is where
+    to continue from (with the same seed) if it was stopped. With
+    telemetry, every key is timed (a TelemetryRecorder grows with the
+    job) and the stats include its summary.
+    """
+    started = time.perf_counter()
+    if simulate:
+        result = typing_engine.simulate(**config)
+        result.pop('timeline', None)
+        return dict(result, seconds=time.perf_counter() - started)
+
+    config['sink'] = sink
+    recorder = None
+    if telemetry and not config.get('burst'):
+        from .telemetry import TelemetryRecorder
+        recorder = config['telemetry'] = TelemetryRecorder()
+    stats = typing_engine.type_text(**config) or {}
+    session = typing_engine.last_session
+    if not config.get('burst'):
+        if recorder is not None:
+            stats.update(recorder.summary())
+        if session is not None:
+            stats['seed'] = session.seed
+            stats['keys'] = stats['resume_events'] = session.events
+    stats['stopped'] = typing_engine.control.stopped
+    stats['seconds'] = time.perf_counter() - started
+    return stats
+
+def make_cli_sink(name, layout):
+    """A sink by name; the OS-facing ones type for the given keyboard layout."""
+    if name in ('pynput', 'xtest'):
+        return make_sink(name, layout=layout)
+    return make_sink(name)
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.manifest:
+        jobs = read_manifest(args.manifest)
+        base = args.manifest.parent
+    else:
+        jobs = [job_from_args(args)]
+        base = Path('.')
+
+    out = None
+    if not args.quiet:
+        out = open(args.stats, 'w', encoding='utf-8') if args.stats else sys.stdout
+    sink = None if args.simulate else make_cli_sink(args.sink, args.layout)
+    failed = 0
+    try:
+        for index, job in enumerate(jobs):
+            record = {'job': job.get('name', index)}
+            try:
+                config = resolve_job(job, base)
+                record['status'] = 'ok'
+                record.update(run_job(config, sink=sink, simulate=args.simulate,
+                                      telemetry=args.stats is not None))
+            except KeyboardInterrupt:
+                typing_engine.stop()
+                record['status'] = 'interrupted'
+                failed += 1
+                break
+            except Exception as e:
+                record['status'] = 'error'
+                record['error'] = f"{type(e).__name__}: {e}"
+                failed += 1
+            finally:
+                if out is not None:
+                    out.write(json.dumps(record) + '\n')
+                    out.flush()
+            if failed and args.fail_fast:
+                break
+    finally:
+        if sink is not None:
+            sink.flush()
+        if out is not None and out is not sys.stdout:
+            out.close()
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
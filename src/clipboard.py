@@ -0,0 +1,194 @@
+"""
+Clipboard change watcher.
+Replaces the old once-a-second pyperclip.paste() polling. The clipboard
+is only read when it may have changed, and on_change is only called
+when its content really did (compared by hash, not by full string):
+
+- X11: XFixes selection-owner notifications (python-xlib),
+- Wayland: `wl-paste --watch`,
+- Windows / macOS: the system's clipboard change counter, which is
+  cheap to read, instead of the content,
+- elsewhere: polling with adaptive backoff, quick after a change and
+  slowing down while nothing happens.
+
+on_change runs on the watcher thread; GUI code should hand the text
+over to the Tk main thread with root.after.
+"""
+
+import hashlib
+import os
+import select
+import shutil
+import subprocess
+import sys
+import threading
+
+def _digest(text):
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+def _default_paste():
+    import pyperclip
+    return pyperclip.paste()
+
+def _change_counter():
+    """A function returning the OS clipboard change count, or None if there is none."""
+    if sys.platform == 'win32':
+        import ctypes
+        return ctypes.windll.user32.GetClipboardSequenceNumber
+    if sys.platform == 'darwin':
+        try:
+            from AppKit import NSPasteboard
+        except ImportError:
+            return None
+        return NSPasteboard.generalPasteboard().changeCount
+    return None
+
+class ClipboardWatcher:
+    """
+    Calls on_change(text) from a background thread whenever the
+    clipboard holds new, non-empty text.
+
+    Set active to False to stop reading the clipboard (e.g. while the
+    'Use clipboard text' option is off); set_active(True) checks it again
+    right away. method tells which strategy is in use once started.
+    """
+
+    def __init__(self, on_change, paste=None, min_interval=0.25, max_interval=5.0, backoff=1.5):
+        self.on_change = on_change
+        self.paste = paste or _default_paste
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.active = True
+        self.method = None
+        self._digest = None
+        self._stopped = False
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+
+    def set_active(self, active):
+        self.active = active
+        if active:
+            self._wake.set()
+
+    def check(self):
+        """Read the clipboard and report it if it changed. Returns True if it did."""
+        if not self.active:
+            return False
+        try:
+            text = self.paste()
+        except Exception as e:
+            print(f"Error reading clipboard: {e}")
+            return False
+        if not text:
+            return False
+        digest = _digest(text)
+        if digest == self._digest:
+            return False
+        self._digest = digest
+        self.on_change(text)
+        return True
+
+    def _wait(self, timeout):
+        """Sleep until timeout or a wake-up; returns True if woken."""
+        woken = self._wake.wait(timeout)
+        self._wake.clear()
+        return woken
+
+    def _run(self):
+        self.check()
+        for watch in (self._watch_xfixes, self._watch_wayland, self._watch_counter):
+            try:
+                if watch():
+                    return
+            except Exception as e:
+                print(f"Clipboard notifications unavailable ({e}), polling instead")
+        self._watch_polling()
+
+    def _watch_xfixes(self):
+        if sys.platform in ('win32', 'darwin') or not os.environ.get('DISPLAY'):
+            return False
+        try:
+            from Xlib.display import Display
+            from Xlib.ext import xfixes
+        except ImportError:
+            return False
+        display = Display()
+        if not display.has_extension('XFIXES'):
+            display.close()
+            return False
+        display.xfixes_query_version()
+        display.xfixes_select_selection_input(
+            display.screen().root, display.get_atom('CLIPBOARD'),
+            xfixes.XFixesSetSelectionOwnerNotifyMask)
+        owner_changed = display.extension_event.SetSelectionOwnerNotify
+        self.method = 'xfixes'
+        try:
+            while not self._stopped:
+                changed = self._wake.is_set()
+                self._wake.clear()
+                if select.select([display], [], [], 0.5)[0] or display.pending_events():
+                    while display.pending_events():
+                        event = display.next_event()
+                        if (event.type, event.sub_code) == owner_changed:
+                            changed = True
+                if changed:
+                    self.check()
+        finally:
+            display.close()
+        return True
+
+    def _watch_wayland(self):
+        if not os.environ.get('WAYLAND_DISPLAY') or not shutil.which('wl-paste'):
+            return False
+        # wl-paste runs `echo` (printing a newline) on every clipboard change
+        proc = subprocess.Popen(['wl-paste', '--watch', 'echo'],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        self.method = 'wl-paste'
+        try:
+            while not self._stopped and proc.poll() is None:
+                changed = self._wake.is_set()
+                self._wake.clear()
+                if select.select([proc.stdout], [], [], 0.5)[0]:
+                    os.read(proc.stdout.fileno(), 4096)
+                    changed = True
+                if changed:
+                    self.check()
+        finally:
+            proc.terminate()
+        # wl-paste went away: fall back to another method unless stopping
+        return self._stopped
+
+    def _watch_counter(self):
+        counter = _change_counter()
+        if counter is None:
+            return False
+        self.method = 'counter'
+        last = counter()
+        while not self._stopped:
+            woken = self._wait(self.min_interval)
+            count = counter()
+            if count != last or woken:
+                last = count
+                self.check()
+        return True
+
+    def _watch_polling(self):
+        self.method = 'polling'
+        interval = self.min_interval
+        while not self._stopped:
+            if self._wait(interval):
+                interval = self.min_interval
+            if self.check():
+                interval = self.min_interval
+            else:
+                interval = min(self.max_interval, interval * self.backoff)
@@ -0,0 +1,153 @@
+"""
+Typing settings as an immutable, validated snapshot.
+The GUI rebuilds a TypingConfig on the Tk thread whenever a setting
+changes and swaps it in with a single assignment; the hotkey thread
+only reads that reference, so starting a session never touches Tk
+widgets, parses entries or reads the clipboard.
+
+Named profiles (every setting but the text) are kept in a small JSON
+file, loaded once at startup.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from .editor import PROFILES
+
+# Where named setting profiles are saved
+PROFILES_PATH = Path.home() / '.autotyper_profiles.json'
+
+DEFAULT_PROFILE = 'default'
+
+class TypingConfig:
+    """
+    The type_text settings of the GUI. Values are converted and checked
+    once, in the constructor (ValueError names the offending setting);
+    instances cannot be changed afterwards, use replace() instead.
+    """
+    __slots__ = ('text', 'min_wpm', 'max_wpm', 'delay', 'thinking_enabled',
+                 'min_pause', 'max_pause', 'pause_frequency', 'typos_enabled',
+                 'typo_chance', 'random_letters', 'precise_timing', 'burst',
+                 'chunk_size', 'chunk_gap', 'editor')
+
+    def __init__(self,
+                 text="",
+                 min_wpm=40.0,
+                 max_wpm=80.0,
+                 delay=0.25,
+                 thinking_enabled=True,
+                 min_pause=0.5,
+                 max_pause=2.0,
+                 pause_frequency=50,
+                 typos_enabled=True,
+                 typo_chance=0.3,
+                 random_letters=False,
+                 precise_timing=False,
+                 burst=False,
+                 chunk_size=256,
+                 chunk_gap=0.0,
+                 editor=None):
+        if not isinstance(text, (str, os.PathLike)):
+            raise ValueError("text must be a string or a file path")
+        min_wpm = _number('min_wpm', min_wpm, float, low=1)
+        max_wpm = _number('max_wpm', max_wpm, float, low=min_wpm)
+        min_pause = _number('min_pause', min_pause, float, low=0)
+        max_pause = _number('max_pause', max_pause, float, low=min_pause)
+        if editor is not None and editor not in PROFILES:
+            raise ValueError(f"Unknown editor profile: {editor!r}")
+        values = dict(
+            text=text,
+            min_wpm=min_wpm,
+            max_wpm=max_wpm,
+            delay=_number('delay', delay, float, low=0),
+            thinking_enabled=bool(thinking_enabled),
+            min_pause=min_pause,
+            max_pause=max_pause,
+            pause_frequency=_number('pause_frequency', pause_frequency, int, low=1),
+            typos_enabled=bool(typos_enabled),
+            typo_chance=_number('typo_chance', typo_chance, float, low=0, high=1),
+            random_letters=bool(random_letters),
+            precise_timing=bool(precise_timing),
+            burst=bool(burst),
+            chunk_size=_number('chunk_size', chunk_size, int, low=1),
+            chunk_gap=_number('chunk_gap', chunk_gap, float, low=0),
+            editor=editor,
+        )
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("TypingConfig is immutable; use replace()")
+
+    def __eq__(self, other):
+        if not isinstance(other, TypingConfig):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return f"TypingConfig(min_wpm={self.min_wpm}, max_wpm={self.max_wpm}, editor={self.editor!r})"
+
+    def replace(self, **changes):
+        """A copy with some settings changed (validated again)."""
+        values = self.as_dict()
+        values.update(changes)
+        return TypingConfig(**values)
+
+    def as_dict(self):
+        """The settings as type_text keyword arguments (a new dict)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def profile(self):
+        """The settings saved in a named profile: everything but the text."""
+        values = self.as_dict()
+        del values['text']
+        return values
+
+def _number(name, value, kind, low=None, high=None):
+    """Convert value (a number or an entry's string) and check its range."""
+    try:
+        number = kind(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a{'n integer' if kind is int else ' number'}, "
+                         f"not {value!r}")
+    if number != number or (low is not None and number < low) \
+            or (high is not None and number > high):
+        bounds = f"at least {low}" if high is None else f"between {low} and {high}"
+        raise ValueError(f"{name} must be {bounds}, not {value!r}")
+    return number
+
+def load_profiles(path=PROFILES_PATH):
+    """
+    Read saved profiles. Returns (profiles, last used profile name),
+    profiles being name -> TypingConfig. A missing or unreadable file
+    gives just the default profile; invalid profiles are skipped.
+    """
+    profiles = {DEFAULT_PROFILE: TypingConfig()}
+    last = DEFAULT_PROFILE
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return profiles, last
+    except (OSError, ValueError) as e:
+        print(f"Could not read profiles from {path}: {e}")
+        return profiles, last
+    for name, values in data.get('profiles', {}).items():
+        try:
+            profiles[name] = TypingConfig(**values)
+        except (TypeError, ValueError) as e:
+            print(f"Skipping invalid profile {name!r}: {e}")
+    if data.get('last') in profiles:
+        last = data['last']
+    return profiles, last
+
+def save_profiles(profiles, last=DEFAULT_PROFILE, path=PROFILES_PATH):
+    """Write profiles (name -> TypingConfig) atomically, remembering the last used one."""
+    data = {'last': last,
+            'profiles': {name: config.profile() for name, config in profiles.items()}}
+    path = Path(path)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
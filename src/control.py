@@ -0,0 +1,106 @@
+"""
+Stop / pause / resume signalling for typing sessions.
+Every wait in the engine goes through TypingControl.sleep, which wakes
+up as soon as a signal arrives instead of finishing its full duration.
+"""
+
+import threading
+import time
+
+class TypingControl:
+    """
+    Thread-safe stop, pause and resume signals shared between the
+    typing thread and the hotkey listener / GUI.
+
+    clock() is a perf_counter that stands still while paused, so
+    deadlines measured against it simply shift by the pause length.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self.stopped = False
+        self.paused = False
+        self._paused_at = None
+        self._paused_total = 0.0
+
+    def reset(self):
+        """Clear all signals before a new session."""
+        with self._cond:
+            self.stopped = False
+            self.paused = False
+            self._paused_at = None
+            self._paused_total = 0.0
+            self._cond.notify_all()
+
+    def stop(self):
+        """Stop the current session; any pending wait returns immediately."""
+        with self._cond:
+            self.stopped = True
+            self._cond.notify_all()
+
+    def pause(self):
+        with self._cond:
+            if not self.paused:
+                self.paused = True
+                self._paused_at = time.perf_counter()
+                self._cond.notify_all()
+
+    def resume(self):
+        with self._cond:
+            if self.paused:
+                self.paused = False
+                self._paused_total += time.perf_counter() - self._paused_at
+                self._paused_at = None
+                self._cond.notify_all()
+
+    def toggle_pause(self):
+        """Pause if running, resume if paused."""
+        with self._cond:
+            if self.paused:
+                self.resume()
+            else:
+                self.pause()
+
+    def clock(self):
+        """perf_counter minus all time spent paused."""
+        paused_at = self._paused_at
+        now = paused_at if paused_at is not None else time.perf_counter()
+        return now - self._paused_total
+
+    def sleep(self, seconds):
+        """
+        Wait for seconds of unpaused time. While paused, the wait is held
+        until resume. Returns False as soon as a stop is requested,
+        True once the full duration has elapsed.
+        """
+        with self._cond:
+            end = self.clock() + seconds
+            while not self.stopped:
+                if self.paused:
+                    self._cond.wait()
+                    continue
+                remaining = end - self.clock()
+                if remaining <= 0:
+                    return True
+                self._cond.wait(remaining)
+            return False
+
+class TypingCheckpoint:
+    """
+    Where a session left off: the plan seed and the number of plan
+    events already sent. Typing the same text with
+    type_text(..., resume_from=checkpoint) replays the same plan and
+    continues from that event, with the random state exactly as it was.
+    source and settings are the text source and planning settings of
+    the session, enough to rebuild what it typed (see retype.typed_text).
+    """
+    __slots__ = ('seed', 'events', 'source', 'settings')
+
+    def __init__(self, seed, events, source=None, settings=None):
+        self.seed = seed
+        self.events = events
+        self.source = source
+        self.settings = settings
+
+    def __repr__(self):
+        return f"TypingCheckpoint(seed={self.seed}, events={self.events})"
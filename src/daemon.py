@@ -0,0 +1,426 @@
+"""
+Local control server: JSON-RPC 2.0 over a Unix domain socket.
+Lets scripts drive one long-lived AutoTyper process (the GUI with
+--control-socket, or headless with `python -m src.daemon`) instead of
+faking F9 presses: jobs go through the same job queue as the hotkey.
+
+Messages are one JSON object per line. Methods:
+
+- submit(config) -> {"id": ...}; config holds "text" or "file" plus
+  type_text settings by name, as in a cli.py manifest job (paths must
+  be absolute: the server's working directory is not the client's)
+- status(id), progress(id): state, keys sent so far, elapsed seconds
+- watch(id, interval=0.5): sends "progress" notifications until the
+  job finishes, then returns its stats
+- stats(id): the final telemetry summary (or burst stats)
+- pause(), resume(): the running session
+- cancel(id=None): one job, or everything when no id is given
+- list(): the jobs the server knows about
+
+Where Unix sockets are not available (Windows), the server listens on
+localhost TCP instead. The socket file is only accessible by its owner;
+over TCP, which any local user can reach, each connection must first
+call authenticate(token) with the token the server writes to an
+owner-only file (TOKEN_PATH) at startup. ControlClient does that itself.
+"""
+
+import hmac
+import json
+import os
+import secrets
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from .jobs import job_queue, PENDING, RUNNING
+
+# Finished jobs kept for status / stats queries
+HISTORY = 256
+
+TCP_ADDRESS = ('127.0.0.1', 47923)
+# Where the TCP server keeps the token clients authenticate with
+TOKEN_PATH = os.path.join(os.path.expanduser('~'), '.autotyper_control_token')
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+JOB_ERROR = -32000
+AUTH_ERROR = -32001
+
+def write_token(path=TOKEN_PATH):
+    """Write a new random token to path, readable by its owner only, and return it."""
+    token = secrets.token_hex(32)
+    try:
+        os.unlink(path)  # A file of someone else's would keep its permissions
+    except FileNotFoundError:
+        pass
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        f.write(token)
+    return token
+
+def read_token(path=TOKEN_PATH):
+    with open(path, encoding='utf-8') as f:
+        return f.read().strip()
+
+def default_address():
+    """A per-user socket path, or TCP_ADDRESS without Unix sockets."""
+    if not hasattr(socket, 'AF_UNIX'):
+        return TCP_ADDRESS
+    directory = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return os.path.join(directory, f"autotyper-{os.getuid()}.sock")
+
+class RPCError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+class _Entry:
+    """
+    A submitted job and the telemetry recorder watching it. Once the job
+    has finished, only the recorder's summary is kept.
+    """
+    __slots__ = ('job', 'recorder', 'summary', 'chars', 'submitted')
+
+    def __init__(self, job, recorder, chars):
+        self.job = job
+        self.recorder = recorder
+        self.summary = None
+        self.chars = chars
+        self.submitted = time.time()
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+class ControlServer:
+    """
+    Serves the control API at address (default_address()) on a
+    background thread; each connection gets its own thread, so a
+    client watching a job does not hold up the others.
+    """
+
+    def __init__(self, address=None, queue=None, token=None):
+        self.address = address or default_address()
+        self.queue = queue or job_queue
+        self.token = token
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._server = None
+
+    def start(self):
+        server = self
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server._handle(self.rfile, self.wfile)
+
+        if isinstance(self.address, str):
+            self._remove_stale_socket()
+            old_umask = os.umask(0o177)  # Owner-only socket file
+            try:
+                self._server = socketserver.ThreadingUnixStreamServer(self.address, Handler)
+            finally:
+                os.umask(old_umask)
+            self._server.daemon_threads = True
+        else:
+            if self.token is None:
+                self.token = write_token()
+            self._server = _TCPServer(self.address, Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            if isinstance(self.address, str):
+                try:
+                    os.unlink(self.address)
+                except FileNotFoundError:
+                    pass
+
+    def _remove_stale_socket(self):
+        """Remove a socket file left behind by a dead server; refuse to steal a live one."""
+        if not os.path.exists(self.address):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.address)
+        except OSError:
+            os.unlink(self.address)
+        else:
+            raise OSError(f"An AutoTyper control server is already running at {self.address}")
+        finally:
+            probe.close()
+
+    # Connection handling
+
+    def _handle(self, rfile, wfile):
+        write_lock = threading.Lock()
+
+        def send(message):
+            data = (json.dumps(message) + '\n').encode('utf-8')
+            with write_lock:
+                wfile.write(data)
+                wfile.flush()
+
+        authenticated = self.token is None
+        for line in rfile:
+            if not line.strip():
+                continue
+            if not authenticated:
+                authenticated, response = self._authenticate(line)
+                try:
+                    send(response)
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+                if not authenticated:
+                    return
+                continue
+            try:
+                response = self._call(line, send)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            if response is not None:
+                try:
+                    send(response)
+                except (BrokenPipeError, ConnectionResetError):
+                    return
+
+    def _authenticate(self, line):
+        """Check a connection's first request: authenticate(token). Returns (ok, response)."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return False, _error(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict):
+            return False, _error(None, INVALID_REQUEST, "Invalid request")
+        request_id = request.get('id')
+        params = request.get('params')
+        token = params.get('token') if isinstance(params, dict) else None
+        if (request.get('method') != 'authenticate' or not isinstance(token, str)
+                or not hmac.compare_digest(token.encode(), self.token.encode())):
+            return False, _error(request_id, AUTH_ERROR, "Authenticate with the server's token first")
+        return True, {'jsonrpc': '2.0', 'id': request_id, 'result': True}
+
+    def _call(self, line, send):
+        """Handle one request line; returns the response (None for notifications)."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return _error(None, PARSE_ERROR, f"Parse error: {e}")
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return _error(None, INVALID_REQUEST, "Invalid request")
+        request_id = request.get('id')
+        method = getattr(self, 'rpc_' + request['method'], None)
+        try:
+            if method is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+            params = request.get('params') or {}
+            if request['method'] == 'watch':
+                params = dict(params, send=send)
+            if isinstance(params, list):
+                result = method(*params)
+            else:
+                result = method(**params)
+        except RPCError as e:
+            response = _error(request_id, e.code, str(e))
+        except (TypeError, ValueError) as e:
+            response = _error(request_id, INVALID_PARAMS, f"{type(e).__name__}: {e}")
+        except Exception as e:
+            response = _error(request_id, JOB_ERROR, f"{type(e).__name__}: {e}")
+        else:
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        return None if 'id' not in request else response
+
+    # Jobs
+
+    def _entry(self, job_id):
+        with self._lock:
+            entry = self._entries.get(job_id)
+        if entry is None:
+            raise RPCError(JOB_ERROR, f"Unknown job: {job_id}")
+        return entry
+
+    def _progress(self, entry):
+        job = entry.job
+        recorder = entry.recorder
+        report = {'id': job.id, 'status': job.status, 'chars': entry.chars}
+        if recorder is not None:
+            keys = recorder.count
+            report['keys'] = keys
+            report['seconds'] = recorder.actual[keys - 1] if keys else 0.0
+        elif entry.summary is not None:
+            report['keys'] = entry.summary['events']
+            report['seconds'] = entry.summary.get('seconds', 0.0)
+        if job.error is not None:
+            report['error'] = f"{type(job.error).__name__}: {job.error}"
+        return report
+
+    def rpc_submit(self, config):
+        from .cli import resolve_job
+        from .telemetry import TelemetryRecorder
+        if not isinstance(config, dict):
+            raise ValueError("config must be an object")
+        if 'text' not in config and 'file' not in config:
+            raise ValueError("config needs 'text' or 'file'")
+        for name in ('file', 'retype_from'):
+            if name in config and not os.path.isabs(config[name]):
+                raise ValueError(f"{name} must be an absolute path")
+        config = resolve_job(config)
+        config.pop('sink', None)
+        config.pop('telemetry', None)
+        recorder = None
+        if not config.get('burst'):
+            recorder = config['telemetry'] = TelemetryRecorder()
+        text = config['text']
+        job = self.queue.submit(config)
+        if job is None:
+            raise RPCError(JOB_ERROR, "The job queue is full")
+        entry = _Entry(job, recorder, len(text) if isinstance(text, str) else None)
+        with self._lock:
+            self._entries[job.id] = entry
+            while len(self._entries) > HISTORY:
+                self._entries.popitem(last=False)
+        if recorder is not None:
+            threading.Thread(target=self._keep_summary, args=(entry,), daemon=True).start()
+        return {'id': job.id}
+
+    def _keep_summary(self, entry):
+        """Once the job has finished, swap its recorder (one entry per key) for the summary."""
+        self.queue.wait(entry.job)
+        entry.summary = entry.recorder.summary()
+        entry.job.config.pop('telemetry', None)
+        entry.recorder = None
+
+    def rpc_status(self, id):
+        return self._progress(self._entry(id))
+
+    rpc_progress = rpc_status
+
+    def rpc_watch(self, id, interval=0.5, send=None):
+        entry = self._entry(id)
+        interval = max(0.05, float(interval))
+        while not self.queue.wait(entry.job, interval):
+            send({'jsonrpc': '2.0', 'method': 'progress', 'params': self._progress(entry)})
+        return self.rpc_stats(id)
+
+    def rpc_stats(self, id):
+        entry = self._entry(id)
+        report = self._progress(entry)
+        if entry.job.status in (PENDING, RUNNING):
+            return report
+        recorder = entry.recorder
+        if recorder is not None:
+            report.update(recorder.summary())
+        elif entry.summary is not None:
+            report.update(entry.summary)
+        elif isinstance(entry.job.result, dict):
+            report.update(entry.job.result)
+        return report
+
+    def rpc_pause(self):
+        from . import typing_engine
+        typing_engine.control.pause()
+        return True
+
+    def rpc_resume(self):
+        from . import typing_engine
+        typing_engine.control.resume()
+        return True
+
+    def rpc_cancel(self, id=None):
+        if id is None:
+            self.queue.cancel_all()
+            return True
+        return self.queue.cancel(id)
+
+    def rpc_list(self):
+        with self._lock:
+            entries = list(self._entries.values())
+        return [self._progress(entry) for entry in entries]
+
+def _error(request_id, code, message):
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+class ControlClient:
+    """
+    Minimal client for scripts:
+
+        client = ControlClient()
+        job = client.call('submit', config={'text': 'hello', 'delay': 0})
+        for progress in client.watch(job['id']):
+            print(progress)
+    """
+
+    def __init__(self, address=None, timeout=None, token=None):
+        address = address or default_address()
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(address)
+        self._file = self._sock.makefile('rwb')
+        self._ids = 0
+        if family == socket.AF_INET:
+            self.call('authenticate', token=token or read_token())
+
+    def _send(self, method, params):
+        self._ids += 1
+        message = {'jsonrpc': '2.0', 'id': self._ids, 'method': method, 'params': params}
+        self._file.write((json.dumps(message) + '\n').encode('utf-8'))
+        self._file.flush()
+        return self._ids
+
+    def _receive(self):
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("The control server closed the connection")
+        return json.loads(line)
+
+    def _result(self, response):
+        if 'error' in response:
+            raise RPCError(response['error']['code'], response['error']['message'])
+        return response['result']
+
+    def call(self, method, **params):
+        self._send(method, params)
+        return self._result(self._receive())
+
+    def watch(self, job_id, interval=0.5):
+        """Yield progress dicts while the job runs, then its final stats."""
+        self._send('watch', {'id': job_id, 'interval': interval})
+        while True:
+            message = self._receive()
+            if 'id' not in message:
+                yield message['params']
+            else:
+                yield self._result(message)
+                return
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+def main(argv=None):
+    """Run the control server without the GUI until interrupted."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Headless AutoTyper control server.")
+    parser.add_argument('--socket', help=f"socket path (default {default_address()})")
+    args = parser.parse_args(argv)
+    server = ControlServer(args.socket).start()
+    print(f"AutoTyper control server listening on {server.address}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        job_queue.shutdown()
+
+if __name__ == '__main__':
+    main()
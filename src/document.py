@@ -0,0 +1,122 @@
+"""
+Large documents for the GUI.
+A Document keeps the text outside the Tk widget, in a file read through
+mmap: the widget only shows one page at a time, character and line
+counts are computed by streaming the file, and typing jobs get the
+file path, so the engine streams it too (see sources.py). Clipboard
+text too big for the widget is written to a temporary file first.
+"""
+
+import mmap
+import os
+import tempfile
+from pathlib import Path
+
+from .sources import iter_text_chunks
+
+# Text at least this long is shown as a Document rather than in the widget
+LARGE_TEXT_CHARS = 1_000_000
+
+# Bytes of the file shown per preview page
+PAGE_BYTES = 64 * 1024
+
+# Characters simulated to estimate the duration of a long document
+SAMPLE_CHARS = 100_000
+
+def _char_boundary(data, index):
+    """Move index forward past UTF-8 continuation bytes to a character start."""
+    end = min(len(data), index + 4)
+    while index < end and 0x80 <= data[index] < 0xc0:
+        index += 1
+    return index
+
+def estimate(source, chars, **config):
+    """
+    Simulate typing source (see typing_engine.simulate), a text of chars
+    characters or, as a str, just its first characters; the result is
+    scaled up from the sample to the whole text. Returns the simulate()
+    dict without its timeline.
+    """
+    from .typing_engine import simulate
+    result = simulate(source, **config)
+    if isinstance(source, str) and 0 < len(source) < chars:
+        scale = chars / len(source)
+        delay = result['breakdown'].get('delay', 0.0)
+        result['duration'] = delay + (result['duration'] - delay) * scale
+        result['events'] = int(result['events'] * scale)
+        result['breakdown'] = {name: seconds if name == 'delay' else seconds * scale
+                               for name, seconds in result['breakdown'].items()}
+    result['timeline'] = None
+    return result
+
+class Document:
+    """A UTF-8 text file shown through a paged preview."""
+
+    def __init__(self, path, temporary=False):
+        self.path = Path(path)
+        self.temporary = temporary  # Delete the file on close()
+        self._file = open(self.path, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self.pages = max(1, -(-self.size // PAGE_BYTES))
+        self.chars = None
+        self.lines = None
+
+    @classmethod
+    def from_text(cls, text):
+        """Write text to a temporary file and open it as a Document."""
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='',
+                                         suffix='.txt', delete=False) as f:
+            f.write(text)
+        return cls(f.name, temporary=True)
+
+    def page(self, index):
+        """The text of preview page index (0-based)."""
+        data = self._data
+        start = _char_boundary(data, index * PAGE_BYTES)
+        end = _char_boundary(data, (index + 1) * PAGE_BYTES)
+        return data[start:end].decode('utf-8', errors='replace')
+
+    def count(self):
+        """Stream the file once to count characters and lines. Returns (chars, lines)."""
+        chars = lines = 0
+        last = ''
+        for chunk in iter_text_chunks(self.path):
+            chars += len(chunk)
+            lines += chunk.count('\n')
+            last = chunk[-1]
+        if last and last != '\n':
+            lines += 1
+        self.chars, self.lines = chars, lines
+        return chars, lines
+
+    def head(self, chars):
+        """The first chars characters of the document."""
+        parts = []
+        total = 0
+        for chunk in iter_text_chunks(self.path):
+            parts.append(chunk)
+            total += len(chunk)
+            if total >= chars:
+                break
+        return ''.join(parts)[:chars]
+
+    def estimate(self, **config):
+        """
+        Estimate how long typing the document takes with the given
+        type_text settings: short documents are simulated whole, long
+        ones through their first SAMPLE_CHARS characters (see estimate).
+        """
+        if self.chars is None:
+            self.count()
+        if self.chars <= SAMPLE_CHARS:
+            return estimate(self.path, self.chars, **config)
+        return estimate(self.head(SAMPLE_CHARS), self.chars, **config)
+
+    def close(self, keep_file=False):
+        """Release the file; a temporary one is deleted unless keep_file."""
+        if self.size:
+            self._data.close()
+        self._file.close()
+        if self.temporary and not keep_file:
+            self.path.unlink(missing_ok=True)
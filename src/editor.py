@@ -0,0 +1,303 @@
+"""
+Editor-aware keystroke planning.
+Code editors indent new lines and close brackets and quotes on their
+own, so typing source text key for key into them both mangles it and
+wastes keystrokes. An EditorProfile describes what an editor does by
+itself; EditorModel replays keys the way that editor would, and
+plan_keys finds the keys that make the model produce the exact text:
+
+- indentation is reached from the editor's auto-indent with the
+  shortest mix of Tab, Shift-Tab, Backspace and Space,
+- runs of spaces inside a line use Tab where it lands on them exactly,
+- closers the editor inserted are typed over, and any left over at the
+  end of a line are removed with Delete,
+- whitespace-only lines are left to the editor's trimming when it has it.
+"""
+
+from collections import deque
+
+from .typing_plan import BACKSPACE, ENTER, SPACE, TAB, SHIFT_TAB, DELETE
+
+class EditorProfile:
+    """
+    What an editor does on its own.
+
+    - auto_indent: Enter copies the indentation of the current line
+    - indent_after: a line ending in one of these chars indents the next
+      one by a level; a line starting with a dedent_after word dedents it
+    - auto_close: opener -> closer inserted right after the cursor;
+      typing a closer in front of an inserted one types over it
+    - tab_width, insert_spaces: Tab inserts spaces up to the next tab
+      stop, or a tab character
+    - shift_tab_dedents: Shift-Tab removes one level of indentation
+    - trim_auto_whitespace: Enter clears a line holding nothing but
+      untouched auto-indentation
+    """
+    __slots__ = ('name', 'auto_indent', 'indent_after', 'dedent_after', 'auto_close',
+                 'tab_width', 'insert_spaces', 'shift_tab_dedents', 'trim_auto_whitespace')
+
+    def __init__(self,
+                 name,
+                 auto_indent=False,
+                 indent_after='',
+                 dedent_after=(),
+                 auto_close=None,
+                 tab_width=4,
+                 insert_spaces=True,
+                 shift_tab_dedents=True,
+                 trim_auto_whitespace=False):
+        self.name = name
+        self.auto_indent = auto_indent
+        self.indent_after = indent_after
+        self.dedent_after = tuple(dedent_after)
+        self.auto_close = dict(auto_close or {})
+        self.tab_width = tab_width
+        self.insert_spaces = insert_spaces
+        self.shift_tab_dedents = shift_tab_dedents
+        self.trim_auto_whitespace = trim_auto_whitespace
+
+    @property
+    def indent_unit(self):
+        return ' ' * self.tab_width if self.insert_spaces else '\t'
+
+    def __repr__(self):
+        return f"EditorProfile({self.name!r})"
+
+BRACKETS = {'(': ')', '[': ']', '{': '}'}
+QUOTES = {'"': '"', "'": "'"}
+
+PROFILES = {
+    # Notepad and friends: no automation, Tab types a tab character
+    'plain': EditorProfile('plain', insert_spaces=False, shift_tab_dedents=False),
+    # VS Code style, Python and C-like brackets
+    'vscode': EditorProfile('vscode', auto_indent=True, indent_after=':{([',
+                            auto_close=dict(BRACKETS, **QUOTES),
+                            trim_auto_whitespace=True),
+    # IDLE: indents after a colon, dedents after block-ending statements
+    'idle': EditorProfile('idle', auto_indent=True, indent_after=':',
+                          dedent_after=('return', 'pass', 'break', 'continue', 'raise')),
+}
+
+def get_profile(profile):
+    """Return an EditorProfile given one or the name of a built-in profile."""
+    if isinstance(profile, EditorProfile):
+        return profile
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown editor profile: {profile!r}")
+
+def _leading_whitespace(line):
+    return line[:len(line) - len(line.lstrip(' \t'))]
+
+def _tab_text(profile, column):
+    """What pressing Tab at column inserts."""
+    if profile.insert_spaces:
+        width = profile.tab_width
+        return ' ' * (width - column % width)
+    return '\t'
+
+def _dedent(profile, indent):
+    """indent after one Shift-Tab."""
+    if not indent:
+        return indent
+    if indent.endswith('\t'):
+        return indent[:-1]
+    spaces = len(indent) - len(indent.rstrip(' '))
+    remove = len(indent) % profile.tab_width or profile.tab_width
+    return indent[:len(indent) - min(remove, spaces)]
+
+class EditorModel:
+    """
+    Replays key codes the way a profile's editor would. Keys are always
+    typed at the cursor on the last line, as the planner does; anything
+    right of the cursor is therefore an auto-inserted closer.
+    """
+
+    def __init__(self, profile, keep_lines=True):
+        self.profile = get_profile(profile)
+        self.keep_lines = keep_lines  # Whether finished lines are kept for text()
+        self.done = []
+        self.line = ''
+        self.cursor = 0
+        self.touched = False  # Whether keys other than Enter changed this line
+        self._closers = set(self.profile.auto_close.values())
+
+    def press(self, code):
+        profile = self.profile
+        line = self.line
+        cursor = self.cursor
+        if code == ENTER:
+            current = line[:cursor]
+            indent = _leading_whitespace(current)
+            if profile.trim_auto_whitespace and not self.touched and not current.strip():
+                current = ''
+            if self.keep_lines:
+                self.done.append(current)
+            new_indent = ''
+            if profile.auto_indent:
+                new_indent = indent
+                stripped = current.strip()
+                if stripped and stripped[-1] in profile.indent_after:
+                    new_indent += profile.indent_unit
+                elif stripped and stripped.split(None, 1)[0] in profile.dedent_after:
+                    new_indent = _dedent(profile, indent)
+            self.line = new_indent + line[cursor:]
+            self.cursor = len(new_indent)
+            self.touched = False
+            return
+
+        self.touched = True
+        if code == TAB:
+            text = _tab_text(profile, cursor)
+            self.line = line[:cursor] + text + line[cursor:]
+            self.cursor += len(text)
+        elif code == SHIFT_TAB:
+            if profile.shift_tab_dedents:
+                indent = _leading_whitespace(line)
+                new_indent = _dedent(profile, indent)
+                self.line = new_indent + line[len(indent):]
+                self.cursor = max(len(new_indent), cursor - (len(indent) - len(new_indent)))
+        elif code == BACKSPACE:
+            if cursor:
+                self.line = line[:cursor - 1] + line[cursor:]
+                self.cursor -= 1
+        elif code == DELETE:
+            self.line = line[:cursor] + line[cursor + 1:]
+        else:
+            char = chr(code)
+            if cursor < len(line) and line[cursor] == char and char in self._closers:
+                # Type over the closer the editor inserted
+                self.cursor += 1
+                return
+            closer = profile.auto_close.get(char)
+            if closer is not None and char in QUOTES and cursor and line[cursor - 1].isalnum():
+                closer = None  # An apostrophe, not the start of a string
+            self.line = line[:cursor] + char + (closer or '') + line[cursor:]
+            self.cursor += 1
+
+    def text(self):
+        """The editor's buffer contents."""
+        return '\n'.join(self.done + [self.line])
+
+def _indent_keys(profile, current, target, memo):
+    """
+    Shortest keys turning the indentation current into target, found by
+    a breadth-first search over indentation strings (prefixes of either,
+    or the target plus a little overshoot). Results are memoized
+    per (current, target); there are only a few distinct pairs per file.
+    """
+    key = (current, target)
+    keys = memo.get(key)
+    if keys is not None:
+        return keys
+    limit = max(len(current), len(target)) + profile.tab_width
+    parents = {current: None}
+    queue = deque((current,))
+    while queue:
+        state = queue.popleft()
+        if state == target:
+            break
+        moves = [(TAB, state + _tab_text(profile, len(state))),
+                 (SPACE, state + ' ')]
+        if state:
+            moves.append((BACKSPACE, state[:-1]))
+            if profile.shift_tab_dedents:
+                moves.append((SHIFT_TAB, _dedent(profile, state)))
+        for code, nxt in moves:
+            if nxt in parents or len(nxt) > limit:
+                continue
+            # Stay on prefixes of either end, or overshoot the target
+            if target.startswith(nxt) or current.startswith(nxt) or nxt.startswith(target):
+                parents[nxt] = (state, code)
+                queue.append(nxt)
+    if target not in parents:
+        raise ValueError(f"Editor profile {profile.name!r} cannot produce the "
+                         f"indentation {target!r}")
+    keys = []
+    state = target
+    while parents[state] is not None:
+        state, code = parents[state]
+        keys.append(code)
+    keys.reverse()
+    keys = memo[key] = tuple(keys)
+    return keys
+
+def iter_lines(chunks):
+    """Yield (line, is_last) for text streamed as str chunks, without newlines."""
+    pending = ''
+    for chunk in chunks:
+        lines = (pending + chunk).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line, False
+    yield pending, True
+
+def plan_keys(chunks, profile):
+    """
+    Yield the key codes that make the profile's editor end up holding
+    exactly the streamed text. Raises ValueError for text the editor
+    cannot produce (e.g. a tab character when Tab inserts spaces).
+    """
+    profile = get_profile(profile)
+    model = EditorModel(profile, keep_lines=False)
+    press = model.press
+    memo = {}
+    spaces_tab = profile.insert_spaces
+    width = profile.tab_width
+    first = True
+
+    for line, last in iter_lines(chunks):
+        if not first:
+            press(ENTER)
+            yield ENTER
+        first = False
+
+        target = _leading_whitespace(line)
+        body = line[len(target):]
+        current = model.line
+        if not body and not last and profile.trim_auto_whitespace:
+            if not target:
+                continue  # The next Enter clears the auto-indentation
+            if target == current:
+                # Touch the line so the editor keeps it
+                press(BACKSPACE)
+                yield BACKSPACE
+                current = current[:-1]
+        for code in _indent_keys(profile, current, target, memo):
+            press(code)
+            yield code
+
+        i = 0
+        n = len(body)
+        while i < n:
+            char = body[i]
+            if char == ' ' and spaces_tab:
+                run = len(body) - i - len(body[i:].lstrip(' '))
+                column = model.cursor
+                i += run
+                while run:
+                    step = width - column % width
+                    code = TAB if 1 < step <= run else SPACE
+                    if code == SPACE:
+                        step = 1
+                    press(code)
+                    yield code
+                    column += step
+                    run -= step
+                continue
+            if char == '\t':
+                if spaces_tab:
+                    raise ValueError(f"Editor profile {profile.name!r} inserts spaces "
+                                     f"for Tab; cannot type a tab character")
+                code = TAB
+            else:
+                code = ord(char)
+            press(code)
+            yield code
+            i += 1
+
+        # Remove closers the editor inserted that the text does not have
+        for _ in range(len(model.line) - model.cursor):
+            press(DELETE)
+            yield DELETE
@@ -4,12 +4,16 @@ and provides config to the typing engine.
 """
 
 import tkinter as tk
-from tkinter import ttk
-import pyperclip
-import time
+from tkinter import ttk, filedialog, messagebox
 import threading
 
-from .typing_engine import stop_typing  # We can set stop_typing = True from GUI
+from . import typing_engine  # For stop / pause signals
+from .editor import PROFILES
+from .clipboard import ClipboardWatcher
+from .control import TypingControl
+from .document import Document, LARGE_TEXT_CHARS, SAMPLE_CHARS, estimate
+from .config import TypingConfig, load_profiles, save_profiles, DEFAULT_PROFILE
+from .jobs import job_queue
 # We do not import type_text directly here; we let typing_engine.start_typing_thread() handle it.
 
 # Global references to GUI elements so we can fetch their values
@@ -19,6 +23,7 @@ min_speed_entry = None
 max_speed_entry = None
 delay_entry = None
 clipboard_option_var = None
+clipboard_replaces_var = None
 random_toggle_var = None
 thinking_toggle_var = None
 min_pause_entry = None
@@ -26,85 +31,352 @@ max_pause_entry = None
 pause_freq_entry = None
 typo_toggle_var = None
 typo_freq_entry = None
+precise_timing_var = None
+burst_toggle_var = None
+chunk_size_entry = None
+chunk_gap_entry = None
+editor_profile_var = None
+eta_label = None
+clipboard_watcher = None
+document_label = None
+document = None  # The open Document in large-document mode, else None
+page_index = 0
+profile_var = None
+profile_combo = None
+profiles = {}
+
+# The latest valid settings, rebuilt on the Tk thread whenever one changes.
+# Other threads (the F9 hotkey) only read this reference.
+current_config = TypingConfig()
+config_error = None  # Why the settings on screen are invalid, if they are
+entry_vars = {}  # TypingConfig field -> StringVar of its entry
+_applying_profile = False
+
+_text_job = None  # Pending root.after id of the rebuild after text edits
+_eta_job = None  # Pending root.after id of the next ETA refresh
+_eta_signals = None  # TypingControl of the running estimate, stopped once outdated
 
 def get_current_typing_config():
     """
-    Collects all the current settings from GUI controls
-    and returns them as a dictionary for the typing_engine.type_text function.
+    Returns the current settings as a dictionary for the
+    typing_engine.type_text function. Only reads the current_config
+    snapshot, so it is safe to call from any thread; raises ValueError
+    while the settings on screen are invalid.
     """
-    config = {}
-
-    # If the GUI isn't fully initialized, return defaults
-    if not all([text_input, min_speed_entry, max_speed_entry, delay_entry,
-                clipboard_option_var, random_toggle_var, thinking_toggle_var,
-                min_pause_entry, max_pause_entry, pause_freq_entry,
-                typo_toggle_var, typo_freq_entry]):
-        # Return default config if something goes wrong
-        return {
-            'text': "",
-            'min_wpm': 40.0,
-            'max_wpm': 80.0,
-            'delay': 0.25,
-            'thinking_enabled': True,
-            'min_pause': 0.5,
-            'max_pause': 2.0,
-            'pause_frequency': 50,
-            'typos_enabled': True,
-            'typo_chance': 0.3,
-            'random_letters': False
-        }
-
-    current_text = text_input.get("1.0", tk.END).strip()
-    use_clipboard = clipboard_option_var.get()
-    if use_clipboard:
+    if config_error is not None:
+        raise ValueError(config_error)
+    return current_config.as_dict()
+
+def read_config():
+    """Build a TypingConfig from the GUI controls (Tk thread only)."""
+    editor = editor_profile_var.get()
+    if document is not None:
+        text = document.path
+    else:
+        text = text_input.get("1.0", tk.END).strip()
+    return TypingConfig(
+        text=text,
+        min_wpm=min_speed_entry.get(),
+        max_wpm=max_speed_entry.get(),
+        delay=delay_entry.get(),
+        thinking_enabled=thinking_toggle_var.get(),
+        min_pause=min_pause_entry.get(),
+        max_pause=max_pause_entry.get(),
+        pause_frequency=pause_freq_entry.get(),
+        typos_enabled=typo_toggle_var.get(),
+        typo_chance=_percent(typo_freq_entry.get()),
+        random_letters=random_toggle_var.get(),
+        precise_timing=precise_timing_var.get(),
+        burst=burst_toggle_var.get(),
+        chunk_size=chunk_size_entry.get(),
+        chunk_gap=chunk_gap_entry.get(),
+        editor=None if editor == 'none' else editor,
+    )
+
+def _percent(value):
+    try:
+        return float(value) / 100.0
+    except ValueError:
+        raise ValueError(f"typo chance must be a number, not {value!r}")
+
+def rebuild_config(*args):
+    """
+    Variable trace / event callback: validate the settings on screen and
+    swap in a new current_config if they changed, refreshing the ETA.
+    """
+    global current_config, config_error, _text_job
+    if _applying_profile or text_input is None:
+        return
+    if _text_job is not None:
+        root.after_cancel(_text_job)
+        _text_job = None
+    try:
+        config = read_config()
+    except ValueError as e:
+        config_error = str(e)
+        eta_label.config(text=f"Invalid settings: {e}")
+        return
+    changed = config_error is not None or config != current_config
+    config_error = None
+    current_config = config
+    if changed:
+        schedule_eta_refresh()
+
+def apply_profile(name):
+    """Put the settings of a saved profile into the GUI controls."""
+    global _applying_profile
+    config = profiles[name]
+    _applying_profile = True
+    try:
+        for field, var in entry_vars.items():
+            value = getattr(config, field)
+            if field == 'typo_chance':
+                value *= 100
+            var.set(f"{value:g}")
+        thinking_toggle_var.set(config.thinking_enabled)
+        typo_toggle_var.set(config.typos_enabled)
+        random_toggle_var.set(config.random_letters)
+        precise_timing_var.set(config.precise_timing)
+        burst_toggle_var.set(config.burst)
+        editor_profile_var.set(config.editor or 'none')
+    finally:
+        _applying_profile = False
+    rebuild_config()
+
+def select_profile(event=None):
+    name = profile_var.get()
+    if name in profiles:
+        apply_profile(name)
+        write_profiles(name)
+
+def write_profiles(last):
+    """Save the profiles, telling the user when the file cannot be written."""
+    try:
+        save_profiles(profiles, last)
+    except OSError as e:
+        messagebox.showerror("Profiles not saved", f"Could not save the profiles: {e}")
+
+def save_current_profile():
+    """Save the current settings under the name in the profile box."""
+    name = profile_var.get().strip() or DEFAULT_PROFILE
+    if config_error is not None:
+        eta_label.config(text=f"Not saved, invalid settings: {config_error}")
+        return
+    profiles[name] = current_config.replace(text="")
+    write_profiles(name)
+    profile_var.set(name)
+    profile_combo.config(values=sorted(profiles))
+
+def format_duration(seconds):
+    """Format seconds as e.g. '1h 02m', '3m 05s' or '4.2s'."""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(round(seconds)), 60)
+    if minutes < 60:
+        return f"{minutes}m {secs:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+def schedule_text_rebuild(event=None):
+    """
+    Rebuild the config shortly after the user stops typing in the text
+    box, rather than copying the whole text out on every keystroke.
+    """
+    global _text_job
+    if _text_job is not None:
+        root.after_cancel(_text_job)
+    _text_job = root.after(250, rebuild_config)
+
+def flush_text_edits():
+    """Apply a pending text box rebuild now (Tk thread only)."""
+    if _text_job is not None:
+        rebuild_config()
+
+def schedule_eta_refresh(event=None):
+    """Refresh the ETA shortly after the user stops editing."""
+    global _eta_job
+    if root is None:
+        return
+    if _eta_job is not None:
+        root.after_cancel(_eta_job)
+    _eta_job = root.after(400, refresh_eta)
+
+def refresh_eta():
+    """
+    Estimate the current config in the background (a simulation of the
+    text, or of a sample of long text; see document.estimate) and show
+    how long typing it will take. A newer refresh stops the estimate
+    still running, so only one ever keeps going.
+    """
+    global _eta_job, _eta_signals
+    _eta_job = None
+    try:
+        config = get_current_typing_config()
+    except ValueError as e:
+        eta_label.config(text=f"Invalid settings: {e}")
+        return
+    if not config['text']:
+        eta_label.config(text="ETA: -")
+        return
+    config.pop('precise_timing', None)
+    config['seed'] = 0  # Same estimate for the same settings
+    if _eta_signals is not None:
+        _eta_signals.stop()
+    signals = config['signals'] = _eta_signals = TypingControl()
+    doc = document
+
+    def worker():
         try:
-            clipboard_text = pyperclip.paste()
-            if clipboard_text:
-                current_text = clipboard_text
-        except:
-            pass
-
-    config['text'] = current_text
-    config['min_wpm'] = float(min_speed_entry.get())
-    config['max_wpm'] = float(max_speed_entry.get())
-    config['delay'] = float(delay_entry.get())
-    config['thinking_enabled'] = thinking_toggle_var.get()
-    config['min_pause'] = float(min_pause_entry.get())
-    config['max_pause'] = float(max_pause_entry.get())
-    config['pause_frequency'] = int(pause_freq_entry.get())
-    config['typos_enabled'] = typo_toggle_var.get()
-    config['typo_chance'] = float(typo_freq_entry.get()) / 100.0
-    config['random_letters'] = random_toggle_var.get()
-
-    return config
-
-def update_clipboard_loop():
+            source = config.pop('text')
+            if doc is not None:
+                result = doc.estimate(**config)
+            else:
+                result = estimate(source[:SAMPLE_CHARS], len(source), **config)
+            b = result['breakdown']
+            text = (f"ETA: {format_duration(result['duration'])} "
+                    f"({result['events']} keys; pauses {format_duration(b['pauses'])}, "
+                    f"typos {format_duration(b['typos'])})")
+        except Exception as e:
+            text = f"ETA: unavailable ({e})"
+        if not signals.stopped:
+            root.after(0, lambda: eta_label.config(text=text))
+
+    threading.Thread(target=worker, daemon=True).start()
+
+def show_page(index):
+    """Show page index of the open document in the (read-only) text box."""
+    global page_index
+    page_index = max(0, min(index, document.pages - 1))
+    text_input.config(state=tk.NORMAL)
+    text_input.delete("1.0", tk.END)
+    text_input.insert("1.0", document.page(page_index))
+    text_input.edit_modified(False)
+    text_input.config(state=tk.DISABLED)
+    update_document_label()
+
+def update_document_label():
+    if document is None:
+        document_label.config(text="")
+        return
+    if document.chars is None:
+        counts = "counting..."
+    else:
+        counts = f"{document.chars:,} chars, {document.lines:,} lines"
+    document_label.config(
+        text=f"{document.path.name}: page {page_index + 1}/{document.pages} ({counts})")
+
+def show_document(doc):
+    """
+    Switch to large-document mode: the text is typed from doc's file
+    and the text box only previews it a page at a time. Characters and
+    lines are counted in the background; the ETA follows once they are.
     """
-    Periodically checks the clipboard and updates the text box if
-    the 'Use clipboard text' option is selected.
+    global document
+    if document is not None and document is not doc:
+        release_document(document)
+    document = doc
+
+    def count():
+        doc.count()
+        if document is doc:
+            root.after(0, update_document_label)
+            root.after(0, schedule_eta_refresh)
+
+    show_page(0)
+    rebuild_config()
+    threading.Thread(target=count, daemon=True).start()
+
+def close_document():
+    """Leave large-document mode and go back to the editable text box."""
+    global document
+    if document is None:
+        return
+    release_document(document)
+    document = None
+    text_input.config(state=tk.NORMAL)
+    text_input.delete("1.0", tk.END)
+    update_document_label()
+    rebuild_config()
+
+def release_document(doc):
     """
-    while True:
-        if clipboard_option_var.get():
-            try:
-                clipboard_text = pyperclip.paste()
-                current_text = text_input.get("1.0", tk.END).strip()
-                if clipboard_text and clipboard_text != current_text:
-                    text_input.delete("1.0", tk.END)
-                    text_input.insert("1.0", clipboard_text)
-            except Exception as e:
-                print(f"Error updating clipboard: {e}")
-        time.sleep(1)
+    Close doc. Queued and running jobs type from its file, so a
+    temporary file still in use is only deleted once those jobs are done.
+    """
+    jobs = [job for job in job_queue.list_jobs() if job.config.get('text') == doc.path]
+    doc.close(keep_file=bool(jobs))
+    if not jobs or not doc.temporary:
+        return
+
+    def delete_when_done():
+        for job in jobs:
+            job_queue.wait_finished(job)
+        doc.path.unlink(missing_ok=True)
+
+    threading.Thread(target=delete_when_done, daemon=True).start()
+
+def open_document():
+    path = filedialog.askopenfilename(
+        title="Open text file",
+        filetypes=[("Text files", "*.txt"), ("All files", "*")])
+    if path:
+        try:
+            doc = Document(path)
+        except OSError as e:
+            messagebox.showerror("File not opened", f"Could not open {path}: {e}")
+            return
+        show_document(doc)
+
+def show_clipboard_text(text):
+    """
+    Put new clipboard text into the text box. Runs on the Tk main
+    thread; the clipboard watcher schedules it with root.after.
+    An open document is only replaced when the user opted in.
+    """
+    if document is not None:
+        if not clipboard_replaces_var.get():
+            return
+        close_document()
+    text_input.delete("1.0", tk.END)
+    text_input.insert("1.0", text)
+
+def show_clipboard_document(doc):
+    """show_document for long clipboard text, unless it would replace an open document."""
+    if document is not None and not clipboard_replaces_var.get():
+        doc.close()
+        return
+    show_document(doc)
+
+def on_clipboard_change(text):
+    """
+    ClipboardWatcher callback (watcher thread): hand over to the main
+    thread. Text too long for the text box is written to a temporary
+    file here and shown as a Document.
+    """
+    if len(text) >= LARGE_TEXT_CHARS:
+        root.after(0, show_clipboard_document, Document.from_text(text))
+    else:
+        root.after(0, show_clipboard_text, text)
 
 def run_gui():
     """
     Builds and displays the Tkinter GUI, then starts the main loop.
     """
+    build_gui()
+    root.mainloop()
+
+def build_gui():
+    """
+    Builds the Tkinter GUI and starts the clipboard watcher; run_gui
+    then runs the main loop. Returns the root window.
+    """
     global root
     global text_input
     global min_speed_entry
     global max_speed_entry
     global delay_entry
     global clipboard_option_var
+    global clipboard_replaces_var
     global random_toggle_var
     global thinking_toggle_var
     global min_pause_entry
@@ -112,10 +384,34 @@ def run_gui():
     global pause_freq_entry
     global typo_toggle_var
     global typo_freq_entry
+    global precise_timing_var
+    global burst_toggle_var
+    global chunk_size_entry
+    global chunk_gap_entry
+    global editor_profile_var
+    global eta_label
+    global clipboard_watcher
+    global document_label
+    global profile_var
+    global profile_combo
+    global profiles
 
     root = tk.Tk()
     root.title("Auto Typer")
 
+    # Saved profiles; the controls start out with the last one used
+    profiles, last_profile = load_profiles()
+    initial = profiles[last_profile]
+
+    def setting_var(field):
+        """A StringVar for the entry of a TypingConfig field, traced by rebuild_config."""
+        value = getattr(initial, field)
+        if field == 'typo_chance':
+            value *= 100
+        var = entry_vars[field] = tk.StringVar(value=f"{value:g}")
+        var.trace_add('write', rebuild_config)
+        return var
+
     # Main frame
     main_frame = ttk.Frame(root)
     main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -126,15 +422,34 @@ def run_gui():
     text_input = tk.Text(main_frame, height=10, width=50)
     text_input.pack(pady=5)
 
+    # Large-document mode: type a file without loading it into the text box
+    document_frame = ttk.Frame(main_frame)
+    document_frame.pack(fill=tk.X)
+    ttk.Button(document_frame, text="Open file...", command=open_document).pack(side=tk.LEFT)
+    ttk.Button(document_frame, text="Close file", command=close_document).pack(side=tk.LEFT, padx=5)
+    ttk.Button(document_frame, text="<", width=2,
+               command=lambda: document and show_page(page_index - 1)).pack(side=tk.LEFT)
+    ttk.Button(document_frame, text=">", width=2,
+               command=lambda: document and show_page(page_index + 1)).pack(side=tk.LEFT)
+    document_label = ttk.Label(document_frame, text="")
+    document_label.pack(side=tk.LEFT, padx=5)
+
     # Settings frame
     settings_frame = ttk.LabelFrame(main_frame, text="Settings", padding=10)
     settings_frame.pack(fill=tk.X, pady=5)
 
     # Variables
     clipboard_option_var = tk.BooleanVar(value=True)
-    random_toggle_var = tk.BooleanVar(value=False)
-    thinking_toggle_var = tk.BooleanVar(value=True)
-    typo_toggle_var = tk.BooleanVar(value=True)
+    clipboard_replaces_var = tk.BooleanVar(value=False)
+    random_toggle_var = tk.BooleanVar(value=initial.random_letters)
+    thinking_toggle_var = tk.BooleanVar(value=initial.thinking_enabled)
+    typo_toggle_var = tk.BooleanVar(value=initial.typos_enabled)
+    precise_timing_var = tk.BooleanVar(value=initial.precise_timing)
+    burst_toggle_var = tk.BooleanVar(value=initial.burst)
+    editor_profile_var = tk.StringVar(value=initial.editor or 'none')
+    for var in (random_toggle_var, thinking_toggle_var, typo_toggle_var,
+                precise_timing_var, burst_toggle_var, editor_profile_var):
+        var.trace_add('write', rebuild_config)
 
     # Left column
     left_column = ttk.Frame(settings_frame)
@@ -147,6 +462,13 @@ def run_gui():
     )
     clipboard_option.pack(anchor=tk.W)
 
+    clipboard_replaces = ttk.Checkbutton(
+        left_column,
+        text="Clipboard replaces an open document",
+        variable=clipboard_replaces_var
+    )
+    clipboard_replaces.pack(anchor=tk.W)
+
     random_toggle = ttk.Checkbutton(
         left_column, 
         text="Add random letters", 
@@ -154,6 +476,27 @@ def run_gui():
     )
     random_toggle.pack(anchor=tk.W)
 
+    precise_timing_toggle = ttk.Checkbutton(
+        left_column, 
+        text="Precise timing (high WPM)", 
+        variable=precise_timing_var
+    )
+    precise_timing_toggle.pack(anchor=tk.W)
+
+    # Editor profile: type code exactly, letting the editor indent and close brackets
+    editor_frame = ttk.Frame(left_column)
+    editor_frame.pack(anchor=tk.W, pady=2)
+    editor_label = ttk.Label(editor_frame, text="Editor profile:")
+    editor_label.pack(side=tk.LEFT)
+    editor_combo = ttk.Combobox(
+        editor_frame,
+        textvariable=editor_profile_var,
+        values=['none'] + sorted(PROFILES),
+        state='readonly',
+        width=8
+    )
+    editor_combo.pack(side=tk.LEFT, padx=5)
+
     # Right column for other settings
     right_column = ttk.Frame(settings_frame)
     right_column.pack(side=tk.LEFT, padx=5)
@@ -164,14 +507,12 @@ def run_gui():
 
     min_speed_label = ttk.Label(speed_frame, text="Min typing speed (WPM):")
     min_speed_label.pack(side=tk.LEFT)
-    min_speed_entry = ttk.Entry(speed_frame, width=8)
-    min_speed_entry.insert(0, "40")
+    min_speed_entry = ttk.Entry(speed_frame, width=8, textvariable=setting_var('min_wpm'))
     min_speed_entry.pack(side=tk.LEFT, padx=5)
 
     max_speed_label = ttk.Label(speed_frame, text="Max typing speed (WPM):")
     max_speed_label.pack(side=tk.LEFT, padx=(10, 0))
-    max_speed_entry = ttk.Entry(speed_frame, width=8)
-    max_speed_entry.insert(0, "80")
+    max_speed_entry = ttk.Entry(speed_frame, width=8, textvariable=setting_var('max_wpm'))
     max_speed_entry.pack(side=tk.LEFT, padx=5)
 
     # Delay entry
@@ -179,8 +520,7 @@ def run_gui():
     delay_frame.pack(fill=tk.X, pady=2)
     delay_label = ttk.Label(delay_frame, text="Start delay (sec):")
     delay_label.pack(side=tk.LEFT)
-    delay_entry = ttk.Entry(delay_frame, width=8)
-    delay_entry.insert(0, "0.25")
+    delay_entry = ttk.Entry(delay_frame, width=8, textvariable=setting_var('delay'))
     delay_entry.pack(side=tk.LEFT, padx=5)
 
     # Thinking Pauses
@@ -201,24 +541,21 @@ def run_gui():
     min_pause_frame.pack(side=tk.LEFT, padx=5)
     min_pause_label = ttk.Label(min_pause_frame, text="Min pause (sec):")
     min_pause_label.pack(side=tk.LEFT)
-    min_pause_entry = ttk.Entry(min_pause_frame, width=6)
-    min_pause_entry.insert(0, "0.5")
+    min_pause_entry = ttk.Entry(min_pause_frame, width=6, textvariable=setting_var('min_pause'))
     min_pause_entry.pack(side=tk.LEFT, padx=2)
 
     max_pause_frame = ttk.Frame(pause_settings_frame)
     max_pause_frame.pack(side=tk.LEFT, padx=5)
     max_pause_label = ttk.Label(max_pause_frame, text="Max pause (sec):")
     max_pause_label.pack(side=tk.LEFT)
-    max_pause_entry = ttk.Entry(max_pause_frame, width=6)
-    max_pause_entry.insert(0, "2.0")
+    max_pause_entry = ttk.Entry(max_pause_frame, width=6, textvariable=setting_var('max_pause'))
     max_pause_entry.pack(side=tk.LEFT, padx=2)
 
     pause_freq_frame = ttk.Frame(pause_settings_frame)
     pause_freq_frame.pack(side=tk.LEFT, padx=5)
     pause_freq_label = ttk.Label(pause_freq_frame, text="Pause every N chars:")
     pause_freq_label.pack(side=tk.LEFT)
-    pause_freq_entry = ttk.Entry(pause_freq_frame, width=6)
-    pause_freq_entry.insert(0, "50")
+    pause_freq_entry = ttk.Entry(pause_freq_frame, width=6, textvariable=setting_var('pause_frequency'))
     pause_freq_entry.pack(side=tk.LEFT, padx=2)
 
     # Typo settings
@@ -237,10 +574,64 @@ def run_gui():
     typo_freq_label = ttk.Label(typo_freq_frame, text="Typo chance (%):")
     typo_freq_label.pack(side=tk.LEFT)
     global typo_freq_entry
-    typo_freq_entry = ttk.Entry(typo_freq_frame, width=6)
-    typo_freq_entry.insert(0, "30")
+    typo_freq_entry = ttk.Entry(typo_freq_frame, width=6, textvariable=setting_var('typo_chance'))
     typo_freq_entry.pack(side=tk.LEFT, padx=2)
 
+    # Burst mode settings
+    burst_frame = ttk.LabelFrame(main_frame, text="Burst Mode", padding=10)
+    burst_frame.pack(fill=tk.X, pady=5)
+
+    burst_toggle = ttk.Checkbutton(
+        burst_frame, 
+        text="Type as fast as possible (ignores pauses, typos and speed)", 
+        variable=burst_toggle_var
+    )
+    burst_toggle.pack(anchor=tk.W)
+
+    burst_settings_frame = ttk.Frame(burst_frame)
+    burst_settings_frame.pack(fill=tk.X, pady=5)
+
+    chunk_size_frame = ttk.Frame(burst_settings_frame)
+    chunk_size_frame.pack(side=tk.LEFT, padx=5)
+    chunk_size_label = ttk.Label(chunk_size_frame, text="Chunk size (chars):")
+    chunk_size_label.pack(side=tk.LEFT)
+    chunk_size_entry = ttk.Entry(chunk_size_frame, width=6, textvariable=setting_var('chunk_size'))
+    chunk_size_entry.pack(side=tk.LEFT, padx=2)
+
+    chunk_gap_frame = ttk.Frame(burst_settings_frame)
+    chunk_gap_frame.pack(side=tk.LEFT, padx=5)
+    chunk_gap_label = ttk.Label(chunk_gap_frame, text="Gap between chunks (sec):")
+    chunk_gap_label.pack(side=tk.LEFT)
+    chunk_gap_entry = ttk.Entry(chunk_gap_frame, width=6, textvariable=setting_var('chunk_gap'))
+    chunk_gap_entry.pack(side=tk.LEFT, padx=2)
+
+    # Named setting profiles
+    profile_frame = ttk.Frame(main_frame)
+    profile_frame.pack(fill=tk.X, pady=5)
+    profile_label = ttk.Label(profile_frame, text="Profile:")
+    profile_label.pack(side=tk.LEFT)
+    profile_var = tk.StringVar(value=last_profile)
+    profile_combo = ttk.Combobox(
+        profile_frame,
+        textvariable=profile_var,
+        values=sorted(profiles),
+        width=16
+    )
+    profile_combo.pack(side=tk.LEFT, padx=5)
+    profile_combo.bind('<<ComboboxSelected>>', select_profile)
+    save_profile_button = ttk.Button(profile_frame, text="Save profile", command=save_current_profile)
+    save_profile_button.pack(side=tk.LEFT)
+
+    # Estimated typing time, refreshed as settings change
+    eta_label = ttk.Label(main_frame, text="ETA: -")
+    eta_label.pack(pady=(5, 0))
+
+    def text_modified(event):
+        text_input.edit_modified(False)
+        schedule_text_rebuild()
+
+    text_input.bind('<<Modified>>', text_modified)
+
     # Buttons
     button_frame = ttk.Frame(main_frame)
     button_frame.pack(pady=10)
@@ -251,25 +642,55 @@ def run_gui():
         """
         # The hotkey (F9) also does this, but a button is convenient too
         from .typing_engine import start_typing_thread
+        flush_text_edits()
         start_typing_thread()
 
+    def pause_typing_callback():
+        """
+        Pause or resume the running session, keeping its position.
+        """
+        typing_engine.toggle_pause()
+
+    def resume_typing_callback():
+        """
+        Continue a stopped session from where it left off.
+        """
+        flush_text_edits()
+        typing_engine.start_typing_thread(resume=True)
+
+    def retype_typing_callback():
+        """
+        Type only the changes between the last session's text and the current one.
+        """
+        flush_text_edits()
+        typing_engine.start_typing_thread(retype=True)
+
     def cancel_typing_callback():
         """
         Cancel typing and close the application window.
         """
-        global stop_typing
-        stop_typing = True
+        typing_engine.stop()
         root.quit()
 
     start_button = ttk.Button(button_frame, text="Start (F9)", command=start_typing_callback)
     start_button.pack(side=tk.LEFT, padx=5)
 
+    pause_button = ttk.Button(button_frame, text="Pause (F10)", command=pause_typing_callback)
+    pause_button.pack(side=tk.LEFT, padx=5)
+
+    resume_button = ttk.Button(button_frame, text="Resume", command=resume_typing_callback)
+    resume_button.pack(side=tk.LEFT, padx=5)
+
+    retype_button = ttk.Button(button_frame, text="Retype changes", command=retype_typing_callback)
+    retype_button.pack(side=tk.LEFT, padx=5)
+
     cancel_button = ttk.Button(button_frame, text="Cancel (ESC)", command=cancel_typing_callback)
     cancel_button.pack(side=tk.LEFT, padx=5)
 
-    # Start the clipboard watcher
-    clipboard_thread = threading.Thread(target=update_clipboard_loop, daemon=True)
-    clipboard_thread.start()
+    # Start the clipboard watcher; it only reads while the option is on
+    clipboard_watcher = ClipboardWatcher(on_clipboard_change).start()
+    clipboard_option_var.trace_add(
+        'write', lambda *args: clipboard_watcher.set_active(clipboard_option_var.get()))
 
-    # Finally, run the main loop
-    root.mainloop()
+    rebuild_config()
+    return root
@@ -0,0 +1,175 @@
+"""
+Global hotkey registry.
+pynput calls the listener callbacks inside the system input hook, so
+every key the user types anywhere waits for them. HotkeyRegistry
+compiles chord strings such as 'f9' or 'ctrl+1' once into a frozen
+table keyed by (modifier bits, key name); each event then costs a
+couple of attribute reads and dict lookups. Keys held down (auto-repeat)
+fire once, and the bound actions run on a worker thread, never in the
+hook itself.
+
+Bindings are configurable: load_bindings reads chord -> action name
+overrides from a small JSON file. The hotkey listener is the first
+thing started, so this module keeps its own imports light.
+"""
+
+import os
+import queue
+import threading
+import time
+from types import MappingProxyType
+
+# Where user hotkey bindings are saved
+HOTKEYS_PATH = os.path.join(os.path.expanduser('~'), '.autotyper_hotkeys.json')
+
+DEFAULT_BINDINGS = {
+    'f9': 'start',
+    'f10': 'pause',
+    'esc': 'stop',
+}
+
+CTRL = 1
+SHIFT = 2
+ALT = 4
+CMD = 8
+
+# pynput Key names of the modifier keys
+MODIFIER_BITS = {
+    'ctrl': CTRL, 'ctrl_l': CTRL, 'ctrl_r': CTRL,
+    'shift': SHIFT, 'shift_l': SHIFT, 'shift_r': SHIFT,
+    'alt': ALT, 'alt_l': ALT, 'alt_r': ALT, 'alt_gr': ALT,
+    'cmd': CMD, 'cmd_l': CMD, 'cmd_r': CMD,
+}
+
+# Other spellings accepted in chord strings
+KEY_ALIASES = {
+    'control': 'ctrl', 'escape': 'esc', 'return': 'enter', 'win': 'cmd',
+    'super': 'cmd', 'meta': 'cmd', 'option': 'alt', 'del': 'delete',
+}
+
+def key_name(key):
+    """
+    The name of a pynput key: Key members by their name ('f9', 'ctrl_l'),
+    character keys by their lowercase character. Characters changed by
+    Ctrl (control codes, or no char at all) are mapped back to the
+    letter or digit of their virtual key code.
+    """
+    name = getattr(key, 'name', None)
+    if name is not None:
+        return name
+    char = key.char
+    if char is not None:
+        if char < ' ':
+            return chr(ord(char) + 96)  # Ctrl+A arrives as '\x01'
+        return char.lower()
+    vk = getattr(key, 'vk', None)
+    if vk is not None and (48 <= vk <= 57 or 65 <= vk <= 90):
+        return chr(vk).lower()
+    return vk
+
+def parse_chord(chord):
+    """Parse 'ctrl+shift+f9' into (modifier bits, key name)."""
+    bits = 0
+    key = None
+    for part in chord.lower().replace(' ', '').split('+'):
+        part = KEY_ALIASES.get(part, part)
+        if part in MODIFIER_BITS:
+            bits |= MODIFIER_BITS[part]
+        elif key is None and part:
+            key = part
+        else:
+            raise ValueError(f"Invalid hotkey {chord!r}: needs exactly one non-modifier key")
+    if key is None:
+        raise ValueError(f"Invalid hotkey {chord!r}: needs exactly one non-modifier key")
+    return bits, key
+
+def load_bindings(path=HOTKEYS_PATH):
+    """DEFAULT_BINDINGS updated with the chord -> action entries saved at path."""
+    import json
+    bindings = dict(DEFAULT_BINDINGS)
+    try:
+        with open(path, encoding='utf-8') as f:
+            saved = json.load(f)
+    except FileNotFoundError:
+        return bindings
+    except (OSError, ValueError) as e:
+        print(f"Could not read hotkeys from {path}: {e}")
+        return bindings
+    # Rebinding an action replaces its default chord
+    actions = set(saved.values())
+    bindings = {chord: action for chord, action in bindings.items() if action not in actions}
+    bindings.update(saved)
+    return bindings
+
+def save_bindings(bindings, path=HOTKEYS_PATH):
+    import json
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(bindings, f, indent=2)
+
+class HotkeyRegistry:
+    """
+    Matches pynput key events against bindings (chord -> action name)
+    and runs actions[name] on a worker thread. Use on_press / on_release
+    as the listener's callbacks.
+
+    A chord fires when its key goes down with exactly its modifiers
+    held. It does not fire again until the key is released (auto-repeat)
+    nor within repeat_interval seconds of firing, which also catches
+    platforms that repeat with release/press pairs.
+    """
+
+    def __init__(self, bindings, actions, repeat_interval=0.2):
+        table = {}
+        for chord, action in bindings.items():
+            if action not in actions:
+                raise ValueError(f"Unknown hotkey action {action!r} for {chord!r}")
+            table[parse_chord(chord)] = actions[action]
+        self.table = MappingProxyType(table)
+        self.repeat_interval = repeat_interval
+        self._keys = frozenset(key for bits, key in table)
+        self._modifiers = 0
+        self._down = set()
+        self._last_fired = {}
+        self._queue = queue.SimpleQueue()
+        self._worker = None
+
+    def on_press(self, key):
+        name = key_name(key)
+        bit = MODIFIER_BITS.get(name)
+        if bit is not None:
+            self._modifiers |= bit
+            return
+        if name not in self._keys or name in self._down:
+            return
+        self._down.add(name)
+        chord = (self._modifiers, name)
+        action = self.table.get(chord)
+        if action is None:
+            return
+        now = time.monotonic()
+        if now - self._last_fired.get(chord, -self.repeat_interval) < self.repeat_interval:
+            return
+        self._last_fired[chord] = now
+        self._dispatch(action)
+
+    def on_release(self, key):
+        name = key_name(key)
+        bit = MODIFIER_BITS.get(name)
+        if bit is not None:
+            self._modifiers &= ~bit
+        else:
+            self._down.discard(name)
+
+    def _dispatch(self, action):
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._work, daemon=True)
+            self._worker.start()
+        self._queue.put(action)
+
+    def _work(self):
+        while True:
+            action = self._queue.get()
+            try:
+                action()
+            except Exception as e:
+                print(f"Hotkey action failed: {e}")
@@ -0,0 +1,188 @@
+"""
+Single-worker typing job queue.
+Every start request (F9, the Start button, scripts) becomes a job on a
+bounded queue served by one worker thread, so sessions never run
+concurrently and repeated hotkey presses cannot pile up threads.
+"""
+
+import itertools
+import logging
+import threading
+from collections import deque
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+CANCELLED = 'cancelled'
+FAILED = 'failed'
+
+log = logging.getLogger(__name__)
+
+def _job_key(config):
+    """Hashable identity of a job config, used to spot duplicates."""
+    items = []
+    for name, value in sorted(config.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = id(value)
+        items.append((name, value))
+    return tuple(items)
+
+class TypingJob:
+    """One queued typing session: the type_text keyword config and its state."""
+    __slots__ = ('id', 'config', 'key', 'status', 'result', 'error')
+
+    def __init__(self, job_id, config):
+        self.id = job_id
+        self.config = config
+        self.key = _job_key(config)
+        self.status = PENDING
+        self.result = None
+        self.error = None
+
+    def __repr__(self):
+        return f"TypingJob(id={self.id}, status={self.status!r})"
+
+class TypingJobQueue:
+    """
+    Bounded FIFO of TypingJobs with a single worker thread.
+
+    submit() returns the new job, the already pending identical job, or
+    None when the queue is full. Pending jobs can be listed and cancelled
+    one by one; cancelling the running job stops it through the engine's
+    control signals.
+    """
+
+    def __init__(self, maxsize=8, runner=None):
+        self.maxsize = maxsize
+        self.runner = runner
+        self._pending = deque()
+        self._running = None
+        self._cond = threading.Condition()
+        self._ids = itertools.count(1)
+        self._worker = None
+        self._closed = False
+
+    def submit(self, config):
+        with self._cond:
+            if self._closed:
+                return None
+            key = _job_key(config)
+            for job in self._pending:
+                if job.key == key:
+                    return job
+            if len(self._pending) >= self.maxsize:
+                return None
+            job = TypingJob(next(self._ids), config)
+            self._pending.append(job)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._work, daemon=True)
+                self._worker.start()
+            self._cond.notify()
+            return job
+
+    def list_jobs(self):
+        """The running job (if any) followed by pending jobs, in order."""
+        with self._cond:
+            jobs = list(self._pending)
+            if self._running is not None:
+                jobs.insert(0, self._running)
+            return jobs
+
+    def get(self, job_id):
+        for job in self.list_jobs():
+            if job.id == job_id:
+                return job
+        return None
+
+    def wait(self, job, timeout=None):
+        """Wait until job has finished (done, failed or cancelled); False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: job.status not in (PENDING, RUNNING), timeout)
+
+    def wait_finished(self, job, timeout=None):
+        """
+        Wait until job has left the queue, neither pending nor running; a
+        cancelled job may still be stopping after wait(). False on timeout.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: job is not self._running and job not in self._pending, timeout)
+
+    def cancel(self, job_id):
+        """Cancel a pending or running job. Returns False if it was not found."""
+        with self._cond:
+            if self._running is not None and self._running.id == job_id:
+                self._running.status = CANCELLED
+                self._stop_running()
+                return True
+            for job in self._pending:
+                if job.id == job_id:
+                    self._pending.remove(job)
+                    job.status = CANCELLED
+                    self._cond.notify_all()
+                    return True
+        return False
+
+    def cancel_all(self):
+        """Drop every pending job and stop the running one."""
+        with self._cond:
+            for job in self._pending:
+                job.status = CANCELLED
+            self._pending.clear()
+            self._cond.notify_all()
+            if self._running is not None:
+                self._running.status = CANCELLED
+                self._stop_running()
+
+    def shutdown(self):
+        """Cancel everything and let the worker thread exit."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self.cancel_all()
+
+    def _stop_running(self):
+        from . import typing_engine
+        typing_engine.control.stop()
+
+    def _reset_control(self):
+        from . import typing_engine
+        typing_engine.control.reset()
+
+    def _run(self, job):
+        if self.runner is not None:
+            return self.runner(**job.config)
+        from . import typing_engine
+        # Signals were already cleared in _work; clearing them again here
+        # would undo a cancel that came in since
+        return typing_engine.run_job(reset_control=False, **job.config)
+
+    def _work(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                job = self._running = self._pending.popleft()
+                # Clear the previous session's signals before the job counts
+                # as running, so cancel() from now on always reaches it
+                self._reset_control()
+                job.status = RUNNING
+            try:
+                job.result = self._run(job)
+            except Exception as e:
+                job.error = e
+                job.status = FAILED
+                log.exception("Typing job %s failed", job.id)
+            finally:
+                with self._cond:
+                    if job.status == RUNNING:
+                        job.status = DONE
+                    self._running = None
+                    self._cond.notify_all()
+
+job_queue = TypingJobQueue()
@@ -0,0 +1,80 @@
+"""
+Character to key-action resolution.
+resolve() works out once per distinct character and layout which keys
+to tap, and keeps the answer in a bounded cache shared by all sinks and
+sessions. XTestSink uses it to reach dead-key characters its keymap
+lacks; PynputSink only uses it for dead keys and otherwise leaves keysym
+and modifier lookup to pynput.
+
+An action sequence is a tuple of taps (code, shifted, dead):
+- code: the unshifted character of the key to tap (or a special key
+  code from typing_plan), as a code point; for a dead key, its accent
+- shifted: hold Shift for the tap
+- dead: the key is a dead key, tapped for its accent
+Plain letters resolve to a single unshifted tap, capitals and symbols
+to a shifted tap of their key, and accented letters missing from the
+layout to a dead key tap followed by the base letter where the layout
+has a matching dead key. resolve() returns None for characters it
+cannot place; sinks type those through their own fallback path.
+"""
+
+import unicodedata
+from functools import lru_cache
+
+from .typing_plan import (
+    BACKSPACE, TAB, ENTER, SPACE, SHIFT_TAB, DELETE, LEFT, RIGHT, UP, HOME, END,
+)
+from .layouts import get_layout
+
+# Distinct (code, layout) pairs kept; plenty for any real text
+CACHE_SIZE = 1024
+
+# Combining marks and the dead key that produces them
+DEAD_KEY_FOR_MARK = {
+    '\u0300': '`',  # grave
+    '\u0301': '´',  # acute
+    '\u0302': '^',  # circumflex
+    '\u0308': '¨',  # diaeresis
+}
+
+_SPECIAL = frozenset((BACKSPACE, TAB, ENTER, SPACE, DELETE, LEFT, RIGHT, UP, HOME, END))
+
+def _tap(char, geometry):
+    """The tap typing char on its own key, or None if char is not on the layout."""
+    key = geometry.key_of.get(char)
+    if key is None:
+        return None
+    base = geometry.levels[key][0]
+    return (ord(base), geometry.shifted[char], False)
+
+def _dead_tap(accent, geometry):
+    """The tap of the dead key for accent; Shift as the layout has it (AZERTY ¨ is Shift+^)."""
+    return (ord(accent), geometry.shifted.get(accent, False), True)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def resolve(code, layout='qwerty'):
+    """Return the taps that type plan key code on layout, or None."""
+    if code in _SPECIAL:
+        return ((code, False, False),)
+    if code == SHIFT_TAB:
+        return ((TAB, True, False),)
+    char = chr(code)
+    geometry = get_layout(layout)
+
+    if char in geometry.dead_keys:
+        # The accent on its own: the dead key, then space
+        return (_dead_tap(char, geometry), (SPACE, False, False))
+
+    tap = _tap(char, geometry)
+    if tap is not None:
+        return (tap,)
+
+    # Accented letter: dead key + base letter
+    decomposed = unicodedata.normalize('NFD', char)
+    if len(decomposed) == 2:
+        base, mark = decomposed
+        dead = DEAD_KEY_FOR_MARK.get(mark)
+        base_tap = _tap(base, geometry)
+        if dead in geometry.dead_keys and base_tap is not None:
+            return (_dead_tap(dead, geometry), base_tap)
+    return None
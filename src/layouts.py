@@ -0,0 +1,135 @@
+"""
+Keyboard geometry for realistic typos and timing.
+Each supported layout is described by its rows of keys; from that a
+KeyboardGeometry index is built once (lazily, on first use) holding key
+coordinates, neighbor sets and a pairwise distance table, so typo and
+timing code only does constant-time lookups.
+"""
+
+import math
+from array import array
+
+# Rows as (unshifted chars, shifted chars, x offset of the first key).
+# Offsets follow the usual row stagger of a physical keyboard, in key widths.
+LAYOUT_ROWS = {
+    'qwerty': (
+        ("`1234567890-=", "~!@#$%^&*()_+", 0.0),
+        ("qwertyuiop[]\\", "QWERTYUIOP{}|", 1.5),
+        ("asdfghjkl;'", "ASDFGHJKL:\"", 1.75),
+        ("zxcvbnm,./", "ZXCVBNM<>?", 2.25),
+    ),
+    'azerty': (
+        ("²&é\"'(-è_çà)=", "²1234567890°+", 0.0),
+        ("azertyuiop^$", "AZERTYUIOP¨£", 1.5),
+        ("qsdfghjklmù*", "QSDFGHJKLM%µ", 1.75),
+        ("<wxcvbn,;:!", ">WXCVBN?./§", 1.25),
+    ),
+    'qwertz': (
+        ("^1234567890ß´", "°!\"§$%&/()=?`", 0.0),
+        ("qwertzuiopü+", "QWERTZUIOPÜ*", 1.5),
+        ("asdfghjklöä#", "ASDFGHJKLÖÄ'", 1.75),
+        ("<yxcvbnm,.-", ">YXCVBNM;:_", 1.25),
+    ),
+    'dvorak': (
+        ("`1234567890[]", "~!@#$%^&*(){}", 0.0),
+        ("',.pyfgcrl/=\\", "\"<>PYFGCRL?+|", 1.5),
+        ("aoeuidhtns-", "AOEUIDHTNS_", 1.75),
+        (";qjkxbmwvz", ":QJKXBMWVZ", 2.25),
+    ),
+    'colemak': (
+        ("`1234567890-=", "~!@#$%^&*()_+", 0.0),
+        ("qwfpgjluy;[]\\", "QWFPGJLUY:{}|", 1.5),
+        ("arstdhneio'", "ARSTDHNEIO\"", 1.75),
+        ("zxcvbkm,./", "ZXCVBKM<>?", 2.25),
+    ),
+}
+
+# Characters that are dead keys (accent first, then the letter) per layout
+DEAD_KEYS = {
+    'azerty': "^¨",
+    'qwertz': "^´`",
+}
+
+# Keys whose centres are at most this far apart (in key widths) are neighbors
+NEIGHBOR_DISTANCE = 1.3
+
+class KeyboardGeometry:
+    """
+    Precomputed geometry of one layout.
+
+    - key_of[char]: index of the physical key producing char
+    - shifted[char]: whether char needs Shift
+    - coords[key]: (x, y) centre of each key
+    - levels[key]: (unshifted, shifted) chars of each key
+    - neighbors[char]: chars on adjacent keys, at the same shift level
+    - dead_keys: chars that are dead keys on this layout
+    - distance(a, b): centre distance between the keys of a and b
+    """
+
+    def __init__(self, name, rows, dead_keys=''):
+        self.name = name
+        self.dead_keys = frozenset(dead_keys)
+        self.key_of = {}
+        self.shifted = {}
+        self.coords = []
+        self.levels = []
+
+        for y, (lower, upper, offset) in enumerate(rows):
+            for x, (low, up) in enumerate(zip(lower, upper)):
+                key = len(self.coords)
+                self.coords.append((offset + x, float(y)))
+                self.levels.append((low, up))
+                self.key_of.setdefault(low, key)
+                self.shifted.setdefault(low, False)
+                if up != low:
+                    self.key_of.setdefault(up, key)
+                    self.shifted.setdefault(up, True)
+
+        n = len(self.coords)
+        self.size = n
+        self.distances = array('d', bytes(8 * n * n))
+        for a, (ax, ay) in enumerate(self.coords):
+            for b, (bx, by) in enumerate(self.coords):
+                self.distances[a * n + b] = math.hypot(ax - bx, ay - by)
+
+        adjacent = [
+            [b for b in range(n)
+             if b != a and self.distances[a * n + b] <= NEIGHBOR_DISTANCE]
+            for a in range(n)
+        ]
+        self.neighbors = {}
+        for char, key in self.key_of.items():
+            level = 1 if self.shifted[char] else 0
+            self.neighbors[char] = tuple(self.levels[b][level] for b in adjacent[key])
+
+    def distance(self, a, b):
+        """Distance between the keys for chars a and b, or None if either is unknown."""
+        key_a = self.key_of.get(a)
+        key_b = self.key_of.get(b)
+        if key_a is None or key_b is None:
+            return None
+        return self.distances[key_a * self.size + key_b]
+
+    def bigram_factor(self, a, b):
+        """
+        Delay multiplier for typing b right after a: close keys are a
+        little faster, far reaches a little slower (0.75 .. 1.5).
+        Unknown characters get a neutral 1.0.
+        """
+        d = self.distance(a, b)
+        if d is None:
+            return 1.0
+        return min(1.5, 0.75 + 0.125 * d)
+
+_geometries = {}
+
+def get_layout(name='qwerty'):
+    """Return the KeyboardGeometry for a layout, building it on first use."""
+    geometry = _geometries.get(name)
+    if geometry is None:
+        try:
+            rows = LAYOUT_ROWS[name]
+        except KeyError:
+            raise ValueError(f"Unknown keyboard layout: {name!r}")
+        geometry = _geometries[name] = KeyboardGeometry(name, rows, DEAD_KEYS.get(name, ''))
+    return geometry
@@ -2,12 +2,19 @@
 Main entry point for the AutoTyper application.
 Handles overall startup, subscription checks (placeholder),
 and launches the GUI.
+
+Startup is ordered so the hotkeys work as early as possible: the
+listener only needs pynput, and goes live before tkinter, the typing
+engine and the window are loaded. Each step is timed (see startup.py);
+--startup-report prints the timings and exits without running the GUI.
+--control-socket also serves the JSON-RPC control API (see daemon.py).
 """
 
-import threading
-from . import gui
-from . import typing_engine
-from . import keyboard_utils
+import argparse
+import json
+import sys
+
+from .startup import StartupTimer, DEFAULT_BUDGET
 
 # Placeholder for a future subscription verification mechanism
 def verify_subscription():
@@ -19,24 +26,77 @@ def verify_subscription():
     # TODO: Implement actual subscription check logic
     return True
 
-def main():
+def start(timer):
+    """
+    Run the startup steps through timer: hotkey listener first, then the
+    typing engine and the window. Returns the gui module, window built.
+    """
+    keyboard_utils = timer.import_module('.keyboard_utils', __package__)
+    with timer.step("start hotkey listener"):
+        listener = keyboard_utils.create_listener()
+        listener.start()
+        listener.wait()
+    timer.mark('hotkeys live')
+
+    timer.import_module('.typing_engine', __package__)
+    gui = timer.import_module('.gui', __package__)
+    with timer.step("build window"):
+        gui.build_gui()
+        gui.root.update()
+    timer.mark('window ready')
+    return gui
+
+def main(argv=None):
     """
     Main startup function. Verifies subscription (placeholder) then runs the GUI.
     """
+    parser = argparse.ArgumentParser(description="Auto Typer")
+    parser.add_argument('--startup-report', action='store_true',
+                        help="print startup timings and exit instead of running the GUI")
+    parser.add_argument('--budget', type=float,
+                        help="with --startup-report, fail if the hotkeys take longer "
+                             f"than this many seconds to go live (default {DEFAULT_BUDGET['hotkeys live']})")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--control-socket', nargs='?', const='', metavar='PATH',
+                        help="serve the local control API (see daemon.py), at PATH "
+                             "or the default per-user socket")
+    args = parser.parse_args(argv)
+
+    timer = StartupTimer()
+
     # Subscription check (placeholder)
     if not verify_subscription():
         print("Subscription not valid. Exiting application.")
         return
-    
-    # Initialize the global listener in its own thread
-    listener_thread = threading.Thread(
-        target=keyboard_utils.start_listener, 
-        daemon=True
-    )
-    listener_thread.start()
-    
+
+    gui = start(timer)
+
+    if args.startup_report:
+        gui.root.destroy()
+        if args.json:
+            print(json.dumps(timer.report(), indent=2))
+        else:
+            timer.print_report()
+        budget = dict(DEFAULT_BUDGET)
+        if args.budget is not None:
+            budget['hotkeys live'] = args.budget
+        late = timer.over_budget(budget)
+        for name, seconds in late.items():
+            print(f"over budget: {name} after {seconds * 1000:.1f} ms "
+                  f"(budget {budget[name] * 1000:.0f} ms)", file=sys.stderr)
+        sys.exit(1 if late else 0)
+
+    server = None
+    if args.control_socket is not None:
+        from .daemon import ControlServer
+        server = ControlServer(args.control_socket or None).start()
+
     # Run the GUI
-    gui.run_gui()
+    try:
+        gui.root.mainloop()
+    finally:
+        if server is not None:
+            server.stop()
 
 # Standard Python convention for script entry
 if __name__ == "__main__":
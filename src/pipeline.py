@@ -0,0 +1,349 @@
+"""
+Generator pipeline that turns streamed text into keystroke events.
+Planning is split into small lazy stages, each taking an iterator and
+a PipelineContext and yielding items for the next stage:
+
+    normalize -> inject_letters -> tokenize -> place_pauses
+              -> place_typos -> emit_events
+
+Text stages pass str chunks along. From tokenize on, items are
+(op, value) tuples:
+
+    (WORD, word)      a word starts (its CHARs follow)
+    (CHAR, char)      a character of the text
+    (NEWLINE, None)   a line break
+    (PAUSE, seconds)  thinking pause before the next CHAR
+    (TYPO, wrong)     wrong keys typed and erased before the next CHAR
+    (KEY, code)       a key without a character of its own (editor mode)
+
+emit_events turns ops into (key code, delay before key, kind) events.
+Custom stages can be spliced into the list from default_stages();
+no stage holds more than a chunk or a word at a time.
+"""
+
+import random
+import string
+
+from .sources import iter_tokens
+from .typing_plan import (
+    BACKSPACE, ENTER, SPACE, SHIFT_TAB, KEY_EVENT, TYPO_EVENT, PAUSE_EVENT, wpm_to_cps,
+)
+from .editor import plan_keys
+from .retype import plan_edits
+from .layouts import get_layout
+from .typo_model import TypoEngine
+
+# Op codes
+WORD = 'word'
+CHAR = 'char'
+NEWLINE = 'newline'
+PAUSE = 'pause'
+TYPO = 'typo'
+KEY = 'key'
+
+DEFAULT_SETTINGS = {
+    'min_wpm': 40.0,
+    'max_wpm': 80.0,
+    'thinking_enabled': True,
+    'min_pause': 0.5,
+    'max_pause': 2.0,
+    'pause_frequency': 50,
+    'typos_enabled': True,
+    'typo_chance': 0.3,
+    'random_letters': False,
+    'timing': None,
+    'layout': 'qwerty',
+    'bigram_timing': False,
+    'typo_kinds': None,
+    'editor': None,
+    'retype_from': None,
+}
+
+class PipelineContext:
+    """Settings and the shared random generator for one planning run."""
+
+    def __init__(self, rng, **settings):
+        unknown = set(settings) - set(DEFAULT_SETTINGS)
+        if unknown:
+            raise TypeError(f"Unknown typing settings: {sorted(unknown)}")
+        self.rng = rng
+        self.settings = dict(DEFAULT_SETTINGS, **settings)
+
+    def __getitem__(self, name):
+        return self.settings[name]
+
+def normalize(chunks, ctx):
+    """Turn Windows (\\r\\n) and old Mac (\\r) line endings into \\n."""
+    pending_cr = False
+    for chunk in chunks:
+        if pending_cr:
+            chunk = '\r' + chunk
+        pending_cr = chunk.endswith('\r')
+        if pending_cr:
+            # Might be the first half of a \r\n split across chunks
+            chunk = chunk[:-1]
+        if '\r' in chunk:
+            chunk = chunk.replace('\r\n', '\n').replace('\r', '\n')
+        if chunk:
+            yield chunk
+    if pending_cr:
+        yield '\n'
+
+def inject_letters(chunks, ctx):
+    """
+    Randomly insert extra letters into the text (random_letters).
+    The stage draws from its own generator, seeded from ctx.rng when the
+    pipeline is built: it runs a chunk ahead of the stages after it, so
+    sharing ctx.rng would make the plan depend on the chunk sizes.
+    """
+    if not ctx['random_letters']:
+        return iter(chunks)
+    return _inject_letters(chunks, random.Random(ctx.rng.getrandbits(64)))
+
+def _inject_letters(chunks, rng):
+    randint = rng.randint
+    choice = rng.choice
+    typed = 0
+    for chunk in chunks:
+        modified = []
+        for char in chunk:
+            modified.append(char)
+            typed += 1
+            # Randomly inject a letter
+            if randint(8, 15) == typed % randint(8, 15):
+                modified.append(choice(string.ascii_letters))
+                typed += 1
+        yield ''.join(modified)
+
+def tokenize(chunks, ctx):
+    """
+    Split text chunks into WORD / CHAR / NEWLINE ops.
+    With an editor profile, the text is kept exactly as is and becomes
+    the CHAR / KEY ops of editor.plan_keys instead; with retype_from,
+    the CHAR / KEY ops of the edits (see retype_edits). Neither
+    produces WORD ops, so no typos are placed.
+    """
+    editor = ctx['editor']
+    retype_from = ctx['retype_from']
+    if editor is not None or retype_from is not None:
+        if retype_from is None:
+            codes = plan_keys(chunks, editor)
+        elif editor is None:
+            codes = retype_edits(retype_from, chunks, ctx)
+        else:
+            raise ValueError("retype_from cannot be combined with an editor profile")
+        for code in codes:
+            if SPACE <= code < SHIFT_TAB:
+                yield CHAR, chr(code)
+            else:
+                yield KEY, code
+        return
+    for token in iter_tokens(chunks):
+        if token == '\n':
+            yield NEWLINE, None
+            continue
+        yield WORD, token
+        for char in token:
+            yield CHAR, char
+
+def render(chunks):
+    """
+    Yield the text normal mode leaves in the target for the text chunks:
+    words one space apart, and a blank line (Enter twice) per line break.
+    """
+    words_in_line = 0
+    for token in iter_tokens(chunks):
+        if token == '\n':
+            words_in_line = 0
+            yield '\n\n'
+        else:
+            yield ' ' + token if words_in_line else token
+            words_in_line += 1
+
+def retype_edits(old, chunks, ctx):
+    """
+    Key codes turning old, the text in the target, into what normal mode
+    would type for chunks (see render); old gets the same line ending
+    normalization. The rendering is streamed against old and only kept
+    from where the two differ, so an unchanged document is never held
+    twice and costs no keys.
+    """
+    old = ''.join(normalize((old,), ctx))
+    matched = 0
+    rest = []
+    for piece in render(chunks):
+        if rest:
+            rest.append(piece)
+        elif old.startswith(piece, matched):
+            matched += len(piece)
+        else:
+            common = 0
+            for a, b in zip(piece, old[matched:matched + len(piece)]):
+                if a != b:
+                    break
+                common += 1
+            matched += common
+            rest.append(piece[common:])
+    # Diff from the start of the line the texts part on, so the cursor
+    # moves (Home, Up) see the same columns as in the whole text
+    start = old.rfind('\n', 0, matched) + 1
+    return plan_edits(old[start:], old[start:matched] + ''.join(rest))
+
+def place_pauses(ops, ctx):
+    """Insert a thinking PAUSE before every pause_frequency-th character."""
+    if not ctx['thinking_enabled'] or ctx['timing'] is not None:
+        # A timing model places its own pauses in emit_events
+        yield from ops
+        return
+    uniform = ctx.rng.uniform
+    frequency = ctx['pause_frequency']
+    min_pause = ctx['min_pause']
+    max_pause = ctx['max_pause']
+    chars_typed = 0
+    for op in ops:
+        if op[0] == CHAR:
+            chars_typed += 1
+            if chars_typed % frequency == 0:
+                yield PAUSE, uniform(min_pause, max_pause)
+        yield op
+
+def place_typos(ops, ctx):
+    """
+    For a typo_chance share of words (3+ letters), pick one position and
+    insert a TYPO before that character, chosen by a TypoEngine.
+    """
+    if not ctx['typos_enabled']:
+        yield from ops
+        return
+    rng = ctx.rng
+    typo_chance = ctx['typo_chance']
+    typos = TypoEngine(ctx['layout'], kind_weights=ctx['typo_kinds'], rng=rng)
+    word = ''
+    typo_pos = -1
+    i = 0
+    for op in ops:
+        kind = op[0]
+        if kind == WORD:
+            word = op[1]
+            i = 0
+            # Decide if a typo will be made in this word
+            make_typo_here = len(word) >= 3 and rng.random() < typo_chance
+            typo_pos = rng.randint(0, len(word)-1) if make_typo_here else -1
+        elif kind == CHAR:
+            if i == typo_pos:
+                next_char = word[i + 1] if i + 1 < len(word) else ''
+                yield TYPO, typos.decide(op[1], next_char)[1]
+            i += 1
+        yield op
+
+def emit_events(ops, ctx):
+    """
+    Assign timing and yield (key code, delay before key, event kind) events.
+    Typing speed changes every few words and after each thinking pause;
+    with a timing model, delays and pauses come from it instead.
+    The kind tells what the wait before a key was spent on: typos
+    (wrong keys, backspaces and the hesitation around them), thinking
+    pauses, or plain typing (see typing_plan.KEY_EVENT).
+    """
+    rng = ctx.rng
+    min_cps = wpm_to_cps(ctx['min_wpm'])
+    max_cps = wpm_to_cps(ctx['max_wpm'])
+    timing = ctx['timing']
+    timings = timing.iter_timings(rng) if timing is not None else None
+    bigram_timing = ctx['bigram_timing']
+    bigram_factor = get_layout(ctx['layout']).bigram_factor
+
+    current_speed = rng.uniform(min_cps, max_cps)
+    current_delay = 1 / current_speed
+    speed_change_counter = 0
+    words_in_line = 0
+    word = ''
+    i = 0
+    wait = 0.0  # Time accumulated since the last key press
+    wait_kind = KEY_EVENT  # What that time was spent on; pauses outrank typos
+
+    for kind, value in ops:
+        if kind == CHAR:
+            if timings is not None:
+                current_delay, pause = next(timings)
+                if pause:
+                    wait += pause
+                    wait_kind = PAUSE_EVENT
+
+            # Press the actual character
+            yield ord(value), wait, wait_kind
+            wait = current_delay
+            wait_kind = KEY_EVENT
+            i += 1
+            if bigram_timing and i < len(word):
+                wait *= bigram_factor(value, word[i])
+
+        elif kind == WORD:
+            # Press space between words on the same line
+            if words_in_line:
+                yield SPACE, wait, wait_kind
+                wait = current_delay
+                wait_kind = KEY_EVENT
+            words_in_line += 1
+            word = value
+            i = 0
+
+            # Randomly change typing speed every few words
+            if timings is None:
+                speed_change_counter += 1
+                if speed_change_counter >= rng.randint(3, 8):
+                    current_speed = rng.uniform(min_cps, max_cps)
+                    speed_change_counter = 0
+                current_delay = 1 / current_speed
+
+        elif kind == NEWLINE:
+            # Press Enter twice after each line (paragraph separation)
+            yield ENTER, wait, wait_kind
+            yield ENTER, current_delay, KEY_EVENT
+            wait = current_delay * 2
+            wait_kind = KEY_EVENT
+            words_in_line = 0
+
+        elif kind == KEY:
+            yield value, wait, wait_kind
+            wait = current_delay
+            wait_kind = KEY_EVENT
+            # New line, new speed
+            if value == ENTER and timings is None:
+                current_speed = rng.uniform(min_cps, max_cps)
+                current_delay = 1 / current_speed
+
+        elif kind == PAUSE:
+            wait += value
+            wait_kind = PAUSE_EVENT
+            # Randomize speed again after pause
+            current_speed = rng.uniform(min_cps, max_cps)
+            current_delay = 1 / current_speed
+
+        elif kind == TYPO:
+            # Type the typo
+            wait_kind = max(wait_kind, TYPO_EVENT)
+            for t_char in value:
+                yield ord(t_char), wait, wait_kind
+                wait = current_delay
+                wait_kind = TYPO_EVENT
+
+            # Small pause before correction
+            wait += rng.uniform(0.2, 0.4)
+
+            # Delete the typo
+            for _ in range(len(value)):
+                yield BACKSPACE, wait, TYPO_EVENT
+                wait = current_delay * 0.5
+
+            wait += rng.uniform(0.1, 0.2)
+
+def default_stages():
+    """The standard stage list; copy and extend it to add custom stages."""
+    return [normalize, inject_letters, tokenize, place_pauses, place_typos, emit_events]
+
+def run_pipeline(items, stages, ctx):
+    """Chain the stages lazily over items and return the final iterator."""
+    for stage in stages:
+        items = stage(items, ctx)
+    return items
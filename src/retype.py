@@ -0,0 +1,237 @@
+"""
+Diff-based incremental retyping.
+Given the text already in the target window and a new target text,
+plan_edits works out a small edit script (a diff by lines, then tokens,
+then characters) and emits only the cursor movement, deletions and
+insertions needed to turn one into the other, instead of typing the
+whole document again.
+
+The text already typed is usually known from the engine's own record
+of a session (a TypingCheckpoint, see typed_text). Edits assume a plain
+text field: Home and End go to the start and end of the line, there is
+no soft wrapping, and nothing is auto-indented or auto-closed. Typing
+starts with the cursor where the engine left it, at the end of the text.
+"""
+
+import difflib
+import random
+import re
+from itertools import accumulate
+
+from .typing_plan import (
+    BACKSPACE, TAB, ENTER, SHIFT_TAB, DELETE, LEFT, RIGHT, UP, HOME, END,
+    iter_events,
+)
+
+# Words, single newlines, other whitespace runs and single punctuation marks
+TOKEN_RE = re.compile(r'\w+|\n|[^\S\n]+|[^\w\s]')
+
+# Changed blocks of lines with more tokens than this are replaced whole
+TOKEN_LIMIT = 5000
+# Replaced spans up to this many characters are refined to a character diff
+REFINE_LIMIT = 200
+
+class TextBuffer:
+    """
+    A plain text field: replays key codes the way a simple editor
+    would and returns the result from text(). A gap buffer, so keys at
+    the cursor cost O(1) however long the text is.
+    """
+
+    def __init__(self, text=''):
+        self.left = list(text)   # Characters before the cursor
+        self.right = []          # Characters after it, reversed
+
+    def _column(self):
+        left = self.left
+        i = len(left)
+        while i and left[i - 1] != '\n':
+            i -= 1
+        return len(left) - i
+
+    def press(self, code):
+        left = self.left
+        right = self.right
+        if code == BACKSPACE:
+            if left:
+                left.pop()
+        elif code == DELETE:
+            if right:
+                right.pop()
+        elif code == LEFT:
+            if left:
+                right.append(left.pop())
+        elif code == RIGHT:
+            if right:
+                left.append(right.pop())
+        elif code == HOME:
+            while left and left[-1] != '\n':
+                right.append(left.pop())
+        elif code == END:
+            while right and right[-1] != '\n':
+                left.append(right.pop())
+        elif code == UP:
+            column = self._column()
+            self.press(HOME)
+            if left:
+                right.append(left.pop())
+                self.press(HOME)
+                for _ in range(column):
+                    if not right or right[-1] == '\n':
+                        break
+                    left.append(right.pop())
+        elif code == ENTER:
+            left.append('\n')
+        elif code == TAB:
+            left.append('\t')
+        elif code != SHIFT_TAB:
+            left.append(chr(code))
+
+    def text(self):
+        return ''.join(self.left) + ''.join(reversed(self.right))
+
+def typed_text(checkpoint):
+    """
+    Rebuild the text a session left in the target window from its
+    TypingCheckpoint (seed, events sent, source and settings), by
+    replaying the same plan up to the last key sent.
+    """
+    settings = dict(checkpoint.settings or {})
+    retype_from = settings.get('retype_from')
+    if retype_from is not None and not isinstance(retype_from, str):
+        retype_from = settings['retype_from'] = typed_text(retype_from)
+    editor = settings.get('editor')
+    if editor is not None:
+        from .editor import EditorModel
+        buffer = EditorModel(editor)
+    else:
+        buffer = TextBuffer(retype_from or '')
+    press = buffer.press
+    events = iter_events(checkpoint.source, random.Random(checkpoint.seed), **settings)
+    for i, (code, wait, kind) in enumerate(events):
+        if i == checkpoint.events:
+            break
+        press(code)
+    return buffer.text()
+
+def _common_prefix(a, b):
+    """Length of the common prefix of two strings, by binary search on slices."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def _common_suffix(a, b, limit):
+    lo, hi = 0, min(len(a), len(b), limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:len(a) - lo] == b[len(b) - mid:len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def _diff(a, b):
+    """Non-equal opcodes of a SequenceMatcher over two sequences."""
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    return [opcode for opcode in matcher.get_opcodes() if opcode[0] != 'equal']
+
+def _diff_tokens(old, new, offset, edits):
+    """Append the edits of a token diff (refined by characters) of old -> new."""
+    a = TOKEN_RE.findall(old)
+    b = TOKEN_RE.findall(new)
+    if len(a) > TOKEN_LIMIT or len(b) > TOKEN_LIMIT:
+        edits.append((offset, offset + len(old), new))
+        return
+    a_at = [0] + list(accumulate(map(len, a)))
+    b_at = [0] + list(accumulate(map(len, b)))
+    for op, i1, i2, j1, j2 in _diff(a, b):
+        start, end = a_at[i1], a_at[i2]
+        insert = new[b_at[j1]:b_at[j2]]
+        if op == 'replace' and end - start <= REFINE_LIMIT and len(insert) <= REFINE_LIMIT:
+            removed = old[start:end]
+            for c_op, c1, c2, d1, d2 in _diff(removed, insert):
+                edits.append((offset + start + c1, offset + start + c2, insert[d1:d2]))
+        else:
+            edits.append((offset + start, offset + end, insert))
+
+def edit_script(old, new):
+    """
+    Return a list of (start, end, insert) edits turning old into new:
+    old[start:end] is replaced by insert. Edits are sorted and do not
+    overlap. The common prefix and suffix are cut off first; the rest
+    is diffed by lines, changed blocks of lines by tokens, and short
+    replaced token spans by characters, so the expensive diffs only
+    ever see the parts that changed.
+    """
+    prefix = _common_prefix(old, new)
+    suffix = _common_suffix(old, new, min(len(old), len(new)) - prefix)
+    old_mid = old[prefix:len(old) - suffix]
+    new_mid = new[prefix:len(new) - suffix]
+    edits = []
+    if not old_mid and not new_mid:
+        return edits
+
+    a = old_mid.splitlines(keepends=True)
+    b = new_mid.splitlines(keepends=True)
+    a_at = [0] + list(accumulate(map(len, a)))
+    b_at = [0] + list(accumulate(map(len, b)))
+    for op, i1, i2, j1, j2 in _diff(a, b):
+        start = a_at[i1]
+        _diff_tokens(old_mid[start:a_at[i2]], new_mid[b_at[j1]:b_at[j2]],
+                     prefix + start, edits)
+    return edits
+
+def _move_keys(old, target, between):
+    """
+    Keys moving the cursor left to old position target, with between
+    the text currently between the two. Picks the shortest of walking
+    left, or going up to the target's line and in from Home or End.
+    Returns (key, count) runs.
+    """
+    if not between:
+        return ()
+    column = target - (old.rfind('\n', 0, target) + 1)
+    lines = between.count('\n')
+    options = [((LEFT, len(between)),)]
+    if lines == 0:
+        options.append(((HOME, 1), (RIGHT, column)))
+    else:
+        after = between.index('\n')
+        options.append(((UP, lines), (HOME, 1), (RIGHT, column)))
+        options.append(((UP, lines), (END, 1), (LEFT, after)))
+    return min(options, key=lambda runs: sum(count for key, count in runs))
+
+def plan_edits(old, new):
+    """
+    Yield the key codes that turn old, with the cursor at its end, into
+    new. Edits are applied from the end backwards, so positions before
+    the cursor never shift. Each deletion is done from whichever end of
+    the span is cheaper to reach (Backspace from the right, Delete from
+    the left).
+    """
+    cursor = len(old)  # Old position just before the last inserted text
+    inserted = ''
+    for start, end, insert in reversed(edit_script(old, new)):
+        from_end = _move_keys(old, end, old[end:cursor] + inserted)
+        from_start = _move_keys(old, start, old[start:cursor] + inserted)
+        if sum(n for k, n in from_start) < sum(n for k, n in from_end):
+            runs = from_start + ((DELETE, end - start),)
+        else:
+            runs = from_end + ((BACKSPACE, end - start),)
+        for key, count in runs:
+            for _ in range(count):
+                yield key
+        for char in insert:
+            if char == '\n':
+                yield ENTER
+            elif char == '\t':
+                yield TAB
+            else:
+                yield ord(char)
+        cursor = start
+        inserted = insert
@@ -0,0 +1,83 @@
+"""
+Drift-free keystroke scheduling based on absolute deadlines.
+Instead of sleeping a relative delay after every key, the scheduler
+keeps a running perf_counter deadline for the whole session, so time
+spent sending keys and OS sleep overshoot are absorbed by the next wait.
+"""
+
+import time
+
+# Below this many seconds before a deadline we stop sleeping and spin,
+# because OS sleeps routinely overshoot by a millisecond or more.
+DEFAULT_SPIN_THRESHOLD = 0.002
+
+class DeadlineScheduler:
+    """
+    Tracks an absolute deadline and waits for it with a hybrid
+    sleep-then-spin strategy. Call wait(delay) where time.sleep(delay)
+    would otherwise be used.
+    """
+
+    def __init__(self, spin_threshold=DEFAULT_SPIN_THRESHOLD,
+                 clock=time.perf_counter, sleep=time.sleep):
+        self.spin_threshold = spin_threshold
+        self.clock = clock
+        self.sleep = sleep
+        self.deadline = None
+        self.started = None
+
+    def start(self):
+        """Anchor the schedule at the current time."""
+        self.started = self.deadline = self.clock()
+
+    def wait(self, delay):
+        """
+        Advance the deadline by delay and wait until it is reached.
+        Returns how late (in seconds) we already were, 0.0 if on time.
+        """
+        if self.deadline is None:
+            self.start()
+        self.deadline += delay
+        deadline = self.deadline
+        clock = self.clock
+
+        remaining = deadline - clock()
+        if remaining <= 0:
+            # Behind schedule: don't wait, let the following keys catch up
+            return -remaining
+
+        # An interruptible sleep (see control.TypingControl.sleep) returns
+        # False on a stop signal, in which case the deadline is abandoned
+        if remaining > self.spin_threshold:
+            if self.sleep(remaining - self.spin_threshold) is False:
+                return 0.0
+
+        # Spin for the last stretch; sleep(0) still yields the GIL
+        while clock() < deadline:
+            if self.sleep(0) is False:
+                return 0.0
+        return 0.0
+
+    def elapsed(self):
+        """Seconds since the schedule was started."""
+        if self.started is None:
+            return 0.0
+        return self.clock() - self.started
+
+class VirtualClock:
+    """
+    Stand-in for the real clock: sleep() advances time instantly.
+    Lets the engine run its full timing logic without actually waiting,
+    for benchmarks, simulations and tests.
+    """
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.now += seconds
+        return True
@@ -0,0 +1,330 @@
+"""
+Keystroke sinks: the layer between the typing engine and the OS.
+The engine hands a sink plan key codes (see typing_plan); the sink
+decides how they reach the display server.
+
+- PynputSink sends every key through pynput, one call per press/release.
+- XTestSink batches keys into XTest requests and flushes a word or
+  chunk per round trip to the X server (python-xlib, X11 only).
+- RecordingSink keeps timestamped events in memory, for headless runs
+  and throughput measurements.
+- NullSink only counts keys.
+"""
+
+import time
+from array import array
+
+from .typing_plan import (
+    BACKSPACE, TAB, ENTER, SPACE, SHIFT_TAB, DELETE, LEFT, RIGHT, UP, HOME, END,
+)
+from .keymap import CACHE_SIZE, resolve
+
+class KeySink:
+    """
+    Base class for keystroke sinks.
+    send() taps one key (press + release); flush() pushes anything
+    buffered to the OS. The engine calls flush() before every wait.
+    """
+
+    def send(self, code):
+        raise NotImplementedError
+
+    def send_text(self, text):
+        """
+        Type a whole string as fast as the backend allows.
+        Backends override this when they have a faster bulk path.
+        """
+        send = self.send
+        for char in text:
+            send(ord(char))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+class PynputSink(KeySink):
+    """
+    Sends keys one at a time through a pynput keyboard Controller.
+    Characters go to pynput as KeyCodes built once per code, so pynput
+    still finds the keysym and modifiers for whatever layout the OS uses.
+    Only where a character is missing from layout (the keyboard layout of
+    the OS, when known) but reachable through a dead key does the sink
+    tap the keys itself (see keymap.resolve).
+    """
+
+    def __init__(self, controller=None, layout=None):
+        from pynput.keyboard import Controller, Key, KeyCode
+        self.controller = controller or Controller()
+        self.layout = layout
+        self._key_code = KeyCode
+        self._shift = Key.shift
+        # Plan key codes that map to pynput special keys rather than characters
+        self._special = {
+            BACKSPACE: Key.backspace,
+            TAB: Key.tab,
+            ENTER: Key.enter,
+            SPACE: Key.space,
+            DELETE: Key.delete,
+            LEFT: Key.left,
+            RIGHT: Key.right,
+            UP: Key.up,
+            HOME: Key.home,
+            END: Key.end,
+        }
+        self._fixed = dict(self._special)
+        self._fixed[SHIFT_TAB] = ((Key.tab, True),)
+        # code -> a pynput key to tap, or ((pynput key, shifted), ...);
+        # bounded like the resolver cache behind it
+        self._keys = dict(self._fixed)
+
+    def _key_for(self, code):
+        key = self._key_code.from_char(chr(code))
+        taps = resolve(code, self.layout) if self.layout is not None else None
+        if taps is not None and any(dead for _, _, dead in taps):
+            key = []
+            for tap_code, shifted, dead in taps:
+                tap = self._special.get(tap_code)
+                if tap is None:
+                    char = chr(tap_code)
+                    tap = self._key_code.from_dead(char) if dead else self._key_code.from_char(char)
+                key.append((tap, shifted))
+            key = tuple(key)
+        if len(self._keys) >= CACHE_SIZE:
+            self._keys = dict(self._fixed)
+        self._keys[code] = key
+        return key
+
+    def send(self, code):
+        key = self._keys.get(code) or self._key_for(code)
+        controller = self.controller
+        if not isinstance(key, tuple):
+            controller.press(key)
+            controller.release(key)
+            return
+        for key, shifted in key:
+            if shifted:
+                controller.press(self._shift)
+            controller.press(key)
+            controller.release(key)
+            if shifted:
+                controller.release(self._shift)
+
+# X keysyms for the plan's special key codes
+_X_SPECIAL_KEYSYMS = {
+    BACKSPACE: 0xff08,  # XK_BackSpace
+    TAB: 0xff09,        # XK_Tab
+    ENTER: 0xff0d,      # XK_Return
+    SPACE: 0x0020,      # XK_space
+    SHIFT_TAB: 0xfe20,  # XK_ISO_Left_Tab
+    DELETE: 0xffff,     # XK_Delete
+    LEFT: 0xff51,       # XK_Left
+    RIGHT: 0xff53,      # XK_Right
+    UP: 0xff52,         # XK_Up
+    HOME: 0xff50,       # XK_Home
+    END: 0xff57,        # XK_End
+}
+_XK_SHIFT_L = 0xffe1
+
+# X keysyms of the dead keys keymap.resolve knows about
+_X_DEAD_KEYSYMS = {
+    ord('`'): 0xfe50,  # XK_dead_grave
+    ord('´'): 0xfe51,  # XK_dead_acute
+    ord('^'): 0xfe52,  # XK_dead_circumflex
+    ord('¨'): 0xfe57,  # XK_dead_diaeresis
+}
+
+def _keysym_for(code):
+    """Map a plan key code to an X keysym."""
+    keysym = _X_SPECIAL_KEYSYMS.get(code)
+    if keysym is not None:
+        return keysym
+    if 0x20 <= code <= 0x7e or 0xa0 <= code <= 0xff:
+        # Latin-1 keysyms equal their code points
+        return code
+    return 0x01000000 | code
+
+class XTestSink(KeySink):
+    """
+    Batched X11 backend. Key events are queued as XTest fake_input
+    requests and only sent to the server on flush(), or once
+    batch_size taps are pending, so a whole word costs one round trip.
+    Characters with no keycode in the current keymap are typed as
+    the taps keymap.resolve gives for layout (e.g. dead key + letter)
+    when those keys exist, and handed to a fallback sink (pynput by
+    default) otherwise.
+    """
+
+    def __init__(self, display=None, batch_size=64, fallback=None, layout='qwerty'):
+        from Xlib import X
+        from Xlib.display import Display
+        from Xlib.ext import xtest
+        self._X = X
+        self._fake_input = xtest.fake_input
+        self.display = display or Display()
+        self.batch_size = batch_size
+        self.fallback = fallback
+        self.layout = layout
+        self.pending = 0
+        self._keycodes = {}
+        self._shift = self.display.keysym_to_keycode(_XK_SHIFT_L)
+
+    def _keycode(self, keysym):
+        """Return (keycode, needs_shift) for a keysym, or None."""
+        for keycode, index in self.display.keysym_to_keycodes(keysym):
+            if index in (0, 1):
+                return keycode, index == 1
+        return None
+
+    def _resolve(self, code):
+        """Return the (keycode, needs_shift) taps for a plan key code, or None."""
+        try:
+            return self._keycodes[code]
+        except KeyError:
+            pass
+        tap = self._keycode(_keysym_for(code))
+        if tap is not None:
+            resolved = (tap,)
+        else:
+            resolved = None
+            taps = resolve(code, self.layout)
+            if taps is not None:
+                resolved = []
+                for tap_code, shifted, dead in taps:
+                    keysym = _X_DEAD_KEYSYMS.get(tap_code) if dead else _keysym_for(tap_code)
+                    tap = self._keycode(keysym) if keysym is not None else None
+                    if tap is None:
+                        resolved = None
+                        break
+                    resolved.append((tap[0], tap[1] or shifted))
+                if resolved is not None:
+                    resolved = tuple(resolved)
+        if len(self._keycodes) >= CACHE_SIZE:
+            self._keycodes.clear()
+        self._keycodes[code] = resolved
+        return resolved
+
+    def _queue(self, code):
+        """Queue one key tap without flushing. Returns False if it went to the fallback."""
+        resolved = self._resolve(code)
+        if resolved is None:
+            self.flush()
+            if self.fallback is None:
+                self.fallback = PynputSink(layout=self.layout)
+            self.fallback.send(code)
+            return False
+        X = self._X
+        fake_input = self._fake_input
+        display = self.display
+        for keycode, shifted in resolved:
+            if shifted:
+                fake_input(display, X.KeyPress, self._shift)
+            fake_input(display, X.KeyPress, keycode)
+            fake_input(display, X.KeyRelease, keycode)
+            if shifted:
+                fake_input(display, X.KeyRelease, self._shift)
+        self.pending += 1
+        return True
+
+    def send(self, code):
+        if not self._queue(code):
+            return
+        if self.pending >= self.batch_size or code == SPACE or code == ENTER:
+            self.flush()
+
+    def send_text(self, text):
+        # The whole string goes out in a single round trip
+        queue = self._queue
+        for char in text:
+            queue(ord(char))
+        self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.display.sync()
+            self.pending = 0
+
+    def close(self):
+        self.flush()
+        self.display.close()
+
+class RecordingSink(KeySink):
+    """
+    Collects (timestamp, key code) events in memory instead of typing.
+    Works without any display, which makes it suitable for CI runs
+    and for measuring how fast the engine itself can go.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.times = array('d')
+        self.codes = array('I')
+
+    def send(self, code):
+        self.times.append(self.clock())
+        self.codes.append(code)
+
+    def send_text(self, text):
+        # One timestamp for the whole string, like a single bulk write
+        self.times.extend([self.clock()] * len(text))
+        self.codes.extend(map(ord, text))
+
+    def __len__(self):
+        return len(self.codes)
+
+    def events(self):
+        """Return the recorded events as a list of (timestamp, code) pairs."""
+        return list(zip(self.times, self.codes))
+
+    def text(self, editor=None):
+        """
+        Return the text the recorded keys would leave in an editor.
+        Without an editor profile (see editor.py) the keys are replayed
+        into a plain retype.TextBuffer.
+        """
+        if editor is not None:
+            from .editor import EditorModel
+            model = EditorModel(editor)
+            for code in self.codes:
+                model.press(code)
+            return model.text()
+        from .retype import TextBuffer
+        buffer = TextBuffer()
+        for code in self.codes:
+            buffer.press(code)
+        return buffer.text()
+
+    def keys_per_second(self):
+        """Average rate between the first and last recorded key."""
+        if len(self.times) < 2:
+            return 0.0
+        span = self.times[-1] - self.times[0]
+        return (len(self.times) - 1) / span if span > 0 else float('inf')
+
+class NullSink(KeySink):
+    """Discards every key, only counting them. The cheapest possible sink."""
+
+    def __init__(self):
+        self.count = 0
+
+    def send(self, code):
+        self.count += 1
+
+    def send_text(self, text):
+        self.count += len(text)
+
+SINKS = {
+    'pynput': PynputSink,
+    'xtest': XTestSink,
+    'recording': RecordingSink,
+    'null': NullSink,
+}
+
+def make_sink(name='pynput', **kwargs):
+    """Create a sink by name ('pynput', 'xtest', 'recording' or 'null')."""
+    try:
+        sink_class = SINKS[name]
+    except KeyError:
+        raise ValueError(f"Unknown keystroke sink: {name!r}")
+    return sink_class(**kwargs)
@@ -0,0 +1,100 @@
+"""
+Streaming text sources for the typing engine.
+Anything the engine types goes through iter_text_chunks, which turns
+a string, an iterable of strings, a file-like object or a file path
+into a lazy stream of text chunks, so documents never have to be
+held in memory as a whole.
+"""
+
+import codecs
+import mmap
+import os
+import re
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# A word (run of non-whitespace) or a line break
+_TOKEN_RE = re.compile(r'\S+|\n')
+
+def iter_file_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    Read a file through mmap and decode it incrementally.
+    Multi-byte characters split across chunk boundaries are handled
+    by the incremental decoder.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap refuses empty files
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start in range(0, len(mm), chunk_size):
+                chunk = decoder.decode(mm[start:start + chunk_size])
+                if chunk:
+                    yield chunk
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+def _iter_stream_chunks(stream, chunk_size, encoding):
+    """Read a file-like object chunk by chunk, decoding bytes if needed."""
+    decoder = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            chunk = decoder.decode(chunk)
+            if not chunk:
+                continue
+        yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+def iter_text_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    Turn a text source into a lazy stream of str chunks.
+
+    source may be:
+    - a str (sliced, not copied as a whole),
+    - an os.PathLike pointing at a file (mmap-backed),
+    - a file-like object with read() returning str or bytes,
+    - any other iterable of str chunks.
+    """
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    elif isinstance(source, os.PathLike):
+        yield from iter_file_chunks(source, chunk_size, encoding)
+    elif hasattr(source, 'read'):
+        yield from _iter_stream_chunks(source, chunk_size, encoding)
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+def iter_tokens(chunks):
+    """
+    Lazily split a stream of text chunks into words and line breaks.
+    Yields each word (a run of non-whitespace characters) and a '\\n'
+    for every line break. Words cut by a chunk boundary are rejoined.
+    """
+    carry = ''
+    for chunk in chunks:
+        if carry:
+            chunk = carry + chunk
+            carry = ''
+        end = len(chunk)
+        for match in _TOKEN_RE.finditer(chunk):
+            token = match.group()
+            if match.end() == end and token != '\n':
+                # The word may continue in the next chunk
+                carry = token
+                break
+            yield token
+    if carry:
+        yield carry
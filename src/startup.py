@@ -0,0 +1,69 @@
+"""
+Startup timing.
+main() runs each startup step (imports, hotkey listener, window)
+through a StartupTimer, so slow imports or initialization show up in a
+report, and a test or CI job can check the milestones against a budget:
+
+    python -m src.main --startup-report --budget 0.5
+"""
+
+import importlib
+import sys
+import time
+from contextlib import contextmanager
+
+# Seconds each milestone should be reached within, counted from when
+# the StartupTimer was created (as main() starts, after the interpreter
+# and main's own imports have loaded)
+DEFAULT_BUDGET = {
+    'hotkeys live': 0.5,
+    'window ready': 1.5,
+}
+
+class StartupTimer:
+    """
+    Records how long each startup step takes (step / import_module)
+    and when milestones are reached (mark), in seconds since the
+    timer was created.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.steps = []       # (name, seconds)
+        self.milestones = {}  # name -> seconds since start
+
+    @contextmanager
+    def step(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, time.perf_counter() - started))
+
+    def import_module(self, name, package=None):
+        """Import and time a module. Only the modules it loads for the first time count."""
+        with self.step(f"import {name.lstrip('.')}"):
+            return importlib.import_module(name, package)
+
+    def mark(self, name):
+        self.milestones[name] = time.perf_counter() - self.started
+
+    def report(self):
+        """The steps and milestones as a dict, e.g. for JSON."""
+        return {'steps': [{'name': name, 'seconds': seconds} for name, seconds in self.steps],
+                'milestones': dict(self.milestones),
+                'total': time.perf_counter() - self.started}
+
+    def over_budget(self, budget=None):
+        """Milestones reached later than budget allows (or not at all): name -> seconds."""
+        budget = DEFAULT_BUDGET if budget is None else budget
+        return {name: self.milestones.get(name, float('inf'))
+                for name, limit in budget.items()
+                if self.milestones.get(name, float('inf')) > limit}
+
+    def print_report(self, file=None):
+        file = file or sys.stdout
+        for name, seconds in self.steps:
+            print(f"{name:32} {seconds * 1000:9.1f} ms", file=file)
+        for name, seconds in self.milestones.items():
+            print(f"{name + ' after':32} {seconds * 1000:9.1f} ms", file=file)
@@ -0,0 +1,166 @@
+"""
+Per-keystroke timing telemetry.
+A TelemetryRecorder passed to typing_engine.play_plan / type_text
+stores, for every key sent, when it was meant to go out, when it
+actually did and how long the sink call took. The columns live in
+preallocated arrays, so recording is a handful of stores per key;
+without a recorder the engine does not time anything at all.
+"""
+
+import csv
+import json
+from array import array
+
+from .typing_plan import BACKSPACE, KEY_EVENT, TYPO_EVENT, PAUSE_EVENT, cps_to_wpm
+
+KIND_NAMES = {KEY_EVENT: 'keys', TYPO_EVENT: 'typos', PAUSE_EVENT: 'pauses'}
+
+def _percentile(ordered, q):
+    """q-th percentile (0-100) of an already sorted sequence, nearest rank."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+class TelemetryRecorder:
+    """
+    Columnar record of one typing session.
+
+    - intended[i]: planned time of key i, in seconds since start()
+    - actual[i]: time key i was handed to the sink, same origin
+    - latency[i]: seconds spent inside sink.send for key i
+    - codes[i], kinds[i]: the key code and event kind from the plan
+
+    Buffers are allocated for capacity events up front and doubled
+    when full. Flushes of batching sinks are totalled separately in
+    flushes / flush_seconds, since that is where their real work happens.
+    """
+
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.intended = array('d', bytes(8 * capacity))
+        self.actual = array('d', bytes(8 * capacity))
+        self.latency = array('d', bytes(8 * capacity))
+        self.codes = array('I', bytes(4 * capacity))
+        self.kinds = array('B', bytes(capacity))
+        self.count = 0
+        self.origin = None
+        self.planned = 0.0
+        self.flushes = 0
+        self.flush_seconds = 0.0
+
+    def start(self, now):
+        """Set the time origin; the first key is planned for its wait after it."""
+        self.origin = now
+        self.planned = 0.0
+
+    def _grow(self):
+        n = self.capacity
+        self.intended.extend(bytes(8 * n))
+        self.actual.extend(bytes(8 * n))
+        self.latency.extend(bytes(8 * n))
+        self.codes.extend(bytes(4 * n))
+        self.kinds.extend(bytes(n))
+        self.capacity = 2 * n
+
+    def record(self, code, kind, wait, now, latency):
+        """Store one key sent at clock time now, wait seconds after the previous one."""
+        i = self.count
+        if i == self.capacity:
+            self._grow()
+        self.planned += wait
+        self.intended[i] = self.planned
+        self.actual[i] = now - self.origin
+        self.latency[i] = latency
+        self.codes[i] = code
+        self.kinds[i] = kind
+        self.count = i + 1
+
+    def record_flush(self, seconds):
+        self.flushes += 1
+        self.flush_seconds += seconds
+
+    def __len__(self):
+        return self.count
+
+    def rows(self):
+        """Yield (index, code, kind, intended, actual, latency) for every event."""
+        for i in range(self.count):
+            yield (i, self.codes[i], self.kinds[i], self.intended[i],
+                   self.actual[i], self.latency[i])
+
+    def summary(self):
+        """
+        Session report:
+        - gross / net achieved WPM (net leaves out typos and the
+          backspaces erasing them) next to the planned WPM,
+        - interval jitter p50/p95/p99 in ms: how far each gap between
+          keys was from its planned wait,
+        - drift_ms: how late the last key was against its plan,
+        - seconds spent waiting before keys / typos / pauses,
+        - sink call latency in microseconds.
+        """
+        n = self.count
+        intended = self.intended
+        actual = self.actual
+        report = {'events': n}
+        if n == 0:
+            return report
+
+        backspaces = sum(1 for i in range(n) if self.codes[i] == BACKSPACE)
+        elapsed = actual[n - 1]
+        if elapsed > 0:
+            report['gross_wpm'] = cps_to_wpm(n / elapsed)
+            report['net_wpm'] = cps_to_wpm((n - 2 * backspaces) / elapsed)
+        if intended[n - 1] > 0:
+            report['planned_wpm'] = cps_to_wpm(n / intended[n - 1])
+        report['seconds'] = elapsed
+
+        jitter = []
+        spent = dict.fromkeys(KIND_NAMES.values(), 0.0)
+        previous_intended = previous_actual = 0.0
+        for i in range(n):
+            gap = actual[i] - previous_actual
+            jitter.append(abs(gap - (intended[i] - previous_intended)) * 1000)
+            spent[KIND_NAMES[self.kinds[i]]] += gap
+            previous_intended = intended[i]
+            previous_actual = actual[i]
+        jitter.sort()
+        report['jitter_ms_p50'] = _percentile(jitter, 50)
+        report['jitter_ms_p95'] = _percentile(jitter, 95)
+        report['jitter_ms_p99'] = _percentile(jitter, 99)
+        report['drift_ms'] = (actual[n - 1] - intended[n - 1]) * 1000
+        report['time_spent'] = spent
+
+        latency = sorted(self.latency[:n])
+        report['latency_us_mean'] = sum(latency) / n * 1e6
+        report['latency_us_p50'] = _percentile(latency, 50) * 1e6
+        report['latency_us_p99'] = _percentile(latency, 99) * 1e6
+        report['latency_us_max'] = latency[-1] * 1e6
+        report['flushes'] = self.flushes
+        report['flush_seconds'] = self.flush_seconds
+        return report
+
+    def to_json(self, path):
+        """Write the summary and every event (as columns) to a JSON file."""
+        n = self.count
+        data = {
+            'summary': self.summary(),
+            'events': {
+                'code': self.codes[:n].tolist(),
+                'kind': self.kinds[:n].tolist(),
+                'intended': self.intended[:n].tolist(),
+                'actual': self.actual[:n].tolist(),
+                'latency': self.latency[:n].tolist(),
+            },
+        }
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+    def to_csv(self, path):
+        """Write one CSV row per event."""
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('index', 'code', 'kind', 'intended', 'actual', 'latency'))
+            for index, code, kind, intended, actual, latency in self.rows():
+                writer.writerow((index, code, KIND_NAMES[kind], intended, actual, latency))
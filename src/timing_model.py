@@ -0,0 +1,144 @@
+"""
+Vectorized timing model for keystroke delays and thinking pauses.
+A TimingModel draws the delays for a whole block of keystrokes in one
+go: speed regimes, per-key intervals (uniform or log-normal around the
+regime speed) and pause placement. NumPy is used when available;
+otherwise an equivalent pure-Python sampler is used. A seed repeats
+the same timings within a backend; the two backends draw differently.
+"""
+
+import math
+import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+from .typing_plan import wpm_to_cps
+
+DISTRIBUTIONS = ('uniform', 'lognormal')
+
+class TimingModel:
+    """
+    Describes how inter-key delays and thinking pauses are distributed.
+
+    - Speed regimes: every regime_min..regime_max keystrokes a new speed
+      is drawn uniformly between min_wpm and max_wpm.
+    - Intervals: with 'uniform' every key in a regime waits exactly
+      1/speed (the classic behaviour); with 'lognormal' intervals are
+      log-normal with that mean and the given sigma.
+    - Pauses: when thinking_enabled, each key starts a thinking pause
+      with probability 1/pause_frequency, lasting min_pause..max_pause.
+    """
+
+    def __init__(self,
+                 min_wpm=40.0,
+                 max_wpm=80.0,
+                 distribution='lognormal',
+                 sigma=0.35,
+                 regime_min=15,
+                 regime_max=40,
+                 thinking_enabled=True,
+                 min_pause=0.5,
+                 max_pause=2.0,
+                 pause_frequency=50,
+                 use_numpy=None):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown delay distribution: {distribution!r}")
+        if min_wpm <= 0 or max_wpm < min_wpm:
+            raise ValueError(f"Need 0 < min_wpm <= max_wpm, got {min_wpm} and {max_wpm}")
+        if sigma < 0:
+            raise ValueError(f"sigma must not be negative, got {sigma}")
+        if regime_min < 1 or regime_max < regime_min:
+            raise ValueError(f"Need 1 <= regime_min <= regime_max, got {regime_min} and {regime_max}")
+        if min_pause < 0 or max_pause < min_pause:
+            raise ValueError(f"Need 0 <= min_pause <= max_pause, got {min_pause} and {max_pause}")
+        if pause_frequency < 1:
+            raise ValueError(f"pause_frequency must be at least 1, got {pause_frequency}")
+        if use_numpy and np is None:
+            raise ImportError("NumPy is not installed")
+        self.min_cps = wpm_to_cps(min_wpm)
+        self.max_cps = wpm_to_cps(max_wpm)
+        self.distribution = distribution
+        self.sigma = sigma
+        self.regime_min = regime_min
+        self.regime_max = regime_max
+        self.thinking_enabled = thinking_enabled
+        self.min_pause = min_pause
+        self.max_pause = max_pause
+        self.pause_frequency = pause_frequency
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+
+    def sample(self, n, seed=None):
+        """
+        Draw timings for n keystrokes.
+        Returns two array('d') of length n: the delay after each key and
+        the thinking pause before it (0.0 for most keys). The same seed
+        gives the same timings on the same backend (use_numpy).
+        """
+        if self.use_numpy:
+            return self._sample_numpy(n, seed)
+        return self._sample_python(n, seed)
+
+    def iter_timings(self, rng, block=4096):
+        """
+        Endless stream of (delay, pause) pairs, sampled block by block
+        with seeds drawn from rng.
+        """
+        while True:
+            delays, pauses = self.sample(block, rng.getrandbits(64))
+            yield from zip(delays, pauses)
+
+    def _sample_numpy(self, n, seed):
+        gen = np.random.default_rng(seed)
+
+        # Regime lengths: draw enough to cover n keys, then expand per key
+        count = n // self.regime_min + 1
+        lengths = gen.integers(self.regime_min, self.regime_max, count, endpoint=True)
+        speeds = gen.uniform(self.min_cps, self.max_cps, count)
+        delays = np.repeat(1.0 / speeds, lengths)[:n]
+
+        if self.distribution == 'lognormal':
+            # mu chosen so each interval has mean 1/speed
+            sigma = self.sigma
+            delays = delays * gen.lognormal(-sigma * sigma / 2, sigma, n)
+
+        pauses = np.zeros(n)
+        if self.thinking_enabled:
+            # Only draw durations for the keys that actually pause
+            placed = np.flatnonzero(gen.random(n) < 1.0 / self.pause_frequency)
+            pauses[placed] = gen.uniform(self.min_pause, self.max_pause, len(placed))
+
+        return array('d', delays.tobytes()), array('d', pauses.tobytes())
+
+    def _sample_python(self, n, seed):
+        rng = random.Random(seed)
+        delays = array('d')
+        while len(delays) < n:
+            length = rng.randint(self.regime_min, self.regime_max)
+            delays.extend([1.0 / rng.uniform(self.min_cps, self.max_cps)] * length)
+        del delays[n:]
+
+        if self.distribution == 'lognormal':
+            sigma = self.sigma
+            mu = -sigma * sigma / 2
+            lognormvariate = rng.lognormvariate
+            delays = array('d', [d * lognormvariate(mu, sigma) for d in delays])
+
+        pauses = array('d', bytes(8 * n))
+        if self.thinking_enabled:
+            # Geometric gaps between pauses, so only the pauses are drawn
+            p = 1.0 / self.pause_frequency
+            if p >= 1.0:
+                for i in range(n):
+                    pauses[i] = rng.uniform(self.min_pause, self.max_pause)
+            else:
+                log_q = math.log(1.0 - p)
+                i = int(math.log(1.0 - rng.random()) / log_q)
+                while i < n:
+                    pauses[i] = rng.uniform(self.min_pause, self.max_pause)
+                    i += 1 + int(math.log(1.0 - rng.random()) / log_q)
+
+        return delays, pauses
@@ -5,44 +5,147 @@ random pauses, typos, and the actual keystroke simulation.
 
 import time
 import random
-import string
-import threading
-from pynput.keyboard import Controller, Key
-from .keyboard_utils import KEYBOARD_NEIGHBORS
-
-keyboard = Controller()
-stop_typing = False  # Global flag to halt typing
-
-def wpm_to_cps(wpm):
-    """Convert Words Per Minute to Characters Per Second."""
-    # Average word length is considered 5 characters
-    return (wpm * 5) / 60
-
-def cps_to_wpm(cps):
-    """Convert Characters Per Second to Words Per Minute."""
-    return (cps * 60) / 5
-
-def get_typo_length():
-    """Generate typo length with weighted probability."""
-    # Example probability distribution for lengths 1 to 5
-    weights = [0.5, 0.25, 0.15, 0.07, 0.03]  # Probabilities
-    return random.choices([1, 2, 3, 4, 5], weights=weights)[0]
-
-def make_typo(char, typo_length):
-    """Create a realistic typo based on keyboard proximity."""
-    if char.lower() not in KEYBOARD_NEIGHBORS:
-        # If char isn't in the neighbor map, return random letters
-        return ''.join(random.choice(string.ascii_lowercase) for _ in range(typo_length))
-    
-    typo_chars = []
-    for _ in range(typo_length):
-        if random.random() < 0.7:  # 70% chance of using a neighbor key
-            base_char = char.lower()
-            typo_char = random.choice(KEYBOARD_NEIGHBORS[base_char])
-        else:
-            typo_char = random.choice(string.ascii_lowercase)
-        typo_chars.append(typo_char)
-    return ''.join(typo_chars)
+from itertools import chain, islice
+from .typing_plan import (
+    wpm_to_cps, cps_to_wpm, compile_plan,
+    iter_plan_chunks,
+)
+from .scheduler import DeadlineScheduler, VirtualClock
+from .sinks import PynputSink, NullSink
+from .sources import iter_text_chunks
+from .control import TypingControl, TypingCheckpoint
+from .telemetry import TelemetryRecorder
+
+default_sinks = {}  # Layout -> keystroke sink used when none is given; see get_default_sink()
+control = TypingControl()  # Stop / pause / resume signals for the running session
+last_checkpoint = None  # Where the last stopped session left off, if any
+last_session = None  # Checkpoint of the last session, stopped or finished
+
+def get_default_sink(layout=None):
+    """
+    The PynputSink used when no sink is given, for the keyboard layout
+    of the OS when known. Created on first use so importing the engine
+    does not load pynput or open a display connection.
+    """
+    sink = default_sinks.get(layout)
+    if sink is None:
+        sink = default_sinks[layout] = PynputSink(layout=layout)
+    return sink
+
+def play_plan(plan, precise_timing=False, sink=None, clock=None, telemetry=None,
+              signals=None):
+    """
+    Send the keystrokes of a precomputed TypingPlan (or any iterable of
+    (key code, delay, kind) events), waiting the planned delay before
+    each one. Returns the number of keys pressed.
+
+    With precise_timing, waits are measured against absolute deadlines
+    (see scheduler.DeadlineScheduler) so the achieved speed does not
+    drift below the requested one at high WPM.
+
+    Keys go to the given sink, or get_default_sink(). All waits go through
+    control, so a stop ends them immediately and a pause holds them.
+    A clock such as scheduler.VirtualClock replaces real waiting.
+    A telemetry.TelemetryRecorder records every key's planned and
+    actual time; it keeps recording across calls once started.
+    signals is a TypingControl to obey instead of the module's control.
+    """
+    if sink is None:
+        sink = get_default_sink()
+    if signals is None:
+        signals = control
+    if clock is not None:
+        # Virtual time is exact, so there is nothing to correct for
+        wait_for = clock.sleep
+    elif precise_timing:
+        scheduler = DeadlineScheduler(clock=signals.clock, sleep=signals.sleep)
+        scheduler.start()
+        wait_for = scheduler.wait
+    else:
+        wait_for = signals.sleep
+    if telemetry is not None:
+        now = clock.time if clock is not None else signals.clock
+        return _play_recorded(plan, sink, wait_for, now, telemetry, signals)
+
+    send = sink.send
+    pressed = 0
+    for code, wait, kind in plan:
+        if wait:
+            sink.flush()
+            wait_for(wait)
+        elif signals.paused:
+            signals.sleep(0)
+        if signals.stopped:
+            break
+        send(code)
+        pressed += 1
+    sink.flush()
+    return pressed
+
+def _play_recorded(plan, sink, wait_for, now, telemetry, signals):
+    """play_plan's loop with every send and flush timed into telemetry."""
+    send = sink.send
+    flush = sink.flush
+    record = telemetry.record
+    perf_counter = time.perf_counter
+    if telemetry.origin is None:
+        telemetry.start(now())
+    pressed = 0
+    for code, wait, kind in plan:
+        if wait:
+            before = perf_counter()
+            flush()
+            telemetry.record_flush(perf_counter() - before)
+            wait_for(wait)
+        elif signals.paused:
+            signals.sleep(0)
+        if signals.stopped:
+            break
+        sent_at = now()
+        before = perf_counter()
+        send(code)
+        record(code, kind, wait, sent_at, perf_counter() - before)
+        pressed += 1
+    before = perf_counter()
+    flush()
+    telemetry.record_flush(perf_counter() - before)
+    return pressed
+
+def burst_type(text, chunk_size=256, chunk_gap=0.0, delay=0.25, sink=None,
+               reset_control=True):
+    """
+    Type text as fast as possible, with no humanization at all.
+    The text is streamed in chunks of chunk_size characters, with line
+    endings normalized to \n, and each chunk goes through the sink's
+    fastest path (send_text); chunk_gap seconds are waited between chunks
+    for targets that cannot keep up.
+    Returns a dict with the characters typed, seconds taken and the
+    sustained characters/second.
+    """
+    from .pipeline import normalize
+    if reset_control:
+        control.reset()
+    if sink is None:
+        sink = get_default_sink()
+
+    control.sleep(delay)
+
+    chars = 0
+    started = time.perf_counter()
+    for chunk in normalize(iter_text_chunks(text, chunk_size), None):
+        # Also holds here while paused
+        if not control.sleep(chunk_gap if chars else 0):
+            break
+        sink.send_text(chunk)
+        chars += len(chunk)
+    sink.flush()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'chars': chars,
+        'seconds': elapsed,
+        'chars_per_second': chars / elapsed if elapsed > 0 else 0.0,
+    }
 
 def type_text(text, 
               min_wpm=40.0, 
@@ -54,133 +157,245 @@ def type_text(text,
               pause_frequency=50,
               typos_enabled=True,
               typo_chance=0.3,
-              random_letters=False):
+              random_letters=False,
+              timing=None,
+              layout='qwerty',
+              bigram_timing=False,
+              typo_kinds=None,
+              editor=None,
+              retype_from=None,
+              stages=None,
+              seed=None,
+              precise_timing=False,
+              sink=None,
+              burst=False,
+              chunk_size=256,
+              chunk_gap=0.0,
+              resume_from=None,
+              telemetry=None,
+              reset_control=True):
     """
     Core function to type out the given text with human-like patterns.
+    text may also be a file path (os.PathLike), a file-like object or
+    an iterable of str chunks; it is streamed, never loaded as a whole.
+    The text is compiled chunk by chunk into keystroke plans (see
+    typing_plan), which are played back as they are produced.
+    Passing the same seed reproduces a run. An optional
+    timing_model.TimingModel replaces the classic uniform delays with
+    vectorized, configurable distributions. layout selects the keyboard
+    used for typo neighbors, bigram_timing scales delays by key distance,
+    and typo_kinds reweights the error kinds (see typo_model.py).
+    editor names an editor profile (see editor.py): the text is then
+    typed exactly, with the fewest keys given what that editor
+    indents and closes by itself.
+    retype_from is the text already in the target window, or the
+    TypingCheckpoint of the session that typed it (e.g. last_session):
+    only the edits turning it into text are typed (see retype.py).
+    stages replaces the planning pipeline (see pipeline.default_stages).
+    Set precise_timing for drift-free scheduling at high WPM, and pass
+    a sink (see sinks.py) to send keys somewhere other than pynput.
+    With burst, all humanization settings are ignored and the text is
+    handed to burst_type; its stats dict is returned.
+
+    The session can be stopped, paused and resumed through control.
+    When stopped, a TypingCheckpoint is kept in last_checkpoint; passing
+    it back as resume_from (with the same text and settings) continues
+    exactly where typing left off instead of starting over.
+    Every session's checkpoint is also kept in last_session.
+    Pass a telemetry.TelemetryRecorder to measure the achieved timing;
+    see its summary() once typing has finished.
+    Signals left over from the previous session are cleared first,
+    unless reset_control is False: the job queue clears them itself,
+    under its lock, so a cancel arriving as the job starts is not lost.
     This runs synchronously; consider starting it in a separate thread.
     """
-    global stop_typing
-    stop_typing = False
+    if burst:
+        return burst_type(text, chunk_size=chunk_size, chunk_gap=chunk_gap,
+                          delay=delay, sink=sink, reset_control=reset_control)
+
+    global last_checkpoint, last_session
+    if reset_control:
+        control.reset()
+
+    if retype_from is not None and not isinstance(retype_from, str):
+        from .retype import typed_text
+        retype_from = typed_text(retype_from)
 
-    # Convert WPM to characters per second
-    min_cps = wpm_to_cps(min_wpm)
-    max_cps = wpm_to_cps(max_wpm)
+    skip = 0
+    if resume_from is not None:
+        seed = resume_from.seed
+        skip = resume_from.events
+    elif seed is None:
+        # Always have a seed so the session can be checkpointed
+        seed = random.randrange(2**32)
+
+    # Plan the first chunk during the initial delay so typing starts on time
+    started = time.perf_counter()
+    settings = dict(
+        min_wpm=min_wpm,
+        max_wpm=max_wpm,
+        thinking_enabled=thinking_enabled,
+        min_pause=min_pause,
+        max_pause=max_pause,
+        pause_frequency=pause_frequency,
+        typos_enabled=typos_enabled,
+        typo_chance=typo_chance,
+        random_letters=random_letters,
+        timing=timing,
+        layout=layout,
+        bigram_timing=bigram_timing,
+        typo_kinds=typo_kinds,
+        editor=editor,
+        retype_from=retype_from,
+        stages=stages,
+    )
+    plans = iter_plan_chunks(text, seed=seed, **settings)
+    events = islice(chain.from_iterable(plans), skip, None)
+    first_event = next(events, None)
+    if first_event is None:
+        last_session = TypingCheckpoint(seed, skip, text, settings)
+        return
 
     # Initial delay before typing starts
-    time.sleep(delay)
-
-    # Optionally inject random letters into the text
-    if random_letters:
-        modified_text = []
-        i = 0
-        while i < len(text):
-            modified_text.append(text[i])
-            # Randomly inject a letter
-            if random.randint(8, 15) == len(modified_text) % random.randint(8, 15):
-                modified_text.append(random.choice(string.ascii_letters))
-            i += 1
-        text = ''.join(modified_text)
-
-    chars_typed = 0
-    current_speed = random.uniform(min_cps, max_cps)
-    speed_change_counter = 0
-
-    # Split text into paragraphs by newline
-    lines = text.split('\n')
-
-    for line_num, line in enumerate(lines):
-        if stop_typing:
-            break
+    remaining = delay - (time.perf_counter() - started)
+    if remaining > 0 and not control.sleep(remaining):
+        last_checkpoint = last_session = TypingCheckpoint(seed, skip, text, settings)
+        return
+
+    if sink is None:
+        sink = get_default_sink(layout)
+    pressed = play_plan(chain((first_event,), events),
+                        precise_timing=precise_timing, sink=sink,
+                        telemetry=telemetry)
+    last_session = TypingCheckpoint(seed, skip + pressed, text, settings)
+    last_checkpoint = last_session if control.stopped else None
 
-        words = line.split()
-        for word_num, word in enumerate(words):
-            if stop_typing:
-                break
-
-            # Randomly change typing speed every few words
-            speed_change_counter += 1
-            if speed_change_counter >= random.randint(3, 8):
-                current_speed = random.uniform(min_cps, max_cps)
-                speed_change_counter = 0
-
-            current_delay = 1 / current_speed
-
-            # Decide if a typo will be made in this word
-            make_typo_here = (
-                typos_enabled and 
-                len(word) >= 3 and 
-                random.random() < typo_chance
-            )
-            typo_pos = random.randint(0, len(word)-1) if make_typo_here else -1
-
-            for i, char in enumerate(word):
-                if stop_typing:
-                    break
-
-                # Thinking pause logic
-                if thinking_enabled:
-                    chars_typed += 1
-                    if chars_typed % pause_frequency == 0:
-                        thinking_time = random.uniform(min_pause, max_pause)
-                        time.sleep(thinking_time)
-                        # Randomize speed again after pause
-                        current_speed = random.uniform(min_cps, max_cps)
-                        current_delay = 1 / current_speed
-
-                # Press the actual character
-                keyboard.press(char)
-                keyboard.release(char)
-                time.sleep(current_delay)
-
-                # Insert a typo at the designated position
-                if i == typo_pos and not stop_typing:
-                    time.sleep(random.uniform(0.1, 0.2))
-                    t_length = get_typo_length()
-                    typo_str = make_typo(char, t_length)
-
-                    # Type the typo
-                    for t_char in typo_str:
-                        keyboard.press(t_char)
-                        keyboard.release(t_char)
-                        time.sleep(current_delay)
-
-                    # Small pause before correction
-                    time.sleep(random.uniform(0.2, 0.4))
-
-                    # Delete the typo
-                    for _ in range(len(typo_str)):
-                        keyboard.press(Key.backspace)
-                        keyboard.release(Key.backspace)
-                        time.sleep(current_delay * 0.5)
-
-                    time.sleep(random.uniform(0.1, 0.2))
-
-            # Press space after each word (unless it's the last word in the line)
-            if word_num < len(words) - 1 and not stop_typing:
-                keyboard.press(Key.space)
-                keyboard.release(Key.space)
-                time.sleep(current_delay)
-
-        # Press Enter twice after each line (paragraph separation)
-        if line_num < len(lines) - 1 and not stop_typing:
-            keyboard.press(Key.enter)
-            keyboard.release(Key.enter)
-            time.sleep(current_delay)
-            keyboard.press(Key.enter)
-            keyboard.release(Key.enter)
-            time.sleep(current_delay * 2)
-
-def start_typing_thread():
+def simulate(text,
+             delay=0.25,
+             seed=None,
+             sink=None,
+             burst=False,
+             chunk_size=256,
+             chunk_gap=0.0,
+             precise_timing=False,
+             resume_from=None,
+             signals=None,
+             **config):
     """
-    Helper function to start typing_text in a separate thread.
-    Pulls the current config from the GUI, if available.
+    Run a type_text session against a VirtualClock instead of real time.
+    Takes the same arguments as type_text and goes through the same
+    planning and playback code, but keys go to a NullSink (or the given
+    sink) and every wait finishes instantly, so an hour of typing is
+    simulated in well under a second. The running session's control
+    signals are not touched; pass a TypingControl as signals to be able
+    to stop the simulation early (it then covers the keys so far).
+
+    Returns a dict with:
+    - seed: the seed used, so the same session can then be typed for real
+    - events: keys that would be pressed
+    - duration: total seconds, start delay included
+    - breakdown: seconds spent on the start delay, plain keys, typos and
+      thinking pauses
+    - wpm / net_wpm: the resulting gross and net typing speed
+    - timeline: the telemetry.TelemetryRecorder of the run (intended
+      times, codes and kinds of every key), None in burst mode
+    precise_timing is accepted for convenience and ignored; virtual
+    time has no drift to correct.
+    """
+    clock = VirtualClock()
+    if signals is None:
+        signals = TypingControl()
+    if sink is None:
+        sink = NullSink()
+    clock.sleep(delay)
+
+    if burst:
+        from .pipeline import normalize
+        chars = chunks = 0
+        for chunk in normalize(iter_text_chunks(text, chunk_size), None):
+            if chunks:
+                clock.sleep(chunk_gap)
+            sink.send_text(chunk)
+            chars += len(chunk)
+            chunks += 1
+        sink.flush()
+        return {
+            'seed': seed,
+            'events': chars,
+            'duration': clock.time(),
+            'breakdown': {'delay': delay, 'keys': clock.time() - delay,
+                          'typos': 0.0, 'pauses': 0.0},
+            'wpm': None,
+            'net_wpm': None,
+            'timeline': None,
+        }
+
+    skip = 0
+    if resume_from is not None:
+        seed = resume_from.seed
+        skip = resume_from.events
+    elif seed is None:
+        seed = random.randrange(2**32)
+    retype_from = config.get('retype_from')
+    if retype_from is not None and not isinstance(retype_from, str):
+        from .retype import typed_text
+        config['retype_from'] = typed_text(retype_from)
+
+    plans = iter_plan_chunks(text, seed=seed, **config)
+    events = islice(chain.from_iterable(plans), skip, None)
+    timeline = TelemetryRecorder()
+    play_plan(events, sink=sink, clock=clock, telemetry=timeline, signals=signals)
+
+    summary = timeline.summary()
+    breakdown = {'delay': delay}
+    breakdown.update(summary.get('time_spent', {'keys': 0.0, 'typos': 0.0, 'pauses': 0.0}))
+    return {
+        'seed': seed,
+        'events': len(timeline),
+        'duration': clock.time(),
+        'breakdown': breakdown,
+        'wpm': summary.get('gross_wpm'),
+        'net_wpm': summary.get('net_wpm'),
+        'timeline': timeline,
+    }
+
+def stop():
+    """Stop the running session and drop queued jobs (ESC)."""
+    from .jobs import job_queue
+    job_queue.cancel_all()
+    control.stop()
+
+def toggle_pause():
+    """Pause or resume the running session (F10)."""
+    control.toggle_pause()
+
+def start_typing_thread(resume=False, retype=False):
+    """
+    Queue a typing session with the current GUI config (F9 / Start).
+    Sessions run one at a time on the job queue's worker thread (see
+    jobs.py); an identical pending request is not queued twice.
+    With resume, continues from last_checkpoint when there is one;
+    with retype, only types the changes since last_session.
+    Returns the queued TypingJob, or None if the queue is full or the
+    settings are invalid.
     """
     from .gui import get_current_typing_config
-    config = get_current_typing_config()
-    # Start type_text in a new thread
-    t = threading.Thread(
-        target=type_text, 
-        kwargs=config,
-        daemon=True
-    )
-    t.start()
+    from .jobs import job_queue
+    try:
+        config = get_current_typing_config()
+    except ValueError as e:
+        print(f"Not starting, invalid settings: {e}")
+        return None
+    if resume and last_checkpoint is not None:
+        config['resume_from'] = last_checkpoint
+    elif retype and last_session is not None:
+        config['retype_from'] = last_session
+    return job_queue.submit(config)
+
+def run_job(**config):
+    """Run one queued session; reports burst throughput."""
+    stats = type_text(**config)
+    if stats:
+        print(f"Burst typed {stats['chars']} chars in {stats['seconds']:.2f}s "
+              f"({stats['chars_per_second']:.0f} chars/s)")
+    return stats
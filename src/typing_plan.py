@@ -0,0 +1,136 @@
+"""
+Compiles text and typing settings into a precomputed keystroke plan.
+Every random decision (speed changes, typos, thinking pauses, injected
+letters) is made here, through the stages in pipeline.py, before typing
+starts, so that playback only has to walk flat arrays and send keys.
+"""
+
+import random
+from array import array
+
+from .sources import iter_text_chunks
+
+# Key codes stored in a plan. Printable characters use their Unicode
+# code point; a few control code points stand in for special keys.
+BACKSPACE = 8
+TAB = 9
+ENTER = 10
+SPACE = 32
+# Keys with no character of their own use codes above the Unicode range
+SHIFT_TAB = 0x110000
+DELETE = 0x110001
+LEFT = 0x110002
+RIGHT = 0x110003
+UP = 0x110004
+HOME = 0x110005
+END = 0x110006
+
+# Event kinds stored in a plan: what the wait before a key was spent on
+KEY_EVENT = 0    # Ordinary typing
+TYPO_EVENT = 1   # Typing or correcting a typo
+PAUSE_EVENT = 2  # A thinking pause
+
+def wpm_to_cps(wpm):
+    """Convert Words Per Minute to Characters Per Second."""
+    # Average word length is considered 5 characters
+    return (wpm * 5) / 60
+
+def cps_to_wpm(cps):
+    """Convert Characters Per Second to Words Per Minute."""
+    return (cps * 60) / 5
+
+class TypingPlan:
+    """
+    Array-backed sequence of (key code, delay, kind) events.
+    delays[i] is the time in seconds to wait before pressing keys[i],
+    kinds[i] what that wait was spent on (KEY_EVENT, TYPO_EVENT or
+    PAUSE_EVENT). The seed the plan was compiled from is kept so a run
+    can be replayed.
+    """
+    __slots__ = ('keys', 'delays', 'kinds', 'seed')
+
+    def __init__(self, seed=None):
+        self.keys = array('I')
+        self.delays = array('d')
+        self.kinds = array('B')
+        self.seed = seed
+
+    def append(self, key, delay, kind=KEY_EVENT):
+        self.keys.append(key)
+        self.delays.append(delay)
+        self.kinds.append(kind)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return zip(self.keys, self.delays, self.kinds)
+
+    def __eq__(self, other):
+        if not isinstance(other, TypingPlan):
+            return NotImplemented
+        return (self.keys == other.keys and self.delays == other.delays
+                and self.kinds == other.kinds)
+
+    def total_duration(self):
+        """Total time spent waiting during playback, in seconds."""
+        return sum(self.delays)
+
+def iter_events(source, rng, stages=None, **settings):
+    """
+    Generate (key code, delay before key, kind) events for the given source.
+    The source is anything sources.iter_text_chunks accepts and is
+    planned lazily by the generator stages in pipeline.py, so memory
+    use does not grow with its size. stages replaces the default stage
+    list (see pipeline.default_stages) to add or swap transforms.
+    All randomness is drawn from rng, so the same seed yields the same events.
+
+    settings are the type_text humanization keywords: min_wpm, max_wpm,
+    thinking_enabled, min_pause, max_pause, pause_frequency,
+    typos_enabled, typo_chance, random_letters, timing (a
+    timing_model.TimingModel), layout, bigram_timing, typo_kinds and
+    editor (an editor.EditorProfile or profile name) and retype_from
+    (text already typed, see retype.py).
+    """
+    from .pipeline import PipelineContext, default_stages, run_pipeline
+    ctx = PipelineContext(rng, **settings)
+    if stages is None:
+        stages = default_stages()
+    return run_pipeline(iter_text_chunks(source), stages, ctx)
+
+def compile_plan(source, seed=None, **config):
+    """
+    Compile a text source and typing settings into a TypingPlan.
+    Accepts the same keyword settings as typing_engine.type_text.
+    A random seed is drawn and recorded when none is given.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    plan = TypingPlan(seed)
+    keys_append = plan.keys.append
+    delays_append = plan.delays.append
+    kinds_append = plan.kinds.append
+    for key, wait, kind in iter_events(source, random.Random(seed), **config):
+        keys_append(key)
+        delays_append(wait)
+        kinds_append(kind)
+    return plan
+
+def iter_plan_chunks(source, seed=None, chunk_events=4096, **config):
+    """
+    Compile a text source lazily into consecutive TypingPlans of at most
+    chunk_events events each. Concatenated, the chunks equal
+    compile_plan(source, seed, **config); only one chunk is held at a time.
+    """
+    if seed is None:
+        seed = random.randrange(2**32)
+    plan = TypingPlan(seed)
+    for key, wait, kind in iter_events(source, random.Random(seed), **config):
+        plan.keys.append(key)
+        plan.delays.append(wait)
+        plan.kinds.append(kind)
+        if len(plan.keys) >= chunk_events:
+            yield plan
+            plan = TypingPlan(seed)
+    if plan.keys:
+        yield plan
@@ -0,0 +1,151 @@
+"""
+Typo model with precomputed alias-method sampling tables.
+TypoEngine decides what kind of mistake to make at a character and
+which wrong keys get typed. Every distribution it samples from (error
+kind, typo length, neighbor key) is turned into an alias table once,
+so each decision costs a couple of random() calls and table lookups.
+"""
+
+import random
+from array import array
+
+from .layouts import get_layout
+
+# Error kinds
+SUBSTITUTION = 'substitution'    # Neighbor key(s) hit instead of the right one
+TRANSPOSITION = 'transposition'  # This and the next character swapped
+OMISSION = 'omission'            # This character skipped, the next one typed
+DOUBLING = 'doubling'            # This character typed twice
+SHIFT_SLIP = 'shift_slip'        # Shift pressed / released at the wrong time
+
+KINDS = (SUBSTITUTION, TRANSPOSITION, OMISSION, DOUBLING, SHIFT_SLIP)
+
+DEFAULT_KIND_WEIGHTS = {
+    SUBSTITUTION: 0.55,
+    TRANSPOSITION: 0.15,
+    OMISSION: 0.1,
+    DOUBLING: 0.1,
+    SHIFT_SLIP: 0.1,
+}
+
+# Lengths 1 to 5 of a run of wrong keys, mostly short
+LENGTH_WEIGHTS = (0.5, 0.25, 0.15, 0.07, 0.03)
+
+class AliasTable:
+    """
+    Walker/Vose alias table: samples index i with probability
+    weights[i] / sum(weights) using a single random() call.
+    """
+    __slots__ = ('n', 'prob', 'alias')
+
+    def __init__(self, weights):
+        n = len(weights)
+        if n == 0:
+            raise ValueError("AliasTable needs at least one weight")
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+        self.n = n
+        self.prob = array('d', [1.0] * n)
+        self.alias = array('I', range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def sample(self, u):
+        """Map a uniform random number u in [0, 1) to an index."""
+        u *= self.n
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+class TypoEngine:
+    """
+    Seedable typo generator for one keyboard layout.
+
+    decide(char, next_char) returns (kind, wrong): the error kind and
+    the wrong keys typed in place of char before the mistake is noticed
+    and erased. Neighbor keys are weighted by closeness; kinds that do
+    not apply (e.g. a shift slip on a key without a shifted level, or a
+    transposition at the end of a word) are excluded per character.
+    """
+
+    def __init__(self, layout='qwerty', kind_weights=None, seed=None, rng=None):
+        self.geometry = geometry = get_layout(layout)
+        self.kind_weights = dict(DEFAULT_KIND_WEIGHTS)
+        if kind_weights:
+            unknown = set(kind_weights) - set(KINDS)
+            if unknown:
+                raise ValueError(f"Unknown typo kinds: {sorted(unknown)}")
+            self.kind_weights.update(kind_weights)
+        self.rng = rng if rng is not None else random.Random(seed)
+        self._random = self.rng.random
+
+        self._lengths = AliasTable(LENGTH_WEIGHTS)
+
+        # Closer neighbors are more likely to be hit
+        self._neighbor_tables = {}
+        for char, neighbors in geometry.neighbors.items():
+            if neighbors:
+                weights = [1.0 / geometry.distance(char, other) for other in neighbors]
+                self._neighbor_tables[char] = (neighbors, AliasTable(weights))
+
+        # The same key at the other shift level
+        self._shift_partner = {}
+        for char, key in geometry.key_of.items():
+            low, up = geometry.levels[key]
+            partner = up if char == low else low
+            if partner != char:
+                self._shift_partner[char] = partner
+
+        # Per character: kind tables without / with a following character
+        self._kind_tables = {}
+
+    def _kinds_for(self, char):
+        tables = self._kind_tables.get(char)
+        if tables is None:
+            tables = []
+            for has_next in (False, True):
+                kinds = [
+                    kind for kind in KINDS
+                    if self.kind_weights[kind] > 0
+                    and (has_next or kind not in (TRANSPOSITION, OMISSION))
+                    and (kind != SHIFT_SLIP or char in self._shift_partner)
+                    and (kind != SUBSTITUTION or char in self._neighbor_tables)
+                ]
+                if not kinds:
+                    kinds = [DOUBLING]
+                weights = [self.kind_weights[kind] or 1.0 for kind in kinds]
+                tables.append((kinds, AliasTable(weights)))
+            tables = self._kind_tables[char] = tuple(tables)
+        return tables
+
+    def decide(self, char, next_char=''):
+        """Pick an error kind for char and return (kind, wrong keys typed)."""
+        random_ = self._random
+        tables = self._kind_tables.get(char) or self._kinds_for(char)
+        kinds, table = tables[1 if next_char else 0]
+        kind = kinds[table.sample(random_())]
+
+        if kind == SUBSTITUTION:
+            neighbors, neighbor_table = self._neighbor_tables[char]
+            length = self._lengths.sample(random_()) + 1
+            if length == 1:
+                wrong = neighbors[neighbor_table.sample(random_())]
+            else:
+                wrong = ''.join(neighbors[neighbor_table.sample(random_())]
+                                for _ in range(length))
+        elif kind == TRANSPOSITION:
+            wrong = next_char + char
+        elif kind == OMISSION:
+            wrong = next_char
+        elif kind == DOUBLING:
+            wrong = char + char
+        else:  # SHIFT_SLIP
+            wrong = self._shift_partner[char]
+        return kind, wrong
@@ -0,0 +1,17 @@
+import json
+import sys
+
+from benchmarks import bench_engine
+
+def test_bench_suite_runs_headless(tmp_path, capsys):
+    # Tiny sizes: this only checks that every benchmark runs (no pynput, no display)
+    output = tmp_path / 'results.json'
+    bench_engine.main(['--size', '2000', '--accuracy-seconds', '0.01', '--accuracy-wpm', '6000',
+                       '--memory-sizes', '0.01', '--output', str(output)])
+    results = json.loads(output.read_text())
+    assert set(results) >= {'planning', 'typos', 'overhead', 'hotkeys', 'accuracy', 'memory'}
+    assert results['typos']['typos'] > 0 and results['typos']['seconds'] > 0
+    assert results['overhead']['keys'] > 0
+    assert results['memory'][0]['keys'] > 0
+    assert 'pynput' not in sys.modules
+    assert 'results written to' in capsys.readouterr().out
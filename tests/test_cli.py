@@ -0,0 +1,26 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from src import cli
+from src.sinks import NullSink
+
+SETTINGS = {'text': "Hello there world", 'delay': 0, 'min_wpm': 6000, 'max_wpm': 6000,
+            'thinking_enabled': False, 'typos_enabled': False, 'seed': 2}
+
+def test_telemetry_is_opt_in():
+    config = cli.resolve_job(SETTINGS)
+    stats = cli.run_job(config, sink=NullSink())
+    assert 'telemetry' not in config
+    assert stats['keys'] == stats['resume_events'] == len(SETTINGS['text'])
+    assert 'jitter_ms_p50' not in stats
+
+    stats = cli.run_job(cli.resolve_job(SETTINGS), sink=NullSink(), telemetry=True)
+    assert stats['events'] == len(SETTINGS['text'])
+    assert 'jitter_ms_p50' in stats
+
+def test_import_does_not_load_numpy():
+    code = "import sys, src.cli; print('numpy' in sys.modules, 'tkinter' in sys.modules)"
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            check=True, cwd=Path(__file__).resolve().parent.parent).stdout
+    assert output.split() == ['False', 'False']
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from src.config import DEFAULT_PROFILE, TypingConfig, load_profiles, save_profiles
+
+@pytest.mark.parametrize('settings, name', [
+    ({'min_wpm': 80, 'max_wpm': 40}, 'max_wpm'),
+    ({'min_wpm': 0}, 'min_wpm'),
+    ({'min_wpm': 'fast'}, 'min_wpm'),
+    ({'delay': -1}, 'delay'),
+    ({'chunk_gap': -0.5}, 'chunk_gap'),
+    ({'min_pause': 2.0, 'max_pause': 1.0}, 'max_pause'),
+    ({'min_pause': -0.1}, 'min_pause'),
+    ({'pause_frequency': 0}, 'pause_frequency'),
+    ({'typo_chance': 1.5}, 'typo_chance'),
+    ({'typo_chance': float('nan')}, 'typo_chance'),
+    ({'editor': 'emacs'}, 'editor'),
+    ({'text': 42}, 'text'),
+])
+def test_invalid_settings_name_the_setting(settings, name):
+    with pytest.raises(ValueError, match=name):
+        TypingConfig(**settings)
+
+def test_entry_strings_are_converted():
+    config = TypingConfig(min_wpm='30', max_wpm='30', pause_frequency='7', delay='0')
+    assert (config.min_wpm, config.max_wpm, config.pause_frequency, config.delay) \
+        == (30.0, 30.0, 7, 0.0)
+
+def test_config_is_immutable():
+    config = TypingConfig()
+    with pytest.raises(AttributeError):
+        config.min_wpm = 10
+    changed = config.replace(min_wpm=10)
+    assert changed.min_wpm == 10 and config.min_wpm == 40
+    with pytest.raises(ValueError):
+        config.replace(max_wpm=10)
+
+def test_profiles_round_trip(tmp_path):
+    path = tmp_path / 'profiles.json'
+    profiles = {
+        DEFAULT_PROFILE: TypingConfig(),
+        'code': TypingConfig(min_wpm=60, max_wpm=90, typos_enabled=False, editor='vscode',
+                             burst=True, chunk_size=64, chunk_gap=0.01),
+    }
+    save_profiles(profiles, 'code', path)
+    assert not (tmp_path / 'profiles.json.tmp').exists()
+    loaded, last = load_profiles(path)
+    assert last == 'code'
+    assert loaded == profiles
+
+def test_load_profiles_skips_bad_entries(tmp_path, capsys):
+    path = tmp_path / 'profiles.json'
+    path.write_text(json.dumps({'last': 'bad', 'profiles': {
+        'bad': {'min_wpm': 90, 'max_wpm': 10},
+        'unknown': {'speed': 3},
+        'slow': {'min_wpm': 10, 'max_wpm': 20},
+    }}), encoding='utf-8')
+    loaded, last = load_profiles(path)
+    assert sorted(loaded) == [DEFAULT_PROFILE, 'slow']
+    assert last == DEFAULT_PROFILE
+    assert 'bad' in capsys.readouterr().out
+
+def test_missing_or_corrupt_profiles_give_the_default(tmp_path):
+    path = tmp_path / 'profiles.json'
+    assert load_profiles(path) == ({DEFAULT_PROFILE: TypingConfig()}, DEFAULT_PROFILE)
+    path.write_text('{not json', encoding='utf-8')
+    assert load_profiles(path) == ({DEFAULT_PROFILE: TypingConfig()}, DEFAULT_PROFILE)
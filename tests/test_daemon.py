@@ -0,0 +1,61 @@
+import json
+import os
+import socket
+import time
+
+import pytest
+
+from src import typing_engine
+from src.daemon import ControlServer, ControlClient, RPCError, AUTH_ERROR, read_token, write_token
+from src.jobs import TypingJobQueue
+from src.sinks import NullSink
+
+JOB = {'text': "hello world", 'delay': 0, 'min_wpm': 6000, 'max_wpm': 6000,
+       'thinking_enabled': False, 'typos_enabled': False}
+
+@pytest.fixture
+def server():
+    queue = TypingJobQueue(runner=lambda **config: typing_engine.type_text(sink=NullSink(), **config))
+    server = ControlServer(('127.0.0.1', 0), queue=queue, token='secret').start()
+    server.address = server._server.server_address
+    yield server
+    server.stop()
+    queue.shutdown()
+
+def test_token_file_is_owner_only(tmp_path):
+    path = str(tmp_path / 'token')
+    token = write_token(path)
+    assert read_token(path) == token and len(token) == 64
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+def test_tcp_connections_must_authenticate(server):
+    with socket.create_connection(server.address) as sock, sock.makefile('rwb') as f:
+        f.write(b'{"jsonrpc": "2.0", "id": 1, "method": "list"}\n')
+        f.flush()
+        assert json.loads(f.readline())['error']['code'] == AUTH_ERROR
+        assert f.readline() == b''  # Disconnected
+    with pytest.raises(RPCError):
+        ControlClient(server.address, token='wrong').call('list')
+    client = ControlClient(server.address, token='secret')
+    assert client.call('list') == []
+    client.close()
+
+def test_relative_paths_are_rejected(server):
+    client = ControlClient(server.address, token='secret')
+    for name in ('file', 'retype_from'):
+        with pytest.raises(RPCError, match='absolute'):
+            client.call('submit', config=dict(JOB, **{name: 'notes.txt'}))
+    client.close()
+
+def test_finished_job_keeps_only_the_summary(server):
+    client = ControlClient(server.address, token='secret')
+    job = client.call('submit', config=JOB)
+    stats = list(client.watch(job['id'], interval=0.05))[-1]
+    assert stats['events'] == len(JOB['text'])
+    entry = server._entries[job['id']]
+    deadline = time.monotonic() + 5
+    while entry.recorder is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert entry.recorder is None and 'telemetry' not in entry.job.config
+    assert client.call('stats', id=job['id'])['events'] == len(JOB['text'])
+    client.close()
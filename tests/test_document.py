@@ -0,0 +1,58 @@
+import threading
+import time
+
+from src import gui
+from src.control import TypingControl
+from src.document import Document, estimate
+from src.jobs import TypingJobQueue
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+def test_temporary_file_outlives_the_jobs_typing_it(monkeypatch):
+    started = threading.Event()
+    finish = threading.Event()
+
+    def runner(**config):
+        started.set()
+        finish.wait(5)
+
+    queue = TypingJobQueue(runner=runner)
+    monkeypatch.setattr(gui, 'job_queue', queue)
+    doc = Document.from_text("clipboard text " * 100)
+    running = queue.submit({'text': doc.path})
+    pending = queue.submit({'text': doc.path, 'seed': 1})
+    assert started.wait(5)
+
+    gui.release_document(doc)
+    assert doc.path.exists()
+    queue.cancel(running.id)  # Cancelled, but the runner has not returned yet
+    time.sleep(0.05)
+    assert doc.path.exists()
+    finish.set()
+    assert wait_for(lambda: not doc.path.exists())
+    assert pending.status == 'done'
+    queue.shutdown()
+
+def test_unused_temporary_file_is_deleted_at_once():
+    doc = Document.from_text("short")
+    gui.release_document(doc)
+    assert not doc.path.exists()
+
+def test_estimate_scales_a_sample_to_the_whole_text():
+    from src.typing_engine import simulate
+    text = "The quick brown fox jumps over the lazy dog.\n" * 400
+    full = simulate(text, seed=0)
+    sampled = estimate(text[:4000], len(text), seed=0)
+    assert sampled['timeline'] is None
+    assert abs(sampled['duration'] - full['duration']) / full['duration'] < 0.1
+    assert abs(sampled['events'] - full['events']) / full['events'] < 0.1
+
+def test_stopped_signals_end_a_simulation_early():
+    from src.typing_engine import simulate
+    signals = TypingControl()
+    signals.stop()
+    assert simulate("some text to estimate", seed=0, signals=signals)['events'] == 0
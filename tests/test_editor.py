@@ -0,0 +1,52 @@
+import pytest
+
+from src.editor import EditorModel, plan_keys
+
+SOURCE = '''\
+def main(args):
+    data = {
+        'items': [(1, 2), [3, [4, 5]]],
+        "name": f(g(h("x"))),
+    }
+
+    for item in data['items']:
+        if item:
+            print(item)  # it's fine
+            continue
+
+        pass
+    return data
+
+
+class Empty:
+    pass
+'''
+
+def replay(keys, profile):
+    model = EditorModel(profile)
+    for code in keys:
+        model.press(code)
+    return model.text()
+
+@pytest.mark.parametrize('profile', ['vscode', 'idle', 'plain'])
+def test_plan_reproduces_text(profile):
+    assert replay(plan_keys([SOURCE], profile), profile) == SOURCE
+
+@pytest.mark.parametrize('profile', ['vscode', 'idle', 'plain'])
+def test_plan_is_chunking_independent(profile):
+    chunks = [SOURCE[i:i + 7] for i in range(0, len(SOURCE), 7)]
+    assert list(plan_keys(chunks, profile)) == list(plan_keys([SOURCE], profile))
+
+@pytest.mark.parametrize('profile', ['vscode', 'idle'])
+def test_plan_saves_keystrokes(profile):
+    assert len(list(plan_keys([SOURCE], profile))) < len(SOURCE)
+
+def test_plain_profile_types_tabs():
+    text = 'if x:\n\tdo()\n\n\t\tnested\n'
+    keys = list(plan_keys([text], 'plain'))
+    assert replay(keys, 'plain') == text
+    assert len(keys) == len(text)
+
+def test_unproducible_text_raises():
+    with pytest.raises(ValueError):
+        list(plan_keys(['a\tb'], 'vscode'))
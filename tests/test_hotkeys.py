@@ -0,0 +1,99 @@
+import queue
+from types import SimpleNamespace
+
+import pytest
+
+from src.hotkeys import HotkeyRegistry, key_name, parse_chord, CTRL, SHIFT
+
+def special(name):
+    return SimpleNamespace(name=name)
+
+def char(c, vk=None):
+    return SimpleNamespace(name=None, char=c, vk=vk)
+
+CTRL_L = special('ctrl_l')
+SHIFT_R = special('shift_r')
+F9 = special('f9')
+F12 = special('f12')
+
+@pytest.fixture
+def registry():
+    """
+    A registry recording fired actions. fired() waits for the worker to
+    catch up; call it once per test, its F12 marker is debounced too.
+    """
+    fired = queue.SimpleQueue()
+    names = ('start', 'pause', 'save', 'sync')
+    actions = {name: (lambda name=name: fired.put(name)) for name in names}
+    bindings = {'f9': 'start', 'ctrl+1': 'pause', 'ctrl+shift+s': 'save', 'f12': 'sync'}
+    hotkeys = HotkeyRegistry(bindings, actions, repeat_interval=60.0)
+
+    def results():
+        # Actions run in order on the worker; 'sync' marks the end
+        hotkeys.on_press(F12)
+        hotkeys.on_release(F12)
+        names = []
+        while True:
+            name = fired.get(timeout=2.0)
+            if name == 'sync':
+                return names
+            names.append(name)
+    hotkeys.fired = results
+    return hotkeys
+
+def tap(hotkeys, *keys):
+    for key in keys:
+        hotkeys.on_press(key)
+    for key in reversed(keys):
+        hotkeys.on_release(key)
+
+def test_parse_chord():
+    assert parse_chord('Ctrl + Shift + F9') == (CTRL | SHIFT, 'f9')
+    assert parse_chord('control+1') == (CTRL, '1')
+    with pytest.raises(ValueError):
+        parse_chord('ctrl+shift')
+    with pytest.raises(ValueError):
+        parse_chord('a+b')
+
+def test_key_names():
+    assert key_name(F9) == 'f9'
+    assert key_name(char('S')) == 's'
+    assert key_name(char('\x13')) == 's'  # Ctrl+S as a control code
+    assert key_name(char(None, vk=49)) == '1'
+
+def test_repeated_press_fires_once(registry):
+    # Auto-repeat: presses without a release
+    for _ in range(5):
+        registry.on_press(F9)
+    registry.on_release(F9)
+    # Release/press pairs within repeat_interval
+    for _ in range(5):
+        tap(registry, F9)
+    assert registry.fired() == ['start']
+
+def test_repeat_interval_elapsed_fires_again(registry):
+    registry.repeat_interval = 0.0
+    tap(registry, F9)
+    tap(registry, F9)
+    assert registry.fired() == ['start', 'start']
+
+def test_chords_need_exactly_their_modifiers(registry):
+    tap(registry, char('1', vk=49))                 # No Ctrl
+    tap(registry, CTRL_L, SHIFT_R, char('1', vk=49))  # Extra Shift
+    tap(registry, CTRL_L, char(None, vk=49))        # Ctrl+1 without a char
+    assert registry.fired() == ['pause']
+
+def test_chords_match_control_codes(registry):
+    tap(registry, CTRL_L, char('\x13', vk=83))       # Ctrl+S, no Shift
+    tap(registry, CTRL_L, SHIFT_R, char('\x13', vk=83))
+    assert registry.fired() == ['save']
+
+def test_released_modifier_no_longer_counts(registry):
+    registry.on_press(CTRL_L)
+    registry.on_release(CTRL_L)
+    tap(registry, char('1', vk=49))
+    assert registry.fired() == []
+
+def test_unknown_action_is_rejected():
+    with pytest.raises(ValueError):
+        HotkeyRegistry({'f9': 'launch'}, {'start': lambda: None})
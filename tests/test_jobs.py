@@ -0,0 +1,42 @@
+import threading
+import time
+
+from src import typing_engine
+from src.jobs import TypingJobQueue, CANCELLED
+from src.sinks import NullSink
+
+def test_cancel_as_job_starts_is_not_lost(monkeypatch):
+    # Hold the job between being marked running and type_text starting,
+    # and cancel it right there
+    cancelled = threading.Event()
+    run_job = typing_engine.run_job
+
+    def delayed_run_job(**config):
+        cancelled.wait(2)
+        return run_job(**config)
+
+    monkeypatch.setattr(typing_engine, 'run_job', delayed_run_job)
+    queue = TypingJobQueue()
+    sink = NullSink()
+    job = queue.submit(dict(text="hello world", delay=0, sink=sink,
+                            min_wpm=600, max_wpm=800))
+    while job.status == 'pending':
+        time.sleep(0.001)
+    queue.cancel(job.id)
+    cancelled.set()
+    deadline = time.monotonic() + 5
+    while queue.list_jobs() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert job.status == CANCELLED
+    assert sink.count == 0
+    queue.shutdown()
+
+def test_failed_job_keeps_error():
+    def runner(**config):
+        raise RuntimeError("boom")
+    queue = TypingJobQueue(runner=runner)
+    job = queue.submit({'text': 'x'})
+    assert queue.wait(job, timeout=2)
+    assert job.status == 'failed'
+    assert str(job.error) == "boom"
+    queue.shutdown()
@@ -0,0 +1,78 @@
+import sys
+import types
+
+import pytest
+
+from src.keymap import resolve
+from src.typing_plan import SPACE
+
+@pytest.mark.parametrize('char, layout, taps', [
+    # AZERTY: ¨ is Shift + the ^ dead key, ^ is unshifted
+    ('ë', 'azerty', (('¨', True, True), ('e', False, False))),
+    ('¨', 'azerty', (('¨', True, True), (' ', False, False))),
+    ('ê', 'azerty', (('^', False, True), ('e', False, False))),
+    # QWERTZ: ` is Shift + the ´ dead key
+    ('è', 'qwertz', (('`', True, True), ('e', False, False))),
+    ('`', 'qwertz', (('`', True, True), (' ', False, False))),
+    ('é', 'qwertz', (('´', False, True), ('e', False, False))),
+    ('Ô', 'qwertz', (('^', False, True), ('o', True, False))),
+])
+def test_dead_key_sequences(char, layout, taps):
+    expected = tuple((ord(code), shifted, dead) for code, shifted, dead in taps)
+    assert resolve(ord(char), layout) == expected
+
+def test_plain_and_unknown_characters():
+    assert resolve(ord('A')) == ((ord('a'), True, False),)
+    assert resolve(SPACE, 'azerty') == ((SPACE, False, False),)
+    assert resolve(ord('ë')) is None  # QWERTY has no dead keys
+
+class FakeController:
+    def __init__(self):
+        self.calls = []
+
+    def press(self, key):
+        self.calls.append(('press', key))
+
+    def release(self, key):
+        self.calls.append(('release', key))
+
+@pytest.fixture
+def pynput_sink(monkeypatch):
+    """PynputSink over a stand-in pynput.keyboard, recording controller calls."""
+    class Key:
+        pass
+    for name in ('backspace', 'tab', 'enter', 'space', 'delete', 'left', 'right',
+                 'up', 'home', 'end', 'shift'):
+        setattr(Key, name, name)
+    class KeyCode:
+        from_char = staticmethod(lambda char: 'char ' + char)
+        from_dead = staticmethod(lambda char: 'dead ' + char)
+    keyboard = types.ModuleType('pynput.keyboard')
+    keyboard.Controller, keyboard.Key, keyboard.KeyCode = FakeController, Key, KeyCode
+    package = types.ModuleType('pynput')
+    package.keyboard = keyboard
+    monkeypatch.setitem(sys.modules, 'pynput', package)
+    monkeypatch.setitem(sys.modules, 'pynput.keyboard', keyboard)
+    from src.sinks import PynputSink
+    return lambda layout: PynputSink(layout=layout)
+
+def test_pynput_sink_sends_characters_as_is(pynput_sink):
+    # Symbols must come out as the OS layout types them, capitals in one tap
+    sink = pynput_sink('qwertz')
+    for char in 'A@ü':
+        sink.send(ord(char))
+    assert sink.controller.calls == [
+        ('press', 'char A'), ('release', 'char A'), ('press', 'char @'),
+        ('release', 'char @'), ('press', 'char ü'), ('release', 'char ü')]
+    assert sink._keys[ord('A')] == 'char A'  # Built once, then reused
+
+def test_pynput_sink_taps_dead_keys_for_missing_characters(pynput_sink):
+    sink = pynput_sink('azerty')
+    sink.send(ord('ë'))
+    assert sink.controller.calls == [
+        ('press', 'shift'), ('press', 'dead ¨'), ('release', 'dead ¨'),
+        ('release', 'shift'), ('press', 'char e'), ('release', 'char e')]
+    # Layout unknown: left to pynput
+    sink = pynput_sink(None)
+    sink.send(ord('ë'))
+    assert sink.controller.calls == [('press', 'char ë'), ('release', 'char ë')]
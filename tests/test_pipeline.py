@@ -0,0 +1,32 @@
+import pytest
+
+from src.pipeline import normalize
+from src.typing_plan import ENTER, compile_plan
+
+TEXT = 'Dear team,\r\nthe  build is green.\r\rOld mac line\rand a tab\there.\r\n'
+
+SETTINGS = [
+    {},
+    {'random_letters': True, 'typo_chance': 0.9, 'pause_frequency': 3},
+    {'typos_enabled': False, 'thinking_enabled': False},
+]
+
+def events(source, **settings):
+    return list(compile_plan(source, seed=1234, **settings))
+
+def test_normalize_handles_split_line_endings():
+    expected = TEXT.replace('\r\n', '\n').replace('\r', '\n')
+    for i in range(len(TEXT) + 1):
+        assert ''.join(normalize([TEXT[:i], TEXT[i:]], None)) == expected
+
+@pytest.mark.parametrize('settings', SETTINGS)
+def test_plan_does_not_depend_on_chunk_boundaries(settings):
+    whole = events(TEXT, **settings)
+    assert [key for key, _, _ in whole].count(13) == 0
+    for i in range(len(TEXT) + 1):
+        assert events([TEXT[:i], TEXT[i:]], **settings) == whole, i
+    assert events(list(TEXT), **settings) == whole
+
+def test_every_line_ending_is_one_line_break():
+    keys = [key for key, _, _ in events(TEXT, typos_enabled=False)]
+    assert keys.count(ENTER) == 2 * 5  # Enter is pressed twice per line break
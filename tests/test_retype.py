@@ -0,0 +1,33 @@
+import random
+
+from src.control import TypingCheckpoint
+from src.pipeline import render
+from src.retype import TextBuffer, typed_text
+from src.typing_plan import iter_events
+
+TEXT = "First  line with\trepeated   spaces.\r\nSecond line.\n\nThird, after a blank line.\n"
+
+def session(text, seed=3, **settings):
+    """The checkpoint of a finished normal-mode session typing text."""
+    events = sum(1 for _ in iter_events(text, random.Random(seed), **settings))
+    return TypingCheckpoint(seed, events, text, settings)
+
+def retype_keys(old, new, seed=5):
+    return [code for code, wait, kind in iter_events(new, random.Random(seed), retype_from=old)]
+
+def test_retyping_unchanged_text_sends_no_keys():
+    old = typed_text(session(TEXT))
+    assert old == ''.join(render([TEXT.replace('\r\n', '\n')]))
+    assert retype_keys(old, TEXT) == []
+    # Streamed in small chunks too
+    assert retype_keys(old, [TEXT[i:i + 7] for i in range(0, len(TEXT), 7)]) == []
+
+def test_retyping_edits_reach_the_normal_mode_rendering():
+    old = typed_text(session(TEXT))
+    new = TEXT.replace("Second", "Next").replace("blank", "empty") + "Fourth line.\n"
+    keys = retype_keys(old, new)
+    buffer = TextBuffer(old)
+    for code in keys:
+        buffer.press(code)
+    assert buffer.text() == ''.join(render([new]))
+    assert len(keys) < 60
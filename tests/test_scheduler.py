@@ -0,0 +1,57 @@
+import threading
+import time
+
+import pytest
+
+from src.control import TypingControl
+from src.scheduler import DeadlineScheduler
+
+class FakeClock:
+    """A clock whose sleeps overshoot, like real OS sleeps."""
+
+    def __init__(self, overshoot=0.003):
+        self.now = 100.0
+        self.overshoot = overshoot
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds + self.overshoot if seconds > 0 else 1e-5
+
+def test_deadlines_are_absolute():
+    clock = FakeClock()
+    scheduler = DeadlineScheduler(clock=clock.time, sleep=clock.sleep)
+    scheduler.start()
+    for i in range(1, 1001):
+        clock.now += 0.004  # Time spent sending the key
+        assert scheduler.wait(0.05) == 0.0
+        # Overshoot and send time never add up across keys
+        assert 0 <= clock.now - (100.0 + i * 0.05) < 0.005
+    assert scheduler.elapsed() == pytest.approx(50.0, abs=0.005)
+
+def test_late_keys_catch_up():
+    clock = FakeClock()
+    scheduler = DeadlineScheduler(clock=clock.time, sleep=clock.sleep)
+    scheduler.start()
+    clock.now += 0.25  # A slow key
+    assert scheduler.wait(0.1) == pytest.approx(0.15)
+    # The next deadlines stay on the original schedule
+    assert scheduler.wait(0.1) == pytest.approx(0.05)
+    assert scheduler.wait(0.1) == 0.0
+    assert clock.now - 100.3 < 0.005
+
+def test_stop_interrupts_long_wait():
+    control = TypingControl()
+    scheduler = DeadlineScheduler(clock=control.clock, sleep=control.sleep)
+    scheduler.start()
+    results = []
+    thread = threading.Thread(target=lambda: results.append(scheduler.wait(60.0)))
+    started = time.perf_counter()
+    thread.start()
+    time.sleep(0.05)
+    control.stop()
+    thread.join(2.0)
+    assert not thread.is_alive()
+    assert time.perf_counter() - started < 1.0
+    assert results == [0.0]
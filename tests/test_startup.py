@@ -0,0 +1,65 @@
+import json
+import os
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+from src import main
+
+@pytest.fixture
+def headless(monkeypatch):
+    """Stand-ins for pynput's Listener and the tkinter window, so main runs without a display."""
+    class Listener:
+        def __init__(self, on_press, on_release, daemon):
+            self.on_press = on_press
+
+        def start(self):
+            pass
+
+        def wait(self):
+            pass
+
+    keyboard = types.ModuleType('pynput.keyboard')
+    keyboard.Listener = Listener
+    package = types.ModuleType('pynput')
+    package.keyboard = keyboard
+    monkeypatch.setitem(sys.modules, 'pynput', package)
+    monkeypatch.setitem(sys.modules, 'pynput.keyboard', keyboard)
+
+    gui = types.ModuleType('src.gui')
+    gui.root = types.SimpleNamespace(update=lambda: None, destroy=lambda: None)
+    gui.build_gui = lambda: None
+    monkeypatch.setitem(sys.modules, 'src.gui', gui)
+    yield
+    # keyboard_utils was imported against the stand-in pynput
+    sys.modules.pop('src.keyboard_utils', None)
+
+def test_startup_report_within_budget(headless, capsys):
+    with pytest.raises(SystemExit) as exited:
+        main.main(['--startup-report', '--budget', '0.5', '--json'])
+    report = json.loads(capsys.readouterr().out)
+    assert exited.value.code == 0
+    assert report['milestones']['hotkeys live'] < 0.5
+    assert report['milestones']['hotkeys live'] < report['milestones']['window ready']
+    assert [step['name'] for step in report['steps']][:2] == ['import keyboard_utils',
+                                                               'start hotkey listener']
+
+def _can_run_gui():
+    if not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+        return False
+    try:
+        import pynput  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+@pytest.mark.skipif(not _can_run_gui(), reason="needs a display and pynput")
+def test_startup_report_in_a_fresh_process():
+    result = subprocess.run(
+        [sys.executable, '-m', 'src.main', '--startup-report', '--budget', '0.5', '--json'],
+        capture_output=True, text=True, cwd=Path(__file__).resolve().parent.parent)
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout)['milestones']['hotkeys live'] < 0.5
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+
+from src import timing_model
+from src.timing_model import TimingModel
+
+BACKENDS = [False, pytest.param(True, marks=pytest.mark.skipif(
+    timing_model.np is None, reason="NumPy is not installed"))]
+
+@pytest.mark.parametrize('use_numpy', BACKENDS)
+@pytest.mark.parametrize('distribution', timing_model.DISTRIBUTIONS)
+@pytest.mark.parametrize('pause_frequency', [1, 7, 50])
+def test_seed_repeats_within_a_backend(use_numpy, distribution, pause_frequency):
+    model = TimingModel(use_numpy=use_numpy, distribution=distribution,
+                        pause_frequency=pause_frequency)
+    delays, pauses = model.sample(3000, 1234)
+    assert (delays, pauses) == model.sample(3000, 1234)
+    assert len(delays) == len(pauses) == 3000
+    assert (delays, pauses) != model.sample(3000, 1235)
+
+@pytest.mark.skipif(timing_model.np is None, reason="NumPy is not installed")
+def test_numpy_sampling_is_vectorized():
+    # About 0.1 s for a million keys; per-key Python work would take over a second
+    model = TimingModel(use_numpy=True)
+    model.sample(1000, 0)
+    started = time.perf_counter()
+    model.sample(1_000_000, 1)
+    assert time.perf_counter() - started < 0.5
+
+def test_seed_repeats_and_pauses_are_in_range():
+    model = TimingModel(use_numpy=False, min_pause=0.5, max_pause=2.0, pause_frequency=10)
+    delays, pauses = model.sample(2000, 5)
+    assert (delays, pauses) == model.sample(2000, 5)
+    assert len(delays) == len(pauses) == 2000
+    placed = [p for p in pauses if p]
+    assert placed and all(0.5 <= p <= 2.0 for p in placed)
+
+@pytest.mark.parametrize('settings', [
+    {'pause_frequency': 0},
+    {'min_wpm': 0},
+    {'min_wpm': 90, 'max_wpm': 80},
+    {'sigma': -0.1},
+    {'regime_min': 0},
+    {'regime_min': 40, 'regime_max': 15},
+    {'min_pause': 3.0, 'max_pause': 2.0},
+    {'distribution': 'gaussian'},
+])
+def test_invalid_settings_raise_value_error(settings):
+    with pytest.raises(ValueError):
+        TimingModel(**settings)
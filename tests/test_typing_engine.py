@@ -0,0 +1,20 @@
+import pytest
+
+from src.sinks import RecordingSink
+from src.typing_engine import burst_type, simulate
+
+TEXT = 'first\r\nsecond\rthird\r\n\r\nlast\r'
+EXPECTED = 'first\nsecond\nthird\n\nlast\n'
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 6, 7, 256])
+def test_burst_type_normalizes_line_endings(chunk_size):
+    sink = RecordingSink()
+    stats = burst_type(TEXT, chunk_size=chunk_size, delay=0, sink=sink)
+    assert ''.join(map(chr, sink.codes)) == EXPECTED
+    assert stats['chars'] == len(EXPECTED)
+
+def test_simulated_burst_normalizes_line_endings():
+    sink = RecordingSink()
+    result = simulate(TEXT, delay=0, sink=sink, burst=True, chunk_size=7, chunk_gap=0.5)
+    assert ''.join(map(chr, sink.codes)) == EXPECTED
+    assert result['events'] == len(EXPECTED)
@@ -0,0 +1,57 @@
+from collections import Counter
+
+import pytest
+
+from src.typo_model import (
+    AliasTable, TypoEngine, DEFAULT_KIND_WEIGHTS, KINDS, LENGTH_WEIGHTS,
+    SUBSTITUTION, TRANSPOSITION, OMISSION, DOUBLING, SHIFT_SLIP,
+)
+
+DRAWS = 50_000
+
+def test_alias_table_follows_its_weights():
+    weights = [5, 1, 0, 3, 1]
+    table = AliasTable(weights)
+    # Evenly spread u values: the exact share each index gets
+    counts = Counter(table.sample((i + 0.5) / DRAWS) for i in range(DRAWS))
+    for index, weight in enumerate(weights):
+        assert counts[index] / DRAWS == pytest.approx(weight / sum(weights), abs=1e-3)
+
+def test_decide_kinds_follow_the_weights():
+    # 's' has neighbors, a shifted level and a next character: every kind applies
+    engine = TypoEngine(seed=7)
+    counts = Counter(engine.decide('s', 'e')[0] for _ in range(DRAWS))
+    total = sum(DEFAULT_KIND_WEIGHTS.values())
+    for kind in KINDS:
+        assert counts[kind] / DRAWS == pytest.approx(DEFAULT_KIND_WEIGHTS[kind] / total, abs=0.01)
+
+def test_substitution_lengths_follow_the_weights():
+    engine = TypoEngine(seed=3, kind_weights={kind: 0 for kind in KINDS if kind != SUBSTITUTION})
+    lengths = Counter()
+    for _ in range(DRAWS):
+        kind, wrong = engine.decide('g', 'o')
+        assert kind == SUBSTITUTION
+        assert set(wrong) <= set(engine.geometry.neighbors['g'])
+        lengths[len(wrong)] += 1
+    for length, weight in enumerate(LENGTH_WEIGHTS, 1):
+        assert lengths[length] / DRAWS == pytest.approx(weight / sum(LENGTH_WEIGHTS), abs=0.01)
+
+def test_kinds_that_do_not_apply_are_excluded():
+    engine = TypoEngine(seed=1)
+    kinds = {engine.decide('s')[0] for _ in range(2000)}
+    assert TRANSPOSITION not in kinds and OMISSION not in kinds  # No next character
+    assert {DOUBLING, SHIFT_SLIP, SUBSTITUTION} <= kinds
+    assert engine.decide('x', 'y')[1] != ''
+    assert TypoEngine(seed=1, kind_weights={DOUBLING: 0, SUBSTITUTION: 0, SHIFT_SLIP: 0,
+                                            TRANSPOSITION: 1}).decide('a', 'b') == (TRANSPOSITION, 'ba')
+
+def test_seeded_decisions_repeat():
+    text = "reproducible typos"
+
+    def run(seed):
+        engine = TypoEngine(seed=seed)
+        return [engine.decide(c, n) for c, n in zip(text, text[1:] + ' ') if c != ' ']
+
+    assert run(42) == run(42)
+    engine, other = TypoEngine(seed=42), TypoEngine(seed=43)
+    assert [engine.decide('t', 'h') for _ in range(50)] != [other.decide('t', 'h') for _ in range(50)]